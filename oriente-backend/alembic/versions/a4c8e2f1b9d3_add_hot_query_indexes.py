@@ -0,0 +1,43 @@
+"""add composite indexes for hot queries
+
+Revision ID: a4c8e2f1b9d3
+Revises: def987654321, e7a1234b5678
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f1b9d3'
+down_revision: Union[str, Sequence[str], None] = ('def987654321', 'e7a1234b5678')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nome, tabela, colunas) - mesmos índices declarados nos models
+INDEXES = [
+    ('ix_cards_project_id_status_created_at', 'cards', ['project_id', 'status', 'created_at']),
+    ('ix_cards_column_id_position', 'cards', ['column_id', 'position']),
+    ('ix_card_histories_project_id_created_at', 'card_histories', ['project_id', 'created_at']),
+    ('ix_card_histories_card_id_created_at', 'card_histories', ['card_id', 'created_at']),
+    ('ix_card_assignees_user_id', 'card_assignees', ['user_id']),
+    ('ix_chat_messages_chat_id_created_at', 'chat_messages', ['chat_id', 'created_at']),
+    (
+        'ix_notifications_recipient_is_read_created_at',
+        'notifications',
+        ['recipient_user_id', 'is_read', 'created_at'],
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,29 @@
+"""add projects.board_version
+
+Revision ID: b5e1d7a3c902
+Revises: a4c8e2f1b9d3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1d7a3c902'
+down_revision: Union[str, None] = 'a4c8e2f1b9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'projects',
+        sa.Column('board_version', sa.Integer(), nullable=False, server_default='0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'board_version')
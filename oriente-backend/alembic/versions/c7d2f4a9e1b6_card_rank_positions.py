@@ -0,0 +1,110 @@
+"""replace cards.position with fractional rank keys
+
+Revision ID: c7d2f4a9e1b6
+Revises: b5e1d7a3c902
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from itertools import groupby
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2f4a9e1b6'
+down_revision: Union[str, None] = 'b5e1d7a3c902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mesmo alfabeto de app/core/lexorank.py (copiado: a migração não depende do código da app)
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(ALPHABET)
+
+cards = sa.table(
+    'cards',
+    sa.column('id', sa.Integer),
+    sa.column('column_id', sa.Integer),
+    sa.column('position', sa.Integer),
+    sa.column('rank', sa.String),
+)
+
+
+def _spread_ranks(count: int) -> List[str]:
+    """count chaves igualmente espaçadas, em ordem (ver lexorank.rebalanced_ranks)"""
+    width = 1
+    while BASE ** width < (count + 1) * BASE:
+        width += 1
+    step = BASE ** width // (count + 1)
+
+    ranks = []
+    for index in range(1, count + 1):
+        value = step * index
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, BASE)
+            digits.append(ALPHABET[remainder])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
+
+
+def _rank_type(bind) -> sa.String:
+    # Comparação byte a byte no PostgreSQL, igual à do SQLite
+    if bind.dialect.name == 'postgresql':
+        return sa.String(255, collation='C')
+    return sa.String(255)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.add_column('cards', sa.Column('rank', _rank_type(bind), nullable=True))
+
+    # Converte a ordem atual (position, id) de cada coluna em ranks espaçadas
+    rows = bind.execute(
+        sa.select(cards.c.id, cards.c.column_id).order_by(cards.c.column_id, cards.c.position, cards.c.id)
+    ).all()
+    params = []
+    for _, column_rows in groupby(rows, key=lambda row: row.column_id):
+        card_ids = [row.id for row in column_rows]
+        params.extend(
+            {'card_id': card_id, 'new_rank': rank}
+            for card_id, rank in zip(card_ids, _spread_ranks(len(card_ids)))
+        )
+    if params:
+        bind.execute(
+            cards.update().where(cards.c.id == sa.bindparam('card_id')).values(rank=sa.bindparam('new_rank')),
+            params
+        )
+
+    op.drop_index('ix_cards_column_id_position', table_name='cards')
+    with op.batch_alter_table('cards') as batch_op:
+        batch_op.alter_column('rank', existing_type=_rank_type(bind), nullable=False, server_default='i')
+        batch_op.drop_column('position')
+    op.create_index('ix_cards_column_id_rank', 'cards', ['column_id', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    op.add_column('cards', sa.Column('position', sa.Integer(), nullable=False, server_default='0'))
+
+    rows = bind.execute(
+        sa.select(cards.c.id, cards.c.column_id).order_by(cards.c.column_id, cards.c.rank, cards.c.id)
+    ).all()
+    params = []
+    for _, column_rows in groupby(rows, key=lambda row: row.column_id):
+        params.extend(
+            {'card_id': row.id, 'new_position': index}
+            for index, row in enumerate(column_rows)
+        )
+    if params:
+        bind.execute(
+            cards.update().where(cards.c.id == sa.bindparam('card_id')).values(position=sa.bindparam('new_position')),
+            params
+        )
+
+    op.drop_index('ix_cards_column_id_rank', table_name='cards')
+    with op.batch_alter_table('cards') as batch_op:
+        batch_op.drop_column('rank')
+    op.create_index('ix_cards_column_id_position', 'cards', ['column_id', 'position'], unique=False)
@@ -0,0 +1,39 @@
+"""add board_changes log for incremental board sync
+
+Revision ID: d3f8b6a2c4e7
+Revises: c7d2f4a9e1b6
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f8b6a2c4e7'
+down_revision: Union[str, None] = 'c7d2f4a9e1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sem backfill: versões anteriores não estão no log e recebem full_reload
+    op.create_table(
+        'board_changes',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(length=10), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=True),
+        sa.Column('deleted', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_board_changes_project_id_version', 'board_changes', ['project_id', 'version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_board_changes_project_id_version', table_name='board_changes')
+    op.drop_table('board_changes')
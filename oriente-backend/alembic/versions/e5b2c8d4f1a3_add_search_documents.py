@@ -0,0 +1,112 @@
+"""add search_documents full-text index
+
+Revision ID: e5b2c8d4f1a3
+Revises: d3f8b6a2c4e7
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c8d4f1a3'
+down_revision: Union[str, None] = 'd3f8b6a2c4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mesmo índice textual declarado em app/models/search_document.py
+POSTGRES_DDL = [
+    """
+    ALTER TABLE search_documents ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_search_documents_search_vector ON search_documents USING GIN (search_vector)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE search_documents_fts USING fts5(
+        title, content,
+        content='search_documents', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN
+        INSERT INTO search_documents_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO search_documents_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+# Documentos dos registros já existentes
+BACKFILL = [
+    """
+    INSERT INTO search_documents (kind, ref_id, project_id, card_id, chat_id, title, content)
+    SELECT 'card', id, project_id, id, NULL, title, description FROM cards
+    """,
+    """
+    INSERT INTO search_documents (kind, ref_id, project_id, card_id, chat_id, title, content)
+    SELECT 'comment', comments.id, cards.project_id, comments.card_id, NULL, NULL, comments.content
+    FROM comments JOIN cards ON cards.id = comments.card_id
+    """,
+    """
+    INSERT INTO search_documents (kind, ref_id, project_id, card_id, chat_id, title, content)
+    SELECT 'message', id, NULL, NULL, chat_id, NULL, content FROM chat_messages
+    """,
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'search_documents',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('kind', sa.String(length=10), nullable=False),
+        sa.Column('ref_id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=True),
+        sa.Column('card_id', sa.Integer(), nullable=True),
+        sa.Column('chat_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.String(length=200), nullable=True),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['card_id'], ['cards.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['chat_id'], ['chats.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'ref_id', name='uq_search_documents_kind_ref_id')
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for statement in POSTGRES_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+
+    for statement in BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS search_documents_fts")
+    op.drop_table('search_documents')
@@ -0,0 +1,31 @@
+"""add users.token_version / users.tokens_revoked_at
+
+Revision ID: f2a6c1d8e4b9
+Revises: e5b2c8d4f1a3
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c1d8e4b9'
+down_revision: Union[str, None] = 'e5b2c8d4f1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('token_version', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column('users', sa.Column('tokens_revoked_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'tokens_revoked_at')
+    op.drop_column('users', 'token_version')
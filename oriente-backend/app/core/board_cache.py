@@ -0,0 +1,101 @@
+"""
+Cache em memória dos boards já serializados (GET /{project_id}/board)
+
+Cada entrada guarda o JSON pronto (bytes) do board de um projeto junto com o
+projects.board_version com que foi montado. Uma leitura só é servida do
+cache quando a versão atual do projeto é a mesma da entrada: qualquer
+criação, alteração, movimentação ou remoção de cards/colunas incrementa a
+versão (ver app/core/board_version.py), então não há como servir um board
+desatualizado, mesmo com vários workers.
+
+O cache é por processo, com tamanho máximo (LRU). Ao incrementar a versão
+de um projeto, a entrada dele é descartada neste worker; nos demais ela só
+deixa de casar com a versão e é substituída na próxima leitura.
+
+Renomear um usuário não altera a versão dos boards: o nome antigo do
+responsável pode aparecer até a próxima alteração do board.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.config import settings
+
+
+class BoardCache:
+    """Cache LRU (project_id -> versão, bytes), seguro para uso entre threads"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, project_id: int, version: int) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                if entry is not None:
+                    self.stale += 1
+                return None
+
+            self._entries.move_to_end(project_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, project_id: int, version: int, body: bytes) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            current = self._entries.get(project_id)
+            # Não substitui um snapshot mais novo montado por outra requisição
+            if current is not None and current[0] > version:
+                return
+            self._entries[project_id] = (version, body)
+            self._entries.move_to_end(project_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, project_ids: Iterable[int]) -> None:
+        with self._lock:
+            for project_id in project_ids:
+                if self._entries.pop(project_id, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "bytes": sum(len(body) for _, body in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Instância global usada por GET /{project_id}/board
+board_cache = BoardCache(max_size=settings.BOARD_CACHE_MAX_SIZE)
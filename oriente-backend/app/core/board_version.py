@@ -0,0 +1,140 @@
+"""
+Marcador de alterações do board por projeto (projects.board_version)
+
+Todo flush que cria, altera ou remove cards ou colunas de um projeto
+incrementa projects.board_version na mesma transação. A leitura é um SELECT
+pela PK, então serve de base barata para ETags e caches do board, e vale
+entre workers (fica no banco).
+
+Cada incremento também grava em board_changes quais cards/colunas mudaram
+naquela versão (log curto usado por GET /{project_id}/board/changes).
+
+Alterações feitas com UPDATE em massa (query.update / update()) não passam
+pelo flush: nesses casos chamar bump_board_version explicitamente, com as
+alterações feitas (sem elas, o log manda o cliente recarregar o board).
+
+Ao incrementar, o snapshot do board em cache neste worker é descartado
+(ver app/core/board_cache.py).
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.board_cache import board_cache
+from app.core.config import settings
+from app.models.board_change import BoardChange
+from app.models.Card import Card
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+
+_PENDING_KEY = "board_version_pending"
+
+# Alteração do log: (project_id, entidade, id ou None, removido)
+BoardChangeEntry = Tuple[int, str, Optional[int], bool]
+
+# Poda do log a cada N versões do projeto
+_PRUNE_EVERY = 100
+
+
+def bump_board_version(
+        db: Session,
+        project_ids: Iterable[int],
+        changes: Optional[Iterable[BoardChangeEntry]] = None
+) -> Dict[int, int]:
+    """
+    Incrementa o marcador dos projetos (na transação corrente) e registra as
+    alterações no log. Retorna {project_id: nova versão}.
+    """
+    ids = sorted(set(project_ids))
+    if not ids:
+        return {}
+
+    projects = Project.__table__
+    versions = dict(db.connection().execute(
+        update(projects)
+        .where(projects.c.id.in_(ids))
+        # updated_at mantido: o onupdate do Project só vale para edições do próprio projeto
+        .values(board_version=projects.c.board_version + 1, updated_at=projects.c.updated_at)
+        .returning(projects.c.id, projects.c.board_version)
+    ).all())
+    board_cache.invalidate(ids)
+
+    if changes is None:
+        changes = [(project_id, "board", None, False) for project_id in ids]
+    _log_changes(db, versions, changes)
+    return versions
+
+
+def _log_changes(db: Session, versions: Dict[int, int], changes: Iterable[BoardChangeEntry]) -> None:
+    rows = [
+        {"project_id": project_id, "version": versions[project_id],
+         "entity": entity, "entity_id": entity_id, "deleted": deleted}
+        for project_id, entity, entity_id, deleted in sorted(
+            set(changes), key=lambda change: (change[0], change[1], change[2] or 0)
+        )
+        # Projetos removidos neste mesmo flush não voltam do UPDATE
+        if project_id in versions
+    ]
+    if not rows:
+        return
+
+    connection = db.connection()
+    connection.execute(insert(BoardChange.__table__), rows)
+
+    log = BoardChange.__table__
+    for project_id, version in versions.items():
+        if version % _PRUNE_EVERY == 0:
+            connection.execute(
+                delete(log).where(
+                    log.c.project_id == project_id,
+                    log.c.version <= version - settings.BOARD_CHANGES_RETENTION
+                )
+            )
+
+
+def get_board_version(db: Session, project_id: int) -> Optional[int]:
+    """Marcador atual do projeto (None se o projeto não existe)"""
+    return db.execute(
+        select(Project.board_version).where(Project.id == project_id)
+    ).scalar_one_or_none()
+
+
+def _entity(obj) -> str:
+    return "card" if isinstance(obj, Card) else "column"
+
+
+def _collect_changed(session: Session) -> List[tuple]:
+    """
+    (project_id, entidade, objeto, removido) dos cards/colunas do flush
+    O id dos objetos novos só existe depois do flush: é lido em _bump_changed_boards
+    """
+    changed = []
+    for obj in session.new:
+        if isinstance(obj, (Card, KanbanColumn)) and obj.project_id is not None:
+            changed.append((obj.project_id, _entity(obj), obj, False))
+    for obj in session.deleted:
+        if isinstance(obj, (Card, KanbanColumn)):
+            changed.append((obj.project_id, _entity(obj), obj, True))
+    for obj in session.dirty:
+        if isinstance(obj, (Card, KanbanColumn)) and session.is_modified(obj):
+            changed.append((obj.project_id, _entity(obj), obj, False))
+    return changed
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_board_changes(session, flush_context, instances):
+    # Antes do flush os objetos removidos ainda têm os atributos carregados
+    changed = _collect_changed(session)
+    if changed:
+        session.info.setdefault(_PENDING_KEY, []).extend(changed)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_changed_boards(session, flush_context):
+    changed = session.info.pop(_PENDING_KEY, None)
+    if changed:
+        changes: Set[BoardChangeEntry] = {
+            (project_id, entity, obj.id, deleted) for project_id, entity, obj, deleted in changed
+        }
+        bump_board_version(session, {project_id for project_id, _, _, _ in changed}, changes)
@@ -0,0 +1,143 @@
+"""
+Cache em memória das colunas de cada projeto
+
+Guarda, por projeto, a ordem e os títulos das colunas, usados a cada
+movimentação de tarefa entre colunas (nome da coluna de origem no histórico).
+Essas informações só mudam quando colunas são criadas, renomeadas, movidas
+ou removidas.
+
+O cache é por processo, com tamanho máximo (LRU) e expiração por TTL.
+Alterações feitas pelo ColumnService invalidam a entrada no worker que as
+executou; nos demais, a entrada expira em até COLUMN_CACHE_TTL_SECONDS.
+Uma coluna que não está na entrada (criada em outro worker) força a releitura.
+Por isso o cache só serve dados de exibição: a coluna de conclusão (que define
+completed_at) é sempre lida do banco, junto com a coluna de destino do move.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.Column import KanbanColumn
+
+
+@dataclass(frozen=True)
+class ProjectColumns:
+    """Colunas de um projeto, em ordem de posição (desempate por ID)"""
+    project_id: int
+    ids: Tuple[int, ...]
+    titles: Dict[int, str]
+
+    def has_columns(self, column_ids: Iterable[int]) -> bool:
+        return all(column_id in self.titles for column_id in column_ids)
+
+
+class ColumnCache:
+    """Cache LRU com TTL (project_id -> ProjectColumns), seguro para uso entre threads"""
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, project_id: int) -> Optional[ProjectColumns]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            columns, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[project_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(project_id)
+            self.hits += 1
+            return columns
+
+    def set(self, columns: ProjectColumns) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[columns.project_id] = (columns, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(columns.project_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, project_id: int) -> None:
+        with self._lock:
+            if self._entries.pop(project_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Instância global usada por CardService/ColumnService
+column_cache = ColumnCache(
+    max_size=settings.COLUMN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.COLUMN_CACHE_TTL_SECONDS
+)
+
+
+def get_project_columns(db: Session, project_id: int, required_ids: Iterable[int] = ()) -> ProjectColumns:
+    """
+    Colunas do projeto, do cache ou do banco (uma consulta)
+
+    required_ids: colunas que precisam estar na entrada; se alguma faltar,
+    a entrada está desatualizada e é relida do banco.
+    """
+    required_ids = tuple(required_ids)
+    columns = column_cache.get(project_id)
+    if columns is not None and columns.has_columns(required_ids):
+        return columns
+
+    rows = db.execute(
+        select(KanbanColumn.id, KanbanColumn.title)
+        .where(KanbanColumn.project_id == project_id)
+        .order_by(KanbanColumn.position, KanbanColumn.id)
+    ).all()
+    columns = ProjectColumns(
+        project_id=project_id,
+        ids=tuple(column_id for column_id, _ in rows),
+        titles={column_id: title for column_id, title in rows}
+    )
+    column_cache.set(columns)
+    return columns
@@ -1,7 +1,34 @@
+import logging
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .pool_stats import instrumented_async_queue_pool, instrumented_queue_pool
+from .query_stats import install_query_hooks
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_options(url: str, pool_class) -> dict:
+    """
+    Opções de pool lidas do Settings
+    Em SQLite mantém o pool padrão do dialeto (sem limite de tamanho)
+    """
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if not url.startswith("sqlite"):
+        options.update({
+            "poolclass": pool_class,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+        })
+    return options
+
 
 # Criar engine do SQLAlchemy
 # Para SQLite, precisamos adicionar check_same_thread=False
@@ -9,12 +36,63 @@ connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith(
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Equivalente ao spring.jpa.show-sql=true
-    connect_args=connect_args
+    connect_args=connect_args,
+    **_pool_options(settings.DATABASE_URL, instrumented_queue_pool("PrimaryQueuePool"))
 )
 
+install_query_hooks(engine)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engine da réplica de leitura (opcional)
+read_engine = None
+ReadSessionLocal = None
+if settings.DATABASE_READ_URL:
+    read_connect_args = {"check_same_thread": False} if settings.DATABASE_READ_URL.startswith("sqlite") else {}
+    read_engine = create_engine(
+        settings.DATABASE_READ_URL,
+        echo=settings.DEBUG,
+        connect_args=read_connect_args,
+        **_pool_options(settings.DATABASE_READ_URL, instrumented_queue_pool("ReplicaQueuePool"))
+    )
+    install_query_hooks(read_engine)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+
+def _to_async_url(url: str) -> str:
+    """
+    Converte a URL síncrona para o driver assíncrono equivalente
+    (postgresql -> asyncpg, sqlite -> aiosqlite)
+    """
+    if url.startswith("postgresql+psycopg2://"):
+        return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+# Engine assíncrono (usado pelos handlers WebSocket para não bloquear o event loop)
+async_engine = create_async_engine(
+    _to_async_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    **_pool_options(settings.DATABASE_URL, instrumented_async_queue_pool("PrimaryAsyncQueuePool"))
+)
+install_query_hooks(async_engine.sync_engine)
+
+# Session factory assíncrona
+# expire_on_commit=False: objetos continuam legíveis após o commit sem novo SELECT
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base para os models
 Base = declarative_base()
 
@@ -28,3 +106,40 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Dependency para rotas somente leitura (relatórios, board, listagens)
+
+    Usa a réplica configurada em DATABASE_READ_URL. Se não houver réplica,
+    ou se ela estiver inacessível, cai para o banco primário.
+    Os dados podem estar levemente atrasados em relação ao primário.
+    """
+    if ReadSessionLocal is None:
+        yield from get_db()
+        return
+
+    db = ReadSessionLocal()
+    try:
+        # Abre a conexão já aqui para detectar réplica fora do ar antes da rota
+        db.connection()
+    except OperationalError:
+        db.close()
+        logger.warning("Réplica de leitura indisponível, usando o banco primário")
+        yield from get_db()
+        return
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    Dependency para obter sessão assíncrona do banco de dados
+    Usar em handlers `async def` para não bloquear o event loop
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
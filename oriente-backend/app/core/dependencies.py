@@ -1,20 +1,26 @@
+import hmac
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+from .config import settings
 from .database import get_db
 from .security import decode_access_token
-from app.models.user import User, UserStatus
+from .token_revocation import token_revocations
+from .user_cache import AuthenticatedUser, user_cache
+from app.models.user import User, UserRole, UserStatus
 
 # Security scheme para JWT Bearer token
 security = HTTPBearer()
 
 
-def get_current_user_id(
+def get_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> int:
+) -> dict:
     """
-    Extrai e valida o user_id do token JWT
+    Decodifica e valida o token JWT (assinatura, expiração e subject)
     Equivalente a: JwtAuthenticationFilter.doFilterInternal()
 
     Raises:
@@ -38,35 +44,87 @@ def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return int(user_id)
+    return payload
+
+
+def get_current_user_id(payload: dict = Depends(get_token_payload)) -> int:
+    """
+    Extrai o user_id do token JWT
+    """
+    return int(payload["sub"])
+
+
+def _user_from_claims(payload: dict) -> Optional[AuthenticatedUser]:
+    """
+    Monta o usuário a partir das claims do access token (modo AUTH_STATELESS)
+    Retorna None para tokens sem as claims necessárias (ex.: emitidos antes do modo)
+    """
+    try:
+        return AuthenticatedUser(
+            id=int(payload["sub"]),
+            name=payload["name"],
+            email=payload["email"],
+            role=UserRole(payload["role"]),
+            status=UserStatus(payload["status"])
+        )
+    except (KeyError, ValueError):
+        return None
 
 
 def get_current_user(
-    user_id: int = Depends(get_current_user_id),
+    payload: dict = Depends(get_token_payload),
     db: Session = Depends(get_db)
-) -> User:
+) -> AuthenticatedUser:
     """
-    Obtém o usuário autenticado completo do banco de dados
+    Obtém o usuário autenticado (id, name, email, role, status)
+
+    Com AUTH_STATELESS, usa as claims do token e o conjunto de revogação em
+    memória, sem consultar o banco. Caso contrário, consulta o cache em
+    memória antes do banco. O resultado é um snapshot imutável, não um
+    objeto ORM.
 
     Args:
-        user_id: ID do usuário extraído do token
+        payload: Claims do token JWT
         db: Sessão do banco de dados
 
     Returns:
-        User: Instância do usuário autenticado
+        AuthenticatedUser: Dados do usuário autenticado
 
     Raises:
         HTTPException: 404 se usuário não encontrado
-        HTTPException: 401 se usuário inativo
+        HTTPException: 401 se usuário inativo ou token revogado
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user_id = int(payload["sub"])
+
+    if settings.AUTH_STATELESS:
+        user = _user_from_claims(payload)
+        if user is not None:
+            if token_revocations.is_revoked(user_id, payload.get("ver")):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token revogado - renove a sessão",
+                    headers={"WWW-Authenticate": "Bearer"}
+                )
+            _ensure_active(user)
+            return user
+
+    user = user_cache.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Usuário não encontrado"
-        )
+        db_user = db.query(User).filter(User.id == user_id).first()
+        if db_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuário não encontrado"
+            )
+        user = AuthenticatedUser.from_user(db_user)
+        user_cache.set(user)
+
+    _ensure_active(user)
+    return user
 
-    # Verificar se usuário está ativo
+
+def _ensure_active(user: AuthenticatedUser) -> None:
+    """Rejeita usuários desativados"""
     if user.status != UserStatus.ACTIVE:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,7 +132,39 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    return user
+
+def get_current_admin(current_user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
+    """
+    Exige que o usuário autenticado seja ADMIN
+
+    Raises:
+        HTTPException: 403 se o usuário não for administrador
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Apenas administradores podem acessar este recurso"
+        )
+
+    return current_user
+
+
+def require_metrics_access(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> None:
+    """
+    Protege GET /metrics: aceita o METRICS_TOKEN (scraper) ou o JWT de um administrador
+
+    Raises:
+        HTTPException: 401 se o token for inválido, 403 se o usuário não for administrador
+    """
+    if settings.METRICS_TOKEN and hmac.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        return
+
+    get_current_admin(get_current_user(get_token_payload(credentials), db))
 
 
 # Dependency opcional para rotas públicas que podem ter usuário autenticado
@@ -104,3 +194,42 @@ def get_current_user_optional(
         return user
     except:
         return None
+
+
+async def get_current_user_ws(token: str, db: AsyncSession) -> AuthenticatedUser:
+    """
+    Autenticação para handlers WebSocket (token passado como query parameter)
+    Usa sessão assíncrona para não bloquear o event loop
+    Com AUTH_STATELESS, usa as claims do token sem consultar o banco
+
+    Raises:
+        Exception: se token inválido ou usuário não encontrado
+    """
+    try:
+        payload = decode_access_token(token)
+        if not payload:
+            raise Exception("Token inválido")
+
+        user_id = payload.get("sub")
+
+        if not user_id:
+            raise Exception("Token inválido")
+
+        if settings.AUTH_STATELESS:
+            claims_user = _user_from_claims(payload)
+            if claims_user is not None:
+                if token_revocations.is_revoked(claims_user.id, payload.get("ver")):
+                    raise Exception("Token revogado")
+                if claims_user.status != UserStatus.ACTIVE:
+                    raise Exception("Conta desativada")
+                return claims_user
+
+        user = await db.get(User, int(user_id))
+
+        if not user:
+            raise Exception("Usuário não encontrado")
+
+        return AuthenticatedUser.from_user(user)
+
+    except Exception as e:
+        raise Exception(f"Falha na autenticação: {str(e)}")
@@ -0,0 +1,70 @@
+"""
+GET condicional (ETag / If-None-Match -> 304 Not Modified)
+
+As rotas calculam um ETag forte a partir de um marcador barato (por exemplo
+projects.board_version) antes de montar a resposta. Se o cliente já tem essa
+versão, a rota devolve 304 sem consultar nem serializar o payload.
+
+O CompressionMiddleware acrescenta o encoding ao ETag das respostas
+comprimidas ("abc" -> "abc-gzip"), pois cada representação precisa de um
+ETag forte próprio. Na comparação o sufixo é ignorado.
+"""
+import hashlib
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Sufixos adicionados pelo CompressionMiddleware (ver app/core/compression.py)
+ENCODING_SUFFIXES = ("-gzip", "-br")
+
+# Sempre revalidar (no-cache); resposta depende do usuário autenticado (private)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """ETag forte a partir das partes que identificam a representação"""
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _strip_encoding(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(f'{suffix}"'):
+            return tag[:-len(suffix) - 1] + '"'
+    return tag
+
+
+def matching_etag(request: Request, etag: str) -> Optional[str]:
+    """
+    Tag enviada em If-None-Match que corresponde ao ETag atual (ou None)
+    Devolve a tag como o cliente enviou, para ser repetida no 304
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    if header.strip() == "*":
+        return etag
+    for tag in header.split(","):
+        if _strip_encoding(tag) == etag:
+            return tag.strip()
+    return None
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Resposta 304 se o cliente já tem a versão atual; None caso contrário"""
+    tag = matching_etag(request, etag)
+    if tag is None:
+        return None
+    return Response(status_code=304, headers=cache_headers(tag))
@@ -0,0 +1,107 @@
+"""
+Chaves de ordenação fracionárias (estilo lexorank) para os cards
+
+Cada card guarda uma chave texto (cards.rank) e a ordem na coluna é a ordem
+lexicográfica das chaves. Para inserir entre dois cards basta gerar uma chave
+entre as dos vizinhos: um único UPDATE/INSERT, sem deslocar os demais.
+
+As chaves são frações em base 36 ("i" = 0.5, "i8" = 0.5 + 8/36², ...) escritas
+só com dígitos e letras minúsculas, que ordenam igual em qualquer collation
+comum. Nunca terminam em "0", então sempre existe uma chave entre duas outras.
+
+Inserções repetidas no mesmo ponto fazem as chaves crescerem; acima de
+CARD_RANK_REBALANCE_LENGTH caracteres a coluna é redistribuída em segundo
+plano com chaves curtas e igualmente espaçadas (rebalanced_ranks).
+"""
+from typing import List, Optional
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(ALPHABET)
+
+# Chave do primeiro card de uma coluna vazia
+MIDDLE = ALPHABET[BASE // 2]
+
+
+def _digit(char: str) -> int:
+    return ALPHABET.index(char)
+
+
+def _midpoint(lower: str, upper: Optional[str]) -> str:
+    """Chave entre lower ("" = início) e upper (None = fim), com lower < upper"""
+    if upper is not None:
+        # Prefixo comum: a chave nova começa igual
+        common = 0
+        while common < len(upper) and (lower[common] if common < len(lower) else "0") == upper[common]:
+            common += 1
+        if common > 0:
+            return upper[:common] + _midpoint(lower[common:], upper[common:])
+
+    digit_lower = _digit(lower[0]) if lower else 0
+    digit_upper = _digit(upper[0]) if upper is not None else BASE
+    if digit_upper - digit_lower > 1:
+        return ALPHABET[(digit_lower + digit_upper + 1) // 2]
+
+    # Dígitos consecutivos: desce uma casa
+    if upper is not None and len(upper) > 1:
+        return upper[0]
+    return ALPHABET[digit_lower] + _midpoint(lower[1:], None)
+
+
+def _after(key: str) -> str:
+    """Chave curta logo depois de key (inserção no fim da coluna)"""
+    if not key:
+        return MIDDLE
+    digit = _digit(key[0])
+    if digit < BASE - 1:
+        return ALPHABET[digit + 1]
+    return key[0] + _after(key[1:])
+
+
+def _before(key: str) -> str:
+    """Chave curta logo antes de key (inserção no início da coluna)"""
+    digit = _digit(key[0])
+    if digit > 1:
+        return ALPHABET[digit - 1]
+    if digit == 1:
+        return "0" + ALPHABET[-1]
+    return "0" + _before(key[1:])
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Chave estritamente entre before e after
+
+    - before=None: início da coluna; after=None: fim da coluna
+    - Com ambos None (coluna vazia) retorna MIDDLE
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Chaves fora de ordem: {before!r} >= {after!r}")
+    if after is None:
+        return _after(before or "")
+    if before is None:
+        return _before(after)
+    return _midpoint(before, after)
+
+
+def rebalanced_ranks(count: int) -> List[str]:
+    """
+    count chaves curtas, igualmente espaçadas e em ordem
+
+    Deixa folga nas pontas e entre as chaves para inserções futuras.
+    """
+    if count <= 0:
+        return []
+    width = 1
+    while BASE ** width < (count + 1) * BASE:
+        width += 1
+    step = BASE ** width // (count + 1)
+
+    ranks = []
+    for index in range(1, count + 1):
+        value = step * index
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, BASE)
+            digits.append(ALPHABET[remainder])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
@@ -0,0 +1,219 @@
+"""
+Métricas no formato texto do Prometheus (sem dependências externas)
+
+- Histograma de latência por método, template de rota e status
+- Gauge de requisições em andamento
+- Conexões WebSocket e estatísticas dos pools de conexão (coletadas no scrape)
+
+Os valores são por processo: cada worker do gunicorn expõe os seus.
+"""
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.pool_stats import pool_status
+from app.core.query_stats import route_template
+
+# Buckets em segundos (mesmos padrões do client oficial)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Requisições que não casaram com nenhuma rota (evita cardinalidade ilimitada por path)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _Histogram:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+                break
+
+
+class RequestMetrics:
+    """Latência e requisições em andamento (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str, str], _Histogram] = {}
+        self.in_flight = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finish(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, str(status))
+        with self._lock:
+            self.in_flight -= 1
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = _Histogram()
+            histogram.observe(seconds)
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP http_request_duration_seconds Latência das requisições HTTP",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            snapshot = [
+                (key, list(h.buckets), h.sum, h.count)
+                for key, h in sorted(self._latency.items())
+            ]
+            in_flight = self.in_flight
+
+        for (method, route, status), buckets, total, count in snapshot:
+            labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, buckets):
+                cumulative += bucket_count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+        lines += [
+            "# HELP http_requests_in_flight Requisições HTTP em andamento",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+        ]
+        return lines
+
+
+request_metrics = RequestMetrics()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mede a latência de cada requisição HTTP
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+        request_metrics.start()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_metrics.finish(
+                scope.get("method", ""),
+                route_template(scope) or UNMATCHED_ROUTE,
+                status_code,
+                time.perf_counter() - start
+            )
+
+
+def _websocket_lines(ws_managers: Dict[str, object]) -> List[str]:
+    lines = [
+        "# HELP websocket_connections Conexões WebSocket abertas",
+        "# TYPE websocket_connections gauge",
+    ]
+    rooms = [
+        "# HELP websocket_rooms Chats/projetos com ao menos uma conexão WebSocket",
+        "# TYPE websocket_rooms gauge",
+    ]
+    for channel, manager in ws_managers.items():
+        # Cópia rápida: o dict é alterado pelo event loop
+        connections = list(manager.active_connections.values())
+        lines.append(f'websocket_connections{{channel="{channel}"}} {sum(len(c) for c in connections)}')
+        rooms.append(f'websocket_rooms{{channel="{channel}"}} {len(connections)}')
+    return lines + rooms
+
+
+_POOL_GAUGES = (
+    ("db_pool_size", "size", "Tamanho configurado do pool"),
+    ("db_pool_checked_out", "checked_out", "Conexões em uso"),
+    ("db_pool_checked_in", "checked_in", "Conexões ociosas no pool"),
+    ("db_pool_overflow", "overflow", "Conexões abertas além do pool_size"),
+)
+_POOL_COUNTERS = (
+    ("db_pool_checkouts_total", "checkouts", "Checkouts de conexão"),
+    ("db_pool_timeouts_total", "timeouts", "Checkouts que estouraram o pool_timeout"),
+)
+
+
+def _pool_lines(engines: Dict[str, object]) -> List[str]:
+    statuses = {name: pool_status(engine.pool) for name, engine in engines.items()}
+    lines: List[str] = []
+
+    for metric, field, help_text in _POOL_GAUGES:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+        lines += [f'{metric}{{engine="{name}"}} {data[field]}' for name, data in statuses.items() if field in data]
+
+    for metric, field, help_text in _POOL_COUNTERS:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        lines += [f'{metric}{{engine="{name}"}} {data[field]}' for name, data in statuses.items() if field in data]
+
+    lines += [
+        "# HELP db_pool_wait_seconds_total Tempo total aguardando conexão livre",
+        "# TYPE db_pool_wait_seconds_total counter",
+    ]
+    lines += [
+        f'db_pool_wait_seconds_total{{engine="{name}"}} {data["wait_total_ms"] / 1000:.6f}'
+        for name, data in statuses.items() if "wait_total_ms" in data
+    ]
+    return lines
+
+
+def _cache_lines(caches: Dict[str, Dict]) -> List[str]:
+    lines = [
+        "# HELP cache_hits_total Acertos dos caches em memória",
+        "# TYPE cache_hits_total counter",
+    ]
+    lines += [f'cache_hits_total{{cache="{name}"}} {stats["hits"]}' for name, stats in caches.items()]
+    lines += [
+        "# HELP cache_misses_total Faltas dos caches em memória",
+        "# TYPE cache_misses_total counter",
+    ]
+    lines += [f'cache_misses_total{{cache="{name}"}} {stats["misses"]}' for name, stats in caches.items()]
+    return lines
+
+
+def render_metrics(
+    ws_managers: Dict[str, object],
+    engines: Dict[str, object],
+    caches: Optional[Dict[str, Dict]] = None
+) -> str:
+    """
+    Gera o texto do /metrics
+    Custo proporcional ao número de séries (rotas x status), sem I/O
+    """
+    lines: List[str] = [
+        "# HELP oriente_worker_info Processo que respondeu o scrape",
+        "# TYPE oriente_worker_info gauge",
+        f'oriente_worker_info{{pid="{os.getpid()}"}} 1',
+    ]
+    lines += request_metrics.render()
+    lines += _websocket_lines(ws_managers)
+    lines += _pool_lines(engines)
+    if caches:
+        lines += _cache_lines(caches)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,100 @@
+"""
+Métricas do pool de conexões do SQLAlchemy
+
+Os pools instrumentados medem quanto tempo cada checkout esperou por uma
+conexão livre e quantos checkouts estouraram o DB_POOL_TIMEOUT.
+Os números são por processo (cada worker do gunicorn tem os seus).
+"""
+import threading
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolStats:
+    """Contadores acumulados de espera e timeout de um pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+
+    def record_checkout(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_seconds += waited
+            if waited > self.wait_max_seconds:
+                self.wait_max_seconds = waited
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.wait_total_seconds / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total_seconds * 1000, 3),
+                "wait_avg_ms": round(avg * 1000, 3),
+                "wait_max_ms": round(self.wait_max_seconds * 1000, 3),
+            }
+
+
+def _instrumented(base: Type[QueuePool], name: str) -> Type[QueuePool]:
+    """
+    Cria uma subclasse do pool com seus próprios contadores
+    (a classe sobrevive a engine.dispose(), que recria o pool com a mesma classe)
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = base._do_get(self)
+        except exc.TimeoutError:
+            self.stats.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record_checkout(time.perf_counter() - start)
+        return conn
+
+    return type(name, (base,), {"stats": PoolStats(), "_do_get": _do_get})
+
+
+def instrumented_queue_pool(name: str) -> Type[QueuePool]:
+    """Pool síncrono (psycopg2) instrumentado"""
+    return _instrumented(QueuePool, name)
+
+
+def instrumented_async_queue_pool(name: str) -> Type[QueuePool]:
+    """Pool assíncrono (asyncpg) instrumentado"""
+    return _instrumented(AsyncAdaptedQueuePool, name)
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """
+    Estado atual de um pool: conexões em uso, ociosas, overflow e
+    contadores de espera quando o pool é instrumentado
+    """
+    data: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        data.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+        })
+    else:
+        # SQLite usa pools sem limite (SingletonThreadPool/NullPool/StaticPool)
+        data["status"] = pool.status()
+
+    stats = getattr(pool, "stats", None)
+    if isinstance(stats, PoolStats):
+        data.update(stats.snapshot())
+
+    return data
@@ -0,0 +1,184 @@
+"""
+Instrumentação de SQL por requisição
+
+- Conta statements e tempo total de banco de cada requisição HTTP
+  (hooks de evento do SQLAlchemy + ContextVar por requisição)
+- Em DEBUG devolve os números nos headers X-DB-Queries / X-DB-Time-ms;
+  em produção registra uma linha de log estruturada (JSON) por requisição
+- Statements acima de SLOW_QUERY_THRESHOLD_MS são logados com o SQL
+  normalizado e a rota que os executou
+"""
+import json
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.db")
+
+
+class RequestQueryStats:
+    """Contadores de uma requisição (mutável: compartilhado com o threadpool)"""
+
+    __slots__ = ("scope", "queries", "db_seconds")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.db_seconds * 1000, 2)
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def get_request_stats() -> Optional[RequestQueryStats]:
+    """Estatísticas da requisição em andamento (None fora de requisições HTTP)"""
+    return _current_stats.get()
+
+
+# === Rota da requisição ===
+
+_route_paths: Dict[Any, str] = {}
+
+
+def route_template(scope: Optional[dict]) -> Optional[str]:
+    """
+    Template da rota que atendeu a requisição (ex.: /api/projects/{project_id}/cards)
+    Disponível depois que o router resolveu o endpoint
+    """
+    if not scope:
+        return None
+
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return None
+
+    path = _route_paths.get(endpoint)
+    if path is None:
+        app = scope.get("app")
+        for route in getattr(app, "routes", []):
+            if getattr(route, "endpoint", None) is endpoint:
+                path = route.path
+                break
+        else:
+            path = scope.get("path", "")
+        _route_paths[endpoint] = path
+
+    return path
+
+
+def _route_label(scope: Optional[dict]) -> Optional[str]:
+    template = route_template(scope)
+    if template is None:
+        return None
+    return f"{scope.get('method', 'WS')} {template}"
+
+
+# === Normalização de SQL ===
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normaliza o SQL para agrupar statements iguais:
+    literais e placeholders viram '?', listas IN viram '(...)'
+    """
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return sql
+
+
+# === Hooks do SQLAlchemy ===
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS
+    if threshold > 0 and elapsed * 1000 >= threshold:
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 2),
+            "route": _route_label(stats.scope) if stats else None,
+            "sql": normalize_sql(statement),
+        }, ensure_ascii=False))
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Registra os hooks de contagem/tempo no engine (síncrono ou engine.sync_engine)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# === Middleware ===
+
+class QueryStatsMiddleware:
+    """
+    Middleware ASGI que abre o contexto de contagem de cada requisição HTTP
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(scope)
+        token = _current_stats.set(stats)
+        status_code = 500
+
+        async def send_with_headers(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.DEBUG:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(stats.queries).encode()))
+                    headers.append((b"x-db-time-ms", str(stats.db_time_ms).encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            if not settings.DEBUG and stats.queries:
+                logger.info(json.dumps({
+                    "event": "request_db",
+                    "method": scope.get("method"),
+                    "route": route_template(scope) or scope.get("path"),
+                    "status": status_code,
+                    "queries": stats.queries,
+                    "db_time_ms": stats.db_time_ms,
+                }, ensure_ascii=False))
@@ -0,0 +1,30 @@
+"""
+Resposta JSON padrão da API, serializada com orjson
+
+- Usada como default_response_class do app (ver main.py)
+- Listas grandes (cards, mensagens de chat, notificações) montam dicts direto
+  das linhas ORM e retornam ORJSONResponse, sem passar pela validação do
+  response_model; o formato do JSON é o mesmo gerado pelo Pydantic
+  (datetimes ISO 8601, UTC como "Z", enums pelo valor)
+"""
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Tipos que o orjson não serializa nativamente"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Tipo não serializável em JSON: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_OPTIONS)
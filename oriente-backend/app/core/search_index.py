@@ -0,0 +1,123 @@
+"""
+Manutenção do índice de busca (search_documents) na escrita
+
+Todo flush que cria, altera (título/descrição/conteúdo) ou remove cards,
+comentários ou mensagens de chat atualiza search_documents na mesma
+transação. Os índices textuais do banco (tsvector no PostgreSQL, FTS5 no
+SQLite) acompanham a tabela sozinhos (ver app/models/search_document.py).
+
+Alterações feitas com UPDATE/DELETE em massa não passam pelo flush; hoje
+nenhuma mexe em campos indexados.
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.Card import Card
+from app.models.chat_message import ChatMessage
+from app.models.comment import Comment
+from app.models.search_document import SearchDocument
+
+_PENDING_KEY = "search_index_pending"
+
+# Tipo do documento e campos indexados de cada model
+_INDEXED = {
+    Card: ("card", ("title", "description")),
+    Comment: ("comment", ("content",)),
+    ChatMessage: ("message", ("content",)),
+}
+
+
+def _indexed(obj):
+    return _INDEXED.get(type(obj))
+
+
+def _text_changed(obj, fields) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_search_changes(session, flush_context, instances):
+    upserts = []
+    deletions = []
+    for obj in session.new:
+        if _indexed(obj):
+            upserts.append(obj)
+    for obj in session.dirty:
+        indexed = _indexed(obj)
+        if indexed and session.is_modified(obj) and _text_changed(obj, indexed[1]):
+            upserts.append(obj)
+    for obj in session.deleted:
+        indexed = _indexed(obj)
+        if indexed:
+            deletions.append((indexed[0], obj.id))
+
+    if upserts or deletions:
+        pending = session.info.setdefault(_PENDING_KEY, {"upserts": [], "deletions": []})
+        pending["upserts"].extend(upserts)
+        pending["deletions"].extend(deletions)
+
+
+@event.listens_for(Session, "after_flush")
+def _update_search_documents(session, flush_context):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    connection = session.connection()
+    rows = _document_rows(connection, pending["upserts"])
+
+    # Remove os documentos antigos (alterados e removidos) e grava os novos
+    stale: Dict[str, set] = defaultdict(set)
+    for kind, ref_id in pending["deletions"]:
+        stale[kind].add(ref_id)
+    for row in rows:
+        stale[row["kind"]].add(row["ref_id"])
+
+    documents = SearchDocument.__table__
+    for kind, ref_ids in stale.items():
+        connection.execute(
+            delete(documents).where(documents.c.kind == kind, documents.c.ref_id.in_(ref_ids))
+        )
+
+    # Comentários de cards removidos (o cascade do banco não passa pelo flush)
+    deleted_cards = [ref_id for kind, ref_id in pending["deletions"] if kind == "card"]
+    if deleted_cards:
+        connection.execute(delete(documents).where(documents.c.card_id.in_(deleted_cards)))
+
+    if rows:
+        connection.execute(insert(documents), rows)
+
+
+def _document_rows(connection, objects) -> List[dict]:
+    """Linhas de search_documents dos objetos (o id dos novos já existe após o flush)"""
+    unique = {(type(obj), obj.id): obj for obj in objects}.values()
+
+    comment_cards = {obj.card_id for obj in unique if isinstance(obj, Comment)}
+    card_projects = {}
+    if comment_cards:
+        card_projects = dict(connection.execute(
+            select(Card.id, Card.project_id).where(Card.id.in_(comment_cards))
+        ).all())
+
+    rows = []
+    for obj in unique:
+        if isinstance(obj, Card):
+            rows.append({
+                "kind": "card", "ref_id": obj.id, "project_id": obj.project_id, "card_id": obj.id,
+                "chat_id": None, "title": obj.title, "content": obj.description
+            })
+        elif isinstance(obj, Comment):
+            rows.append({
+                "kind": "comment", "ref_id": obj.id, "project_id": card_projects.get(obj.card_id),
+                "card_id": obj.card_id, "chat_id": None, "title": None, "content": obj.content
+            })
+        else:
+            rows.append({
+                "kind": "message", "ref_id": obj.id, "project_id": None, "card_id": None,
+                "chat_id": obj.chat_id, "title": None, "content": obj.content
+            })
+    return rows
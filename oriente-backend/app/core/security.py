@@ -1,18 +1,26 @@
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 import jwt
 from .config import settings
 
+# Pool dedicado e limitado para o bcrypt (CPU intensivo, ~100 ms por operação)
+# Mantém o event loop e o threadpool das rotas livres durante picos de login
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
 
 def hash_password(password: str) -> str:
     """
-    Gera hash BCrypt da senha
+    Gera hash BCrypt da senha com custo BCRYPT_ROUNDS
     Equivalente a: passwordEncoder.encode()
     """
     # Truncar senha se for muito longa (bcrypt tem limite de 72 bytes)
     password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -28,21 +36,72 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
-def create_access_token(user_id: int, email: str, name: str, role: str) -> str:
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Verifica se o hash foi gerado com custo diferente de BCRYPT_ROUNDS
+    Formato: $2b$<custo>$<salt+hash>
+    """
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
+def hash_password_pooled(password: str) -> str:
+    """
+    hash_password executado no pool dedicado
+    Chamado por rotas síncronas (threadpool do FastAPI): o event loop não
+    bloqueia e o número de hashes simultâneos fica limitado a PASSWORD_HASH_WORKERS
+    """
+    return _password_executor.submit(hash_password, password).result()
+
+
+def verify_password_pooled(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password executado no pool dedicado (ver hash_password_pooled)
+    """
+    return _password_executor.submit(verify_password, plain_password, hashed_password).result()
+
+
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+
+def create_access_token(
+    user_id: int,
+    email: str,
+    name: str,
+    role: str,
+    status: Optional[str] = None,
+    token_version: Optional[int] = None
+) -> str:
     """
     Gera token JWT
     Equivalente a: JwtTokenProvider.generateToken()
+
+    Com AUTH_STATELESS o token vale JWT_ACCESS_TOKEN_MINUTES e carrega o
+    status e a token_version do usuário, permitindo autenticar sem consultar
+    o banco (a versão é comparada com o conjunto de revogação).
     """
-    expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
+    if settings.AUTH_STATELESS:
+        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_ACCESS_TOKEN_MINUTES)
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
 
     to_encode = {
         "sub": str(user_id),  # subject: userId
+        "type": ACCESS_TOKEN_TYPE,
         "email": email,
         "name": name,
         "role": role,
         "iat": datetime.utcnow(),  # issued at
         "exp": expire  # expiration
     }
+    if status is not None:
+        to_encode["status"] = status
+    if token_version is not None:
+        to_encode["ver"] = token_version
 
     encoded_jwt = jwt.encode(
         to_encode,
@@ -53,18 +112,35 @@ def create_access_token(user_id: int, email: str, name: str, role: str) -> str:
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[dict]:
+def create_refresh_token(user_id: int) -> str:
     """
-    Decodifica e valida token JWT
-    Equivalente a: JwtTokenProvider.validateToken() + getUserIdFromToken()
+    Gera refresh token (modo AUTH_STATELESS)
+    Só serve para obter um novo access token em POST /api/auth/refresh
     """
+    expire = datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_DAYS)
+
+    to_encode = {
+        "sub": str(user_id),
+        "type": REFRESH_TOKEN_TYPE,
+        "iat": datetime.utcnow(),
+        "exp": expire
+    }
+
+    return jwt.encode(
+        to_encode,
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM
+    )
+
+
+def _decode_token(token: str) -> Optional[dict]:
+    """Decodifica e valida assinatura/expiração de um JWT"""
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token,
             settings.JWT_SECRET,
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.DecodeError:
@@ -75,6 +151,28 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+def decode_access_token(token: str) -> Optional[dict]:
+    """
+    Decodifica e valida token JWT
+    Equivalente a: JwtTokenProvider.validateToken() + getUserIdFromToken()
+    Refresh tokens não são aceitos como access token
+    """
+    payload = _decode_token(token)
+    if payload is None or payload.get("type", ACCESS_TOKEN_TYPE) != ACCESS_TOKEN_TYPE:
+        return None
+    return payload
+
+
+def decode_refresh_token(token: str) -> Optional[dict]:
+    """
+    Decodifica e valida refresh token
+    """
+    payload = _decode_token(token)
+    if payload is None or payload.get("type") != REFRESH_TOKEN_TYPE:
+        return None
+    return payload
+
+
 def get_user_id_from_token(token: str) -> Optional[int]:
     """
     Extrai o user_id do token
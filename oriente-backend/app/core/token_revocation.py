@@ -0,0 +1,111 @@
+"""
+Conjunto de revogação para o modo de autenticação stateless (AUTH_STATELESS)
+
+No modo stateless o access token carrega role/status e a rota não consulta
+o banco. Para que desativações e trocas de role/senha tenham efeito antes
+do token expirar, cada usuário tem uma token_version (claim "ver"), que só é
+incrementada nessas alterações, e este módulo mantém em memória um mapa pequeno:
+
+    user_id -> menor token_version aceita
+
+Ele contém apenas usuários inativos ou revogados dentro da janela de vida do
+access token (users.tokens_revoked_at), e é recarregado do banco a cada
+AUTH_REVOCATION_REFRESH_SECONDS por uma tarefa de fundo (ver main.py).
+Alterações feitas pelo UserService entram no mapa local imediatamente.
+Outras escritas no usuário (nome, e-mail, rehash da senha no login) não
+revogam nada.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Usuário inativo: nenhum token emitido é aceito
+REVOKED_ALL = float("inf")
+
+
+class TokenRevocationSet:
+    """Mapa user_id -> tokens com token_version menor que esta são rejeitados"""
+
+    def __init__(self):
+        self._min_version: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[float] = None
+
+    def is_revoked(self, user_id: int, token_version: Optional[int]) -> bool:
+        with self._lock:
+            min_version = self._min_version.get(user_id)
+        if min_version is None:
+            return False
+        if token_version is None:
+            return True
+        # Comparação por versão, não por horário: um token renovado logo após a
+        # alteração (mesmo segundo) já carrega a versão nova e é aceito
+        return token_version < min_version
+
+    def revoke_user(self, user_id: int, active: bool, token_version: int) -> None:
+        """
+        Registra uma revogação feita neste processo
+        Usuário inativo perde todos os tokens; ativo perde os de versão anterior
+        """
+        min_version = token_version if active else REVOKED_ALL
+        with self._lock:
+            self._min_version[user_id] = min_version
+
+    def replace(self, entries: Dict[int, float]) -> None:
+        with self._lock:
+            self._min_version = entries
+            self.loaded_at = time.time()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._min_version)
+
+
+token_revocations = TokenRevocationSet()
+
+
+def load_revocations() -> int:
+    """
+    Recarrega o conjunto a partir do banco (uma única consulta)
+    Retorna o número de usuários no conjunto
+    """
+    from app.core.database import SessionLocal
+    from app.models.user import User, UserStatus
+
+    window_start = datetime.utcnow() - timedelta(minutes=settings.JWT_ACCESS_TOKEN_MINUTES)
+
+    db = SessionLocal()
+    try:
+        rows = db.query(User.id, User.status, User.token_version).filter(
+            (User.status != UserStatus.ACTIVE) | (User.tokens_revoked_at >= window_start)
+        ).all()
+    finally:
+        db.close()
+
+    entries: Dict[int, float] = {}
+    for user_id, user_status, token_version in rows:
+        if user_status != UserStatus.ACTIVE:
+            entries[user_id] = REVOKED_ALL
+        else:
+            entries[user_id] = token_version
+
+    token_revocations.replace(entries)
+    return len(entries)
+
+
+async def revocation_refresh_loop() -> None:
+    """Tarefa de fundo: recarrega o conjunto periodicamente"""
+    while True:
+        await asyncio.sleep(settings.AUTH_REVOCATION_REFRESH_SECONDS)
+        try:
+            await asyncio.to_thread(load_revocations)
+        except Exception as e:
+            # Mantém o conjunto anterior; tenta de novo no próximo ciclo
+            logger.warning(f"Falha ao recarregar revogações de token: {e}")
@@ -0,0 +1,122 @@
+"""
+Cache em memória do usuário autenticado
+
+Evita o SELECT em users a cada requisição autenticada. Guarda apenas os
+campos usados pelas rotas (id, name, email, role, status), com tamanho
+máximo (LRU) e expiração por TTL.
+
+O cache é por processo: cada worker do gunicorn tem o seu. Alterações feitas
+pelo UserService invalidam a entrada no worker que as executou; nos demais,
+a entrada expira em até USER_CACHE_TTL_SECONDS.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.models.user import User, UserRole, UserStatus
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    Snapshot imutável do usuário autenticado
+    Não é um objeto ORM: para relacionamentos, buscar o User pelo id
+    """
+    id: int
+    name: str
+    email: str
+    role: UserRole
+    status: UserStatus
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            role=user.role,
+            status=user.status
+        )
+
+
+class UserCache:
+    """Cache LRU com TTL, seguro para uso entre threads"""
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, user_id: int) -> Optional[AuthenticatedUser]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return user
+
+    def set(self, user: AuthenticatedUser) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[user.id] = (user, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Instância global usada por get_current_user
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,103 @@
+"""
+Subsistemas com dependências pesadas carregadas sob demanda
+
+ReportLab (PDFs de relatórios) e o SDK do Cloudinary não são importados no
+startup da API, para reduzir o cold start. Logo após o startup, uma tarefa de
+fundo aquece esses subsistemas (WARMUP_DEFERRED_ON_STARTUP), e /health/ready
+informa quando todos estão prontos.
+
+Se uma rota precisar do subsistema antes do warm-up, o import acontece na
+própria requisição.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+DISABLED = "disabled"
+
+
+class DeferredSubsystem:
+    """Subsistema carregado uma única vez, na primeira chamada de load()"""
+
+    def __init__(self, name: str, loader: Callable[[], None], enabled: Optional[Callable[[], bool]] = None):
+        self.name = name
+        self._loader = loader
+        self._enabled = enabled or (lambda: True)
+        self._lock = threading.Lock()
+        self.state = PENDING
+        self.load_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state in (READY, DISABLED)
+
+    def load(self) -> None:
+        if self.is_ready:
+            return
+
+        with self._lock:
+            if self.is_ready:
+                return
+
+            if not self._enabled():
+                self.state = DISABLED
+                return
+
+            start = time.perf_counter()
+            try:
+                self._loader()
+            except Exception as e:
+                self.state = FAILED
+                self.error = str(e)
+                logger.warning(f"Falha ao carregar subsistema {self.name}: {e}")
+                return
+
+            self.load_ms = round((time.perf_counter() - start) * 1000, 2)
+            self.error = None
+            self.state = READY
+
+    def status(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"state": self.state, "load_ms": self.load_ms}
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+def _load_reportlab() -> None:
+    import reportlab.lib.styles  # noqa: F401
+    import reportlab.platypus  # noqa: F401
+
+
+def _load_cloudinary() -> None:
+    from app.services.cloudinary_service import cloudinary_service
+
+    cloudinary_service.sdk()
+
+
+subsystems: Dict[str, DeferredSubsystem] = {
+    "reports_pdf": DeferredSubsystem("reports_pdf", _load_reportlab),
+    "cloudinary": DeferredSubsystem("cloudinary", _load_cloudinary, enabled=lambda: settings.use_cloudinary),
+}
+
+
+def warm_up_deferred() -> None:
+    """Carrega todos os subsistemas adiados (executar fora do event loop)"""
+    for subsystem in subsystems.values():
+        subsystem.load()
+
+
+def readiness() -> Dict[str, Any]:
+    """Estado de cada subsistema e se todos estão prontos"""
+    return {
+        "ready": all(subsystem.is_ready for subsystem in subsystems.values()),
+        "subsystems": {name: subsystem.status() for name, subsystem in subsystems.items()},
+    }
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Table, Index, and_, or_, select
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.lexorank import MIDDLE
 import enum
 
 class CardPriority(str, enum.Enum):
@@ -21,16 +22,31 @@ card_assignees = Table(
     Base.metadata,
     Column("card_id", Integer, ForeignKey("cards.id", ondelete="CASCADE"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # A PK começa por card_id; cards de um usuário (relatórios) precisam deste
+    Index("ix_card_assignees_user_id", "user_id"),
 )
 
 
 class Card(Base):
     __tablename__ = "cards"
+    __table_args__ = (
+        # Cards do projeto por status/período (listagem e relatórios)
+        Index("ix_cards_project_id_status_created_at", "project_id", "status", "created_at"),
+        # Ordem dos cards dentro da coluna (board, vizinhos ao mover e posição)
+        Index("ix_cards_column_id_rank", "column_id", "rank"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    position = Column(Integer, nullable=False, default=0)
+    # Chave de ordenação na coluna (ver app/core/lexorank.py); "position" é derivada dela
+    # Collation "C" no PostgreSQL: comparação byte a byte, igual à do SQLite
+    rank = Column(
+        String(255).with_variant(String(255, collation="C"), "postgresql"),
+        nullable=False,
+        default=MIDDLE,
+        server_default=MIDDLE
+    )
     priority = Column(Enum(CardPriority), nullable=False, default=CardPriority.MEDIUM)
     status = Column(Enum(CardStatus), nullable=False, default=CardStatus.ACTIVE)
 
@@ -60,4 +76,21 @@ class Card(Base):
         return f"<Card(id={self.id}, title='{self.title}', column_id={self.column_id})>"
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# Posição do card na coluna (0 = primeira): quantos cards vêm antes dele pela rank
+# Deferred: listas preenchem em memória (CardService.populate_positions) e
+# CardService.get_card_by_id a carrega na própria consulta do card (undefer)
+_cards = Card.__table__
+_siblings = _cards.alias("sibling_cards")
+Card.position = column_property(
+    select(func.count(_siblings.c.id))
+    .where(
+        _siblings.c.column_id == _cards.c.column_id,
+        or_(_siblings.c.rank < _cards.c.rank, and_(_siblings.c.rank == _cards.c.rank, _siblings.c.id < _cards.c.id))
+    )
+    .correlate_except(_siblings)
+    .scalar_subquery(),
+    deferred=True
+)
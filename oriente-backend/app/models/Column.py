@@ -21,7 +21,7 @@ class KanbanColumn(Base):
 
     #Relationships
     project = relationship("Project", back_populates="columns")
-    cards = relationship("Card", back_populates="column", cascade="all, delete-orphan", order_by="Card.position")
+    cards = relationship("Card", back_populates="column", cascade="all, delete-orphan", order_by="[Card.rank, Card.id]")
 
     def __repr__(self):
         return f"<KanbanColumn(id={self.id}, title='{self.title}', project_id={self.project_id})>"
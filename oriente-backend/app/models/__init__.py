@@ -11,6 +11,14 @@ from app.models.notification import Notification
 from app.models.attachment import Attachment
 from app.models.chat import Chat, ChatType
 from app.models.chat_message import ChatMessage
+from app.models.board_change import BoardChange
+from app.models.search_document import SearchDocument
+
+# Registra os eventos de flush que mantêm projects.board_version
+import app.core.board_version  # noqa: E402,F401
+
+# Registra os eventos de flush que mantêm o índice de busca (search_documents)
+import app.core.search_index  # noqa: E402,F401
 
 __all__ = [
     "User",
@@ -27,5 +35,7 @@ __all__ = [
     "Attachment",
     "Chat",
     "ChatType",
-    "ChatMessage"
+    "ChatMessage",
+    "BoardChange",
+    "SearchDocument"
 ]
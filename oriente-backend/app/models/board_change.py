@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index
+from app.core.database import Base
+
+
+class BoardChange(Base):
+    """
+    Log curto das alterações do board por versão (projects.board_version)
+
+    Cada incremento da versão de um projeto grava aqui quais cards/colunas
+    mudaram ou foram removidos naquela versão (ver app/core/board_version.py).
+    Usado por GET /{project_id}/board/changes; as versões mais antigas são
+    descartadas (BOARD_CHANGES_RETENTION).
+    """
+    __tablename__ = "board_changes"
+    __table_args__ = (
+        Index("ix_board_changes_project_id_version", "project_id", "version"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+    version = Column(Integer, nullable=False)
+
+    # "card", "column" ou "board" (alteração sem detalhe: o cliente recarrega tudo)
+    entity = Column(String(10), nullable=False)
+    # None em "column": todas as colunas do projeto (deslocamento de posições em massa)
+    entity_id = Column(Integer, nullable=True)
+    deleted = Column(Boolean, nullable=False, default=False)
+
+    def __repr__(self):
+        return f"<BoardChange(project_id={self.project_id}, version={self.version}, {self.entity}={self.entity_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum as SQLEnum, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -24,6 +24,12 @@ class CardHistory(Base):
     Registra todas as mudanças importantes que acontecem em um card
     """
     __tablename__ = "card_histories"
+    __table_args__ = (
+        # Atividade do projeto no período (relatórios)
+        Index("ix_card_histories_project_id_created_at", "project_id", "created_at"),
+        # Histórico de um card, mais recente primeiro
+        Index("ix_card_histories_card_id_created_at", "card_id", "created_at"),
+    )
 
     # Chave primária
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
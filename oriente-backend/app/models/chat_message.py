@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,6 +10,10 @@ class ChatMessage(Base):
     Representa uma mensagem enviada em um chat
     """
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Mensagens do chat, mais recentes primeiro
+        Index("ix_chat_messages_chat_id_created_at", "chat_id", "created_at"),
+    )
 
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -29,6 +29,10 @@ class Notification(Base):
     Notificações enviadas aos usuários sobre eventos do sistema
     """
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Notificações (não lidas) do usuário, mais recentes primeiro
+        Index("ix_notifications_recipient_is_read_created_at", "recipient_user_id", "is_read", "created_at"),
+    )
 
     # Chave primária
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -36,6 +36,10 @@ class Project(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # Marcador de alterações do board (cards/colunas), incrementado a cada flush
+    # que os altera - ver app/core/board_version.py
+    board_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Relacionamentos
     # Owner: Um projeto tem um dono
     owner = relationship("User", back_populates="owned_projects", foreign_keys=[owner_id])
@@ -0,0 +1,94 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, UniqueConstraint, DDL, event
+from app.core.database import Base
+
+# Configuração de texto do PostgreSQL (stemming/stopwords)
+SEARCH_TEXT_CONFIG = "portuguese"
+
+# Tabela FTS5 (SQLite) espelhando title/content de search_documents
+SEARCH_FTS_TABLE = "search_documents_fts"
+
+
+class SearchDocument(Base):
+    """
+    Documento do índice de busca textual
+
+    Uma linha por card (título + descrição), comentário ou mensagem de chat,
+    mantida no flush por app/core/search_index.py. project_id/card_id/chat_id
+    servem para aplicar as permissões na própria consulta de busca.
+
+    O índice em si depende do banco (criado junto com a tabela):
+    - PostgreSQL: coluna gerada search_vector (tsvector, título com peso A) + GIN
+    - SQLite: tabela FTS5 search_documents_fts sincronizada por triggers
+    """
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        UniqueConstraint("kind", "ref_id", name="uq_search_documents_kind_ref_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # "card", "comment" ou "message" e o id do registro de origem
+    kind = Column(String(10), nullable=False)
+    ref_id = Column(Integer, nullable=False)
+
+    # Escopo para permissões: projeto (cards/comentários) ou chat (mensagens)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=True)
+    card_id = Column(Integer, ForeignKey("cards.id", ondelete="CASCADE"), nullable=True)
+    chat_id = Column(Integer, ForeignKey("chats.id", ondelete="CASCADE"), nullable=True)
+
+    title = Column(String(200), nullable=True)
+    content = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<SearchDocument(kind='{self.kind}', ref_id={self.ref_id})>"
+
+
+# === ÍNDICE TEXTUAL POR BANCO ===
+
+_POSTGRES_DDL = [
+    f"""
+    ALTER TABLE search_documents ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_search_documents_search_vector ON search_documents USING GIN (search_vector)",
+]
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE {SEARCH_FTS_TABLE} USING fts5(
+        title, content,
+        content='search_documents', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN
+        INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN
+        INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN
+        INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+for _statement in _POSTGRES_DDL:
+    event.listen(SearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in _SQLITE_DDL:
+    event.listen(SearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    SearchDocument.__table__, "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}").execute_if(dialect="sqlite")
+)
@@ -43,6 +43,11 @@ class User(Base):
     # Role/Papel (RBAC)
     role = Column(SQLEnum(UserRole), default=UserRole.USER, nullable=False)
 
+    # Revogação de tokens (AUTH_STATELESS): incrementada só em troca de senha, role
+    # ou status; access tokens com versão menor deixam de valer
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+    tokens_revoked_at = Column(DateTime, nullable=True)
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
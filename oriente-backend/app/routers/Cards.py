@@ -1,20 +1,60 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from app.core.database import get_db
+from app.core.board_cache import board_cache
+from app.core.database import get_db, get_read_db
+from app.core.board_version import get_board_version
 from app.core.dependencies import get_current_user
+from app.core.http_cache import cache_headers, make_etag, not_modified
+from app.core.responses import ORJSONResponse
+from app.routers.cards_ws import manager
 from app.models.user import User
 from app.schemas.Card import (
     CardCreate, CardUpdate, CardMove, CardStatusUpdate, CardResponse,
     CardListResponse, CardWithColumn, CardFilters, CardPriorityEnum,
-    CardStatusEnum
+    CardStatusEnum, CardBatchRequest, CardBatchResponse, CARD_RESPONSE_FIELDS,
+    card_list_response_dict
 )
+from app.services.card_batch_service import CardBatchService
 from app.services.card_service import CardService
+from app.services.project_service import ProjectService
 
 router = APIRouter()
 
 
+def _board_version(db: Session, project_id: int, user_id: int) -> int:
+    """
+    projects.board_version do projeto, depois de verificar o acesso
+    (para não responder 304 nem servir o cache a quem não tem permissão)
+    """
+    if not ProjectService.user_can_access_project(db, project_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Sem permissão para acessar este projeto"
+        )
+    return get_board_version(db, project_id)
+
+
+def _board_etag(db: Session, project_id: int, user_id: int, *parts) -> str:
+    """ETag das leituras do board a partir de projects.board_version"""
+    return make_etag(project_id, _board_version(db, project_id, user_id), *parts)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """fields=a,b,c -> conjunto validado de campos de CardResponse (None = todos)"""
+    if fields is None:
+        return None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected - set(CARD_RESPONSE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos inválidos: {', '.join(sorted(unknown))}"
+        )
+    return selected | {"id"}
+
+
 @router.post("/{project_id}/cards", response_model=CardResponse, status_code=status.HTTP_201_CREATED)
 def create_card(
         project_id: int,
@@ -39,16 +79,59 @@ def create_card(
     return CardService.create_card(db, project_id, card_data, current_user.id)
 
 
+@router.post("/{project_id}/cards/batch", response_model=CardBatchResponse)
+def apply_cards_batch(
+        project_id: int,
+        batch: CardBatchRequest,
+        background_tasks: BackgroundTasks,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Aplicar várias operações de tarefas numa única requisição
+
+    - **operations**: lista (até 500) de operações aplicadas em ordem:
+      - `{"op": "create", "card": {...}}` (mesmos campos de criar tarefa)
+      - `{"op": "update", "card_id": 1, "changes": {...}}` (mesmos campos de atualizar)
+      - `{"op": "move", "card_id": 1, "move": {"column_id": 2, "new_position": 0}}`
+      - `{"op": "archive", "card_id": 1}`
+
+    Tudo é gravado numa única transação, com um único evento `cards_batch`
+    no WebSocket do projeto. Operações inválidas (tarefa ou coluna de outro
+    projeto, usuário inexistente...) voltam com `success=false` e `error`
+    no próprio item; as demais são aplicadas.
+
+    Permissões: Usuário deve ter permissão de edição no projeto
+    """
+    result = CardBatchService.apply_batch(db, project_id, batch.operations, current_user.id)
+    event = result.pop("event")
+
+    if result["succeeded"]:
+        background_tasks.add_task(
+            manager.broadcast_to_project,
+            {"type": "cards_batch", "data": event},
+            project_id,
+            exclude_user_id=current_user.id
+        )
+
+    return ORJSONResponse(result)
+
+
 @router.get("/{project_id}/cards", response_model=CardListResponse)
 def get_project_cards(
         project_id: int,
+        request: Request,
         # Filtros opcionais
         status: Optional[CardStatusEnum] = Query(None, description="Filtrar por status"),
         priority: Optional[CardPriorityEnum] = Query(None, description="Filtrar por prioridade"),
         column_id: Optional[int] = Query(None, description="Filtrar por coluna"),
         assignee_id: Optional[int] = Query(None, description="Filtrar por usuário atribuído"),
         due_soon: Optional[bool] = Query(None, description="Tarefas com vencimento próximo"),
-        db: Session = Depends(get_db),
+        # Paginação e campos
+        limit: Optional[int] = Query(None, ge=1, le=500, description="Tamanho da página (sem limit: todas)"),
+        cursor: Optional[str] = Query(None, description="next_cursor da página anterior"),
+        fields: Optional[str] = Query(None, description="Campos separados por vírgula (ex: id,title,position)"),
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_user)
 ):
     """
@@ -63,9 +146,24 @@ def get_project_cards(
     - **assignee_id**: ID do usuário atribuído
     - **due_soon**: true para tarefas vencendo em 7 dias
 
+    **Paginação (opcional):**
+    - **limit**: tamanho da página; a resposta traz `next_cursor` enquanto houver mais
+    - **cursor**: `next_cursor` recebido, para buscar a página seguinte
+    - Sem `limit`, retorna todas as tarefas (projetos pequenos)
+
+    **fields** (opcional): só os campos pedidos vêm na resposta (e são lidos do
+    banco), ex: `fields=id,title,position,column_id` para listas sem descrição
+    nem usuários. O `id` sempre vem.
+
     Retorna as tarefas ordenadas por coluna e posição.
+    Suporta GET condicional (ETag / If-None-Match -> 304).
     Permissões: Usuário deve ter acesso ao projeto
     """
+    etag = _board_etag(db, project_id, current_user.id, "cards", request.url.query)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     filters = CardFilters(
         status=status,
         priority=priority,
@@ -74,15 +172,22 @@ def get_project_cards(
         due_soon=due_soon
     )
 
-    cards = CardService.get_project_cards(db, project_id, current_user.id, filters)
-    return CardListResponse(cards=cards, total=len(cards))
+    selected_fields = _parse_fields(fields)
+    cards, next_cursor = CardService.get_project_cards_page(
+        db, project_id, current_user.id, filters,
+        limit=limit, cursor=cursor, fields=selected_fields
+    )
+    return ORJSONResponse(
+        card_list_response_dict(cards, selected_fields, next_cursor),
+        headers=cache_headers(etag)
+    )
 
 
 @router.get("/{project_id}/cards/{card_id}", response_model=CardResponse)
 def get_card(
         project_id: int,
         card_id: int,
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_user)
 ):
     """
@@ -192,7 +297,7 @@ def update_card_status(
 @router.get("/{project_id}/cards/my-assignments", response_model=CardListResponse)
 def get_my_assigned_cards(
         project_id: int,
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_user)
 ):
     """
@@ -202,13 +307,13 @@ def get_my_assigned_cards(
     """
     filters = CardFilters(assignee_id=current_user.id, status=CardStatusEnum.ACTIVE)
     cards = CardService.get_project_cards(db, project_id, current_user.id, filters)
-    return CardListResponse(cards=cards, total=len(cards))
+    return ORJSONResponse(card_list_response_dict(cards))
 
 
 @router.get("/{project_id}/cards/due-soon", response_model=CardListResponse)
 def get_cards_due_soon(
         project_id: int,
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_user)
 ):
     """
@@ -218,46 +323,66 @@ def get_cards_due_soon(
     """
     filters = CardFilters(due_soon=True, status=CardStatusEnum.ACTIVE)
     cards = CardService.get_project_cards(db, project_id, current_user.id, filters)
-    return CardListResponse(cards=cards, total=len(cards))
+    return ORJSONResponse(card_list_response_dict(cards))
 
 
 @router.get("/{project_id}/board")
 def get_board_view(
         project_id: int,
-        db: Session = Depends(get_db),
+        request: Request,
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_user)
 ):
     """
     Visão completa do board Kanban
 
-    Retorna todas as colunas com suas respectivas tarefas.
+    Retorna todas as colunas com suas respectivas tarefas e a `version` do
+    board (usada em GET /{project_id}/board/changes?since=).
     Estrutura otimizada para renderizar o board completo.
+    Suporta GET condicional: board sem alterações retorna 304 sem ser montado.
+    Leituras repetidas da mesma versão do board saem do cache em memória,
+    já serializadas (ver app/core/board_cache.py).
+    """
+    from app.services.column_service import ColumnService
+
+    version = _board_version(db, project_id, current_user.id)
+    etag = make_etag(project_id, version, "board")
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    body = board_cache.get(project_id, version)
+    if body is None:
+        board = ColumnService.get_board(db, project_id, current_user.id)
+        # Versão do board no payload: ponto de partida para GET /board/changes?since=
+        board["version"] = version
+        body = ORJSONResponse(board).body
+        board_cache.set(project_id, version, body)
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag))
+
+@router.get("/{project_id}/board/changes")
+def get_board_changes(
+        project_id: int,
+        since: int = Query(..., ge=0, description="Versão do board que o cliente já tem"),
+        db: Session = Depends(get_read_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Alterações do board desde uma versão (sincronização incremental)
+
+    - **since**: `version` do board carregado ou da última resposta de changes
+
+    Retorna a versão atual, as colunas criadas/alteradas (mesmos campos do
+    board) e os ids removidos (`deleted_column_ids`, `deleted_card_ids`;
+    tarefas arquivadas também saem do board). `cards` traz todas as tarefas
+    ativas das colunas em `card_column_ids` (onde alguma tarefa entrou, mudou
+    ou saiu), com `column_id` e as posições atualizadas: o cliente substitui a
+    lista dessas colunas. Nas demais colunas, basta remover as tarefas que
+    aparecem na resposta e renumerar. Com `full_reload=true` o intervalo não
+    está mais no log e o cliente deve buscar o board inteiro.
+
+    Permissões: Usuário deve ter acesso ao projeto
     """
     from app.services.column_service import ColumnService
 
-    columns = ColumnService.get_project_columns(db, project_id, current_user.id)
-
-    board = []
-    for column in columns:
-        column_data = {
-            "id": column.id,
-            "title": column.title,
-            "color": column.color,
-            "position": column.position,
-            "cards": [
-                {
-                    "id": card.id,
-                    "title": card.title,
-                    "description": card.description,
-                    "priority": card.priority,
-                    "position": card.position,
-                    "due_date": card.due_date,
-                    "assignees": [{"id": u.id, "name": u.name} for u in card.assignees]
-                }
-                for card in column.cards
-                if card.status == CardStatusEnum.ACTIVE
-            ]
-        }
-        board.append(column_data)
-
-    return {"board": board, "total_columns": len(board)}
\ No newline at end of file
+    return ORJSONResponse(ColumnService.get_board_changes(db, project_id, current_user.id, since))
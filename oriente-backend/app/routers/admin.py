@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends
+
+from app.core.database import engine, async_engine, read_engine
+from app.core.dependencies import get_current_admin
+from app.core.pool_stats import pool_status
+from app.core.board_cache import board_cache
+from app.core.column_cache import column_cache
+from app.core.user_cache import user_cache
+from app.models.user import User
+from app.schemas.user import ApiResponse
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"]
+)
+
+
+@router.get("/database/pool", response_model=ApiResponse)
+def get_database_pool_stats(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Estatísticas ao vivo dos pools de conexão deste worker
+    GET /api/admin/database/pool
+
+    Para cada engine (síncrono, assíncrono e réplica de leitura, se configurada):
+    - size / checked_out / checked_in / overflow: estado atual do pool
+    - checkouts / timeouts: totais desde o início do processo
+    - wait_avg_ms / wait_max_ms: tempo aguardando uma conexão livre
+
+    Permissões: Apenas ADMIN
+    """
+    data = {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool),
+    }
+    if read_engine is not None:
+        data["read"] = pool_status(read_engine.pool)
+
+    return ApiResponse(
+        success=True,
+        message="Estatísticas do pool obtidas com sucesso",
+        data=data
+    )
+
+
+@router.get("/cache/users", response_model=ApiResponse)
+def get_user_cache_stats(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Estatísticas do cache de usuário autenticado deste worker
+    GET /api/admin/cache/users
+
+    - hits: requisições autenticadas que não consultaram o banco
+    - misses: requisições que buscaram o usuário no banco
+    - evictions / invalidations: entradas removidas por tamanho ou por alteração do usuário
+
+    Permissões: Apenas ADMIN
+    """
+    return ApiResponse(
+        success=True,
+        message="Estatísticas do cache obtidas com sucesso",
+        data=user_cache.stats()
+    )
+
+
+@router.get("/cache/boards", response_model=ApiResponse)
+def get_board_cache_stats(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Estatísticas do cache de boards serializados deste worker
+    GET /api/admin/cache/boards
+
+    - hits: leituras do board servidas do cache (sem consultas nem serialização)
+    - misses: leituras que montaram o board (stale: havia entrada, mas de versão anterior)
+    - evictions / invalidations: entradas removidas por tamanho ou por alteração do board
+
+    Permissões: Apenas ADMIN
+    """
+    return ApiResponse(
+        success=True,
+        message="Estatísticas do cache obtidas com sucesso",
+        data=board_cache.stats()
+    )
+
+
+@router.get("/cache/columns", response_model=ApiResponse)
+def get_column_cache_stats(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Estatísticas do cache de colunas por projeto deste worker
+    GET /api/admin/cache/columns
+
+    - hits: movimentações de tarefa que não consultaram as colunas do projeto
+    - misses: consultas das colunas (entrada ausente, expirada ou sem a coluna pedida)
+    - evictions / invalidations: entradas removidas por tamanho ou por alteração de colunas
+
+    Permissões: Apenas ADMIN
+    """
+    return ApiResponse(
+        success=True,
+        message="Estatísticas do cache obtidas com sucesso",
+        data=column_cache.stats()
+    )
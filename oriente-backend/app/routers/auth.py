@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.dependencies import get_current_user_id
-from app.schemas.user import RegisterRequest, LoginRequest, LoginResponse, UserDto, ApiResponse
+from app.schemas.user import RegisterRequest, LoginRequest, LoginResponse, RefreshTokenRequest, UserDto, ApiResponse
 from app.services.auth_service import AuthService
 
 router = APIRouter(
@@ -63,6 +63,32 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
         )
 
 
+@router.post("/refresh", response_model=ApiResponse)
+def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """
+    Endpoint para renovar o access token (apenas com AUTH_STATELESS)
+    POST /api/auth/refresh
+
+    Retorna um novo access token e um novo refresh token
+    """
+    try:
+        login_response = AuthService.refresh(request.refresh_token, db)
+
+        return ApiResponse(
+            success=True,
+            message="Token renovado com sucesso",
+            data=login_response.model_dump()
+        )
+
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro interno do servidor"
+        )
+
+
 @router.get("/me", response_model=ApiResponse)
 def get_current_user(
     user_id: int = Depends(get_current_user_id),
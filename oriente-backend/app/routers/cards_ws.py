@@ -1,12 +1,11 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Set
 import json
 from datetime import datetime
 
-from app.core.database import get_db
-from app.core.security import decode_access_token
-from app.models.user import User
+from app.core.database import AsyncSessionLocal
+from app.core.dependencies import get_current_user_ws
 from app.models.project import Project
 
 
@@ -81,38 +80,9 @@ class CardsConnectionManager:
 manager = CardsConnectionManager()
 
 
-async def get_current_user_ws(
-    token: str = Query(..., description="JWT token de autenticação"),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    Dependência para autenticação via WebSocket
-    Token é passado como query parameter
-    """
-    try:
-        payload = decode_access_token(token)
-        if not payload:
-            raise Exception("Token inválido")
-
-        user_id = payload.get("sub")
-
-        if not user_id:
-            raise Exception("Token inválido")
-
-        user = db.query(User).filter(User.id == int(user_id)).first()
-
-        if not user:
-            raise Exception("Usuário não encontrado")
-
-        return user
-
-    except Exception as e:
-        raise Exception(f"Falha na autenticação: {str(e)}")
-
-
-def _can_access_project(db: Session, project_id: int, user_id: int) -> bool:
+async def _can_access_project(db: AsyncSession, project_id: int, user_id: int) -> bool:
     """Verifica se o usuário tem acesso ao projeto"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         return False
 
@@ -193,7 +163,22 @@ async def websocket_cards_endpoint(
        }
        ```
 
-    5. **connected** - Confirmação de conexão
+    5. **cards_batch** - Lote aplicado via `POST /api/projects/{project_id}/cards/batch`
+       (um único evento com todas as mudanças do lote)
+       ```json
+       {
+         "type": "cards_batch",
+         "data": {
+           "project_id": 1,
+           "created": [{"card_id": 3, "title": "Nova", "column_id": 1}],
+           "updated": [1],
+           "moved": [{"card_id": 2, "from_column_id": 1, "to_column_id": 2, "position": 0}],
+           "archived": [4]
+         }
+       }
+       ```
+
+    6. **connected** - Confirmação de conexão
        ```json
        {
          "type": "connected",
@@ -206,10 +191,9 @@ async def websocket_cards_endpoint(
        ```
     """
 
-    # Criar sessão do banco de dados
-    db = next(get_db())
-
-    try:
+    # Autenticar e verificar acesso com uma sessão assíncrona de curta duração
+    # (a conexão volta ao pool antes do loop de eventos)
+    async with AsyncSessionLocal() as db:
         # Autenticar usuário
         try:
             current_user = await get_current_user_ws(token, db)
@@ -218,13 +202,14 @@ async def websocket_cards_endpoint(
             return
 
         # Verificar se usuário tem acesso ao projeto
-        if not _can_access_project(db, project_id, current_user.id):
+        if not await _can_access_project(db, project_id, current_user.id):
             await websocket.close(
                 code=status.WS_1008_POLICY_VIOLATION,
                 reason="Você não tem acesso a este projeto"
             )
             return
 
+    try:
         # Conectar usuário ao projeto
         await manager.connect(websocket, project_id, current_user.id)
 
@@ -323,7 +308,3 @@ async def websocket_cards_endpoint(
         except:
             pass
         print(f"Erro no WebSocket de cards: {e}")
-
-    finally:
-        # Fechar sessão do banco
-        db.close()
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.dependencies import get_current_user
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.chat import ChatType
 from app.schemas.chat import (
@@ -121,14 +123,14 @@ def get_chat_messages(
 
     Permissões: Apenas participantes do chat
     """
-    return ChatMessageService.get_chat_messages(db, chat_id, current_user.id, limit, offset)
+    return ORJSONResponse(ChatMessageService.get_chat_messages(db, chat_id, current_user.id, limit, offset))
 
 
 @router.post("/chats/{chat_id}/messages", response_model=ChatMessageResponse, status_code=status.HTTP_201_CREATED)
 async def send_message(
     chat_id: int,
     message_data: ChatMessageCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -143,7 +145,7 @@ async def send_message(
     Permissões: Apenas participantes do chat
     """
     # Criar mensagem no banco de dados
-    message = ChatMessageService.send_message(db, chat_id, message_data, current_user.id)
+    message = await ChatMessageService.send_message_async(db, chat_id, message_data, current_user.id)
 
     # Broadcast para usuários conectados via WebSocket (exceto o remetente)
     await manager.broadcast_to_chat(
@@ -1,12 +1,10 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, status
 from typing import Dict, Set
 import json
 from datetime import datetime
 
-from app.core.database import get_db
-from app.core.security import decode_access_token
-from app.models.user import User
+from app.core.database import AsyncSessionLocal
+from app.core.dependencies import get_current_user_ws
 from app.models.chat_message import ChatMessage
 from app.schemas.chat import ChatMessageCreate, WebSocketMessage
 from app.services.chat_service import ChatService
@@ -83,35 +81,6 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-async def get_current_user_ws(
-    token: str = Query(..., description="JWT token de autenticação"),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    Dependência para autenticação via WebSocket
-    Token é passado como query parameter
-    """
-    try:
-        payload = decode_access_token(token)
-        if not payload:
-            raise Exception("Token inválido")
-
-        user_id = payload.get("sub")
-
-        if not user_id:
-            raise Exception("Token inválido")
-
-        user = db.query(User).filter(User.id == int(user_id)).first()
-
-        if not user:
-            raise Exception("Usuário não encontrado")
-
-        return user
-
-    except Exception as e:
-        raise Exception(f"Falha na autenticação: {str(e)}")
-
-
 @router.websocket("/chat/{chat_id}")
 async def websocket_chat_endpoint(
     websocket: WebSocket,
@@ -220,10 +189,9 @@ async def websocket_chat_endpoint(
        ```
     """
 
-    # Criar sessão do banco de dados
-    db = next(get_db())
-
-    try:
+    # Autenticar e verificar acesso com uma sessão assíncrona de curta duração
+    # (a conexão volta ao pool antes do loop de mensagens)
+    async with AsyncSessionLocal() as db:
         # Autenticar usuário
         try:
             current_user = await get_current_user_ws(token, db)
@@ -232,13 +200,14 @@ async def websocket_chat_endpoint(
             return
 
         # Verificar se usuário tem acesso ao chat
-        if not ChatService._can_access_chat(db, chat_id, current_user.id):
+        if not await ChatService._can_access_chat_async(db, chat_id, current_user.id):
             await websocket.close(
                 code=status.WS_1008_POLICY_VIOLATION,
                 reason="Você não tem acesso a este chat"
             )
             return
 
+    try:
         # Conectar usuário ao chat
         await manager.connect(websocket, chat_id, current_user.id)
 
@@ -274,16 +243,17 @@ async def websocket_chat_endpoint(
                         }, websocket)
                         continue
 
-                    # Criar mensagem no banco
+                    # Criar mensagem no banco (sem bloquear o event loop)
                     message_create = ChatMessageCreate(content=content.strip())
-                    message_response = ChatMessageService.send_message(
-                        db, chat_id, message_create, current_user.id
-                    )
+                    async with AsyncSessionLocal() as db:
+                        message_response = await ChatMessageService.send_message_async(
+                            db, chat_id, message_create, current_user.id
+                        )
 
                     # Broadcast para todos os participantes do chat
                     await manager.broadcast_to_chat({
                         "type": "message",
-                        "data": message_response.model_dump()
+                        "data": message_response.model_dump(mode='json')
                     }, chat_id)
 
                 elif event_type == "typing":
@@ -302,7 +272,8 @@ async def websocket_chat_endpoint(
 
                 elif event_type == "read":
                     # Marcar como lido
-                    ChatService.update_last_read(db, chat_id, current_user.id)
+                    async with AsyncSessionLocal() as db:
+                        await ChatService.update_last_read_async(db, chat_id, current_user.id)
 
                     # Broadcast para outros participantes (exceto remetente)
                     await manager.broadcast_to_chat({
@@ -341,7 +312,3 @@ async def websocket_chat_endpoint(
         # Erro inesperado
         manager.disconnect(chat_id, current_user.id)
         print(f"Erro no WebSocket: {e}")
-
-    finally:
-        # Fechar sessão do banco
-        db.close()
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.database import get_read_db
+from app.core.dependencies import get_current_user
+from app.core.responses import ORJSONResponse
+from app.models.user import User
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(
+    prefix="/api/dashboard",
+    tags=["dashboard"]
+)
+
+
+@router.get("", response_model=DashboardResponse)
+def get_dashboard(
+    version: Optional[str] = Query(None, description="Versão recebida na resposta anterior"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Dashboard do usuário em uma única requisição
+
+    - Colunas de cada projeto com a contagem de tarefas ativas
+    - Tarefas vencidas e vencendo em breve por projeto
+    - Tarefas atribuídas ao usuário
+
+    Número fixo de consultas, independente da quantidade de projetos.
+    Com ?version igual à versão atual retorna só {"version", "unchanged": true},
+    e o cliente mantém os dados que já tem.
+    """
+    return ORJSONResponse(DashboardService.get_dashboard(db, current_user.id, version))
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.notification import NotificationType
 from app.schemas.notification import (
@@ -12,7 +13,8 @@ from app.schemas.notification import (
     NotificationListResponse,
     NotificationStatsResponse,
     NotificationMarkReadRequest,
-    NotificationMarkReadResponse
+    NotificationMarkReadResponse,
+    notification_response_dict
 )
 from app.services.notification import NotificationService
 
@@ -53,7 +55,7 @@ def list_notifications(
     notification_type: Optional[NotificationType] = Query(None, description="Filtrar por tipo"),
     limit: Optional[int] = Query(None, description="Limitar quantidade de resultados"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Listar notificações do usuário atual
@@ -75,11 +77,11 @@ def list_notifications(
         # Calcular total de não lidas (para o badge)
         unread_count = NotificationService.get_unread_count(db, current_user.id)
 
-        return NotificationListResponse(
-            notifications=[NotificationResponse.model_validate(n) for n in notifications],
-            total=len(notifications),
-            unread_count=unread_count
-        )
+        return ORJSONResponse({
+            "notifications": [notification_response_dict(n) for n in notifications],
+            "total": len(notifications),
+            "unread_count": unread_count
+        })
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -92,7 +94,7 @@ def list_notifications(
 @router.get("/count", response_model=dict)
 def get_unread_count(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Obter contagem de notificações não lidas
@@ -114,7 +116,7 @@ def get_unread_count(
 @router.get("/stats", response_model=NotificationStatsResponse)
 def get_notification_stats(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Obter estatísticas de notificações do usuário
@@ -139,7 +141,7 @@ def get_notification_stats(
 def get_notification(
     notification_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Buscar notificação por ID
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.http_cache import cache_headers, make_etag, not_modified
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.schemas.project import (
     ProjectCreateRequest,
@@ -46,6 +48,7 @@ def create_project(
 
 @router.get("", response_model=List[ProjectSummary])
 def list_user_projects(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -53,10 +56,18 @@ def list_user_projects(
     Listar projetos do usuário
 
     Equivalente a: ProjectController.listUserProjects()
+
+    Suporta GET condicional: com If-None-Match igual ao ETag atual retorna 304
     """
     try:
+        marker = ProjectService.get_user_projects_marker(current_user.id, db)
+        etag = make_etag("projects", current_user.id, marker)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
         projects = ProjectService.find_projects_by_user(current_user, db)
-        return projects
+        return ORJSONResponse(projects, headers=cache_headers(etag))
 
     except Exception as e:
         raise HTTPException(
@@ -85,7 +96,7 @@ def get_project(
             )
 
         # Verificar se o usuário tem acesso ao projeto (é owner ou membro)
-        if project.owner_id != current_user.id and current_user not in project.members:
+        if project.owner_id != current_user.id and all(member.id != current_user.id for member in project.members):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Acesso negado"
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.schemas.report import (
@@ -55,7 +55,7 @@ def get_my_efficiency_report(
         None,
         description="Filtrar por projeto específico"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -114,7 +114,7 @@ def get_user_efficiency_report(
         None,
         description="Filtrar por projeto específico (opcional)"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -165,7 +165,7 @@ def get_project_report_summary(
         None,
         description="Preset de período"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -213,7 +213,7 @@ def get_team_efficiency_report(
         None,
         description="Preset de período"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -262,7 +262,7 @@ def download_my_efficiency_report(
         None,
         description="Filtrar por projeto específico"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -328,7 +328,7 @@ def download_user_efficiency_report(
         None,
         description="Filtrar por projeto específico"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -385,7 +385,7 @@ def download_project_report(
         None,
         description="Preset de período"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -441,7 +441,7 @@ def download_team_efficiency_report(
         None,
         description="Preset de período"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
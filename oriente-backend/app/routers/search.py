@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.core.database import get_read_db
+from app.core.dependencies import get_current_user
+from app.core.responses import ORJSONResponse
+from app.models.user import User
+from app.schemas.search import SearchResponse, SearchTypeEnum
+from app.services.search_service import SearchService
+
+router = APIRouter(
+    prefix="/api/search",
+    tags=["search"]
+)
+
+
+def _parse_types(types: Optional[str]) -> Optional[List[SearchTypeEnum]]:
+    """Converte ?types=card,comment em tipos de documento (400 para tipo desconhecido)"""
+    if not types:
+        return None
+
+    names = [name.strip() for name in types.split(",") if name.strip()]
+    valid = {search_type.value for search_type in SearchTypeEnum}
+    unknown = [name for name in names if name not in valid]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tipos de busca desconhecidos: {', '.join(unknown)}"
+        )
+    return [SearchTypeEnum(name) for name in names]
+
+
+@router.get("", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Termos da busca"),
+    types: Optional[str] = Query(None, description="Tipos separados por vírgula: card, comment, message"),
+    project_id: Optional[int] = Query(None, description="Somente cards/comentários deste projeto"),
+    chat_id: Optional[int] = Query(None, description="Somente mensagens deste chat"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Busca textual em cards (título e descrição), comentários e mensagens de chat
+
+    - Resultados ordenados por relevância (título do card pesa mais)
+    - Todos os termos precisam aparecer; cada termo também casa como prefixo
+    - Somente projetos em que o usuário é owner/membro (cards ativos) e chats
+      de que participa
+    - Paginação por offset: next_offset é None na última página
+    """
+    return ORJSONResponse(SearchService.search(
+        db, current_user.id, q,
+        types=_parse_types(types),
+        project_id=project_id,
+        chat_id=chat_id,
+        limit=limit,
+        offset=offset
+    ))
@@ -118,7 +118,7 @@ async def update_user(
 
 
 @router.put("/{user_id}/password", response_model=ApiResponse)
-async def change_password(
+def change_password(
     user_id: Annotated[int, Path(description="ID do usuário")],
     password_data: PasswordChangeRequest,
     db: Session = Depends(get_db),
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Union
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List, Set, Union
 from datetime import datetime, date
 from enum import Enum
 
@@ -121,6 +121,7 @@ class CardResponse(CardBase):
 class CardListResponse(BaseModel):
     cards: List[CardResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class CardWithColumn(CardResponse):
@@ -153,6 +154,64 @@ class CardsBulkMove(BaseModel):
     moves: List[CardReorder] = Field(..., min_items=1, description="Lista de movimentações")
 
 
+class CardBatchOperationType(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    MOVE = "move"
+    ARCHIVE = "archive"
+
+
+class CardBatchOperation(BaseModel):
+    """
+    Uma operação do lote
+
+    - create: campo `card` (mesmo formato de CardCreate)
+    - update: `card_id` + `changes` (mesmo formato de CardUpdate)
+    - move: `card_id` + `move` (mesmo formato de CardMove)
+    - archive: `card_id`
+    """
+    op: CardBatchOperationType = Field(..., description="Tipo da operação")
+    card_id: Optional[int] = Field(None, description="Tarefa alvo (update, move, archive)")
+    card: Optional[CardCreate] = Field(None, description="Dados da nova tarefa (create)")
+    changes: Optional[CardUpdate] = Field(None, description="Alterações (update)")
+    move: Optional[CardMove] = Field(None, description="Destino (move)")
+
+    @model_validator(mode="after")
+    def check_payload(self):
+        if self.op == CardBatchOperationType.CREATE:
+            if self.card is None:
+                raise ValueError("Operação create exige o campo 'card'")
+            return self
+        if self.card_id is None:
+            raise ValueError(f"Operação {self.op.value} exige o campo 'card_id'")
+        if self.op == CardBatchOperationType.UPDATE and self.changes is None:
+            raise ValueError("Operação update exige o campo 'changes'")
+        if self.op == CardBatchOperationType.MOVE and self.move is None:
+            raise ValueError("Operação move exige o campo 'move'")
+        return self
+
+
+class CardBatchRequest(BaseModel):
+    operations: List[CardBatchOperation] = Field(
+        ..., min_length=1, max_length=500, description="Operações aplicadas em ordem, numa única transação"
+    )
+
+
+class CardBatchItemResult(BaseModel):
+    index: int = Field(..., description="Posição da operação no lote")
+    op: CardBatchOperationType
+    success: bool
+    card_id: Optional[int] = None
+    error: Optional[str] = None
+    card: Optional[CardResponse] = None
+
+
+class CardBatchResponse(BaseModel):
+    results: List[CardBatchItemResult]
+    succeeded: int
+    failed: int
+
+
 # === FILTERS ===
 
 class CardFilters(BaseModel):
@@ -160,4 +219,56 @@ class CardFilters(BaseModel):
     priority: Optional[CardPriorityEnum] = Field(None, description="Filtrar por prioridade")
     assignee_id: Optional[int] = Field(None, description="Filtrar por usuário atribuído")
     column_id: Optional[int] = Field(None, description="Filtrar por coluna")
-    due_soon: Optional[bool] = Field(None, description="Tarefas com vencimento próximo")
\ No newline at end of file
+    due_soon: Optional[bool] = Field(None, description="Tarefas com vencimento próximo")
+
+# === SERIALIZAÇÃO SEM VALIDAÇÃO ===
+# Listas grandes de cards vindos do banco (confiáveis): monta o mesmo JSON de
+# CardResponse sem validar cada objeto pelo Pydantic (ver app/core/responses.py)
+
+def _user_basic_dict(user) -> Optional[dict]:
+    if user is None:
+        return None
+    return {"id": user.id, "name": user.name, "email": user.email}
+
+
+# Campos de CardResponse, na ordem do JSON, e como ler cada um do card ORM
+_CARD_FIELD_GETTERS = {
+    "title": lambda card: card.title,
+    "description": lambda card: card.description or None,
+    "priority": lambda card: card.priority,
+    "due_date": lambda card: card.due_date,
+    "id": lambda card: card.id,
+    "position": lambda card: card.position,
+    "status": lambda card: card.status,
+    "column_id": lambda card: card.column_id,
+    "project_id": lambda card: card.project_id,
+    "completed_at": lambda card: card.completed_at,
+    "created_at": lambda card: card.created_at,
+    "updated_at": lambda card: card.updated_at,
+    "created_by": lambda card: _user_basic_dict(card.created_by),
+    "assignees": lambda card: [_user_basic_dict(user) for user in card.assignees],
+}
+
+CARD_RESPONSE_FIELDS = tuple(_CARD_FIELD_GETTERS)
+
+
+def card_response_dict(card, fields: Optional[Set[str]] = None) -> dict:
+    """
+    Card ORM -> dict no formato de CardResponse
+
+    fields: subconjunto dos campos (fields= da listagem); só esses atributos
+    são lidos, para não disparar o carregamento do que ficou de fora
+    """
+    return {
+        name: getter(card) for name, getter in _CARD_FIELD_GETTERS.items()
+        if fields is None or name in fields
+    }
+
+
+def card_list_response_dict(cards, fields: Optional[Set[str]] = None, next_cursor: Optional[str] = None) -> dict:
+    """Lista de cards ORM -> dict no formato de CardListResponse"""
+    return {
+        "cards": [card_response_dict(card, fields) for card in cards],
+        "total": len(cards),
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,62 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+from enum import Enum
+
+
+# === ENUMS ===
+
+class DashboardStageEnum(str, Enum):
+    """Etapa da coluna no dashboard: primeira, do meio ou última coluna do projeto"""
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+
+
+# === RESPONSE SCHEMAS ===
+
+class DashboardColumnResponse(BaseModel):
+    """Coluna do projeto com a contagem de tarefas ativas"""
+    id: int
+    title: str
+    position: int
+    stage: DashboardStageEnum
+    card_count: int
+
+
+class DashboardProjectResponse(BaseModel):
+    """Resumo de um projeto do usuário"""
+    id: int
+    name: str
+    columns: List[DashboardColumnResponse]
+    overdue_count: int = Field(..., description="Tarefas ativas vencidas fora da coluna de conclusão")
+    due_soon_count: int = Field(..., description="Tarefas ativas vencendo nos próximos dias")
+
+
+class DashboardCardResponse(BaseModel):
+    """Tarefa atribuída ao usuário"""
+    id: int
+    title: str
+    priority: str
+    status: str
+    due_date: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    column_id: int
+    project_id: int
+    project_name: str
+    stage: DashboardStageEnum
+
+
+class DashboardResponse(BaseModel):
+    """
+    Resposta de GET /api/dashboard
+
+    Quando o cliente envia a versão atual (?version=...), volta apenas
+    version e unchanged=true, sem projects/assigned_cards
+    """
+    version: str
+    unchanged: bool = False
+    due_soon_days: Optional[int] = None
+    projects: Optional[List[DashboardProjectResponse]] = None
+    assigned_cards: Optional[List[DashboardCardResponse]] = None
@@ -114,3 +114,29 @@ class NotificationMarkReadResponse(BaseModel):
     message: str
     marked_count: int = Field(..., description="Quantidade de notificações marcadas como lidas")
     notification_ids: List[int] = Field(..., description="IDs das notificações marcadas")
+
+
+# === SERIALIZAÇÃO SEM VALIDAÇÃO ===
+# Listas de notificações vindas do banco (confiáveis): monta o mesmo JSON de
+# NotificationResponse sem validar cada objeto pelo Pydantic
+
+def notification_response_dict(notification) -> dict:
+    """Notification ORM -> dict no formato de NotificationResponse"""
+    recipient = notification.recipient
+    return {
+        "id": notification.id,
+        "type": notification.type,
+        "title": notification.title,
+        "message": notification.message,
+        "is_read": notification.is_read,
+        "created_at": notification.created_at,
+        "recipient_user_id": notification.recipient_user_id,
+        "related_entity_type": notification.related_entity_type,
+        "related_entity_id": notification.related_entity_id,
+        "action_url": notification.action_url,
+        "recipient": {
+            "id": recipient.id,
+            "name": recipient.name,
+            "email": recipient.email
+        } if recipient else None,
+    }
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from enum import Enum
+
+
+# === ENUMS ===
+
+class SearchTypeEnum(str, Enum):
+    """Tipo de documento da busca"""
+    CARD = "card"
+    COMMENT = "comment"
+    MESSAGE = "message"
+
+
+# === RESPONSE SCHEMAS ===
+
+class SearchResultResponse(BaseModel):
+    """Resultado da busca (card, comentário ou mensagem de chat)"""
+    type: SearchTypeEnum
+    id: int = Field(..., description="ID do card, comentário ou mensagem")
+    project_id: Optional[int] = None
+    card_id: Optional[int] = None
+    card_title: Optional[str] = Field(None, description="Título do card (cards e comentários)")
+    chat_id: Optional[int] = None
+    snippet: str = Field(..., description="Trecho do texto em volta do primeiro termo encontrado")
+    score: float = Field(..., description="Relevância (maior é melhor)")
+
+
+class SearchResponse(BaseModel):
+    """Página de resultados, do mais relevante para o menos relevante"""
+    query: str
+    results: List[SearchResultResponse]
+    next_offset: Optional[int] = Field(None, description="offset da próxima página (None na última)")
@@ -64,6 +64,7 @@ class LoginResponse(BaseModel):
     token: str
     type: str = "Bearer"
     user: UserDto
+    refresh_token: Optional[str] = None  # Apenas com AUTH_STATELESS
 
     class Config:
         json_schema_extra = {
@@ -80,6 +81,13 @@ class LoginResponse(BaseModel):
         }
 
 
+class RefreshTokenRequest(BaseModel):
+    """
+    Schema para renovação do access token (modo AUTH_STATELESS)
+    """
+    refresh_token: str = Field(..., description="Refresh token recebido no login")
+
+
 class UserUpdateRequest(BaseModel):
     """
     Schema para atualização de dados do usuário
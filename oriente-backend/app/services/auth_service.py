@@ -2,7 +2,15 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.user import User, UserStatus
 from app.schemas.user import RegisterRequest, LoginRequest, LoginResponse, UserDto
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.config import settings
+from app.core.security import (
+    hash_password_pooled,
+    verify_password_pooled,
+    password_needs_rehash,
+    create_access_token,
+    create_refresh_token,
+    decode_refresh_token
+)
 
 
 class AuthService:
@@ -15,6 +23,7 @@ class AuthService:
     def register(request: RegisterRequest, db: Session) -> UserDto:
         """
         Registra um novo usuário no sistema
+        O hash da senha roda no pool dedicado do bcrypt
         """
         # Verificar se email já existe
         existing_user = db.query(User).filter(User.email == request.email).first()
@@ -28,7 +37,7 @@ class AuthService:
         user = User(
             name=request.name,
             email=request.email,
-            password_hash=hash_password(request.password),  # Hash da senha usando BCrypt
+            password_hash=hash_password_pooled(request.password),  # Hash da senha usando BCrypt
             role=request.role if request.role else "USER",
             status=UserStatus.ACTIVE
         )
@@ -45,6 +54,7 @@ class AuthService:
     def login(request: LoginRequest, db: Session) -> LoginResponse:
         """
         Autentica usuário e gera JWT
+        A verificação da senha roda no pool dedicado do bcrypt
         """
         # Buscar usuário pelo email
         user = db.query(User).filter(User.email == request.email).first()
@@ -56,7 +66,7 @@ class AuthService:
             )
 
         # Verificar senha usando BCrypt
-        if not verify_password(request.password, user.password_hash):
+        if not verify_password_pooled(request.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Credenciais inválidas"
@@ -69,19 +79,65 @@ class AuthService:
                 detail="Conta desativada. Entre em contato com o administrador."
             )
 
+        # Hash gerado com custo antigo: refazer com BCRYPT_ROUNDS atual (senha em claro disponível só aqui)
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = hash_password_pooled(request.password)
+            db.commit()
+            db.refresh(user)
+
+        return AuthService._build_login_response(user)
+
+    @staticmethod
+    def refresh(refresh_token: str, db: Session) -> LoginResponse:
+        """
+        Emite novo access token a partir de um refresh token (modo AUTH_STATELESS)
+        Relê o usuário do banco, então role/status do novo token estão atualizados
+        """
+        if not settings.AUTH_STATELESS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Renovação de token não habilitada"
+            )
+
+        payload = decode_refresh_token(refresh_token)
+        if payload is None or payload.get("sub") is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token inválido ou expirado"
+            )
+
+        user = db.query(User).filter(User.id == int(payload["sub"])).first()
+        if not user or user.status != UserStatus.ACTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Sessão inválida - conta desativada"
+            )
+
+        return AuthService._build_login_response(user)
+
+    @staticmethod
+    def _build_login_response(user: User) -> LoginResponse:
+        """
+        Gera os tokens do usuário
+        Com AUTH_STATELESS o access token é curto, carrega o status
+        e acompanha um refresh token
+        """
         # Gerar JWT token
         token = create_access_token(
             user_id=user.id,
             email=user.email,
             name=user.name,
-            role=user.role
+            role=user.role,
+            status=user.status if settings.AUTH_STATELESS else None,
+            token_version=user.token_version if settings.AUTH_STATELESS else None
         )
+        refresh_token = create_refresh_token(user.id) if settings.AUTH_STATELESS else None
 
         # Converter user para DTO
         user_dto = AuthService._convert_to_user_dto(user)
 
         # Retornar resposta com token
-        return LoginResponse(token=token, user=user_dto)
+        return LoginResponse(token=token, user=user_dto, refresh_token=refresh_token)
 
     @staticmethod
     def get_current_user(user_id: int, db: Session) -> UserDto:
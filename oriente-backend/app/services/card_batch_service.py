@@ -0,0 +1,402 @@
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import select
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from fastapi import HTTPException, status
+
+from app.core.lexorank import rank_between
+from app.models.Card import Card, CardStatus
+from app.models.Column import KanbanColumn
+from app.models.user import User
+from app.models.card_history import CardHistoryAction
+from app.schemas.Card import (
+    CardBatchOperation, CardBatchOperationType, CardCreate, CardUpdate, CardMove,
+    card_response_dict
+)
+from app.services.card_service import CardService
+from app.services.card_history_service import CardHistoryService
+from app.services.project_service import ProjectService
+
+
+class _ColumnOrder:
+    """
+    Ordem (rank, card) de uma coluna, mantida em memória durante o lote
+
+    Carregada uma vez por coluna afetada; cada create/move calcula a rank nova
+    a partir dos vizinhos desta lista, na ordem em que as operações chegam.
+    """
+
+    def __init__(self, entries: List[Tuple[str, object]]):
+        # card = id (cards existentes) ou o objeto Card (criados no lote)
+        self.entries = entries
+
+    def index_of(self, card_id: int) -> Optional[int]:
+        for index, (_, card) in enumerate(self.entries):
+            if card == card_id:
+                return index
+        return None
+
+    def positions(self) -> Dict[int, int]:
+        """Posição final de cada card da coluna (ler antes do commit: usa card.id dos criados)"""
+        return {
+            card if isinstance(card, int) else card.id: index
+            for index, (_, card) in enumerate(self.entries)
+        }
+
+    def remove(self, card_id: int) -> None:
+        index = self.index_of(card_id)
+        if index is not None:
+            del self.entries[index]
+
+    def insert(self, card, position: Optional[int]) -> Optional[str]:
+        """Insere o card na posição (None = fim) e retorna a rank nova (None se houver empate)"""
+        if position is None or position > len(self.entries):
+            position = len(self.entries)
+        before = self.entries[position - 1][0] if position > 0 else None
+        after = self.entries[position][0] if position < len(self.entries) else None
+        if before is not None and after is not None and before >= after:
+            return None
+        rank = rank_between(before, after)
+        self.entries.insert(position, (rank, card))
+        return rank
+
+
+class CardBatchService:
+    """
+    Aplica várias operações de cards (create / update / move / archive) de um
+    projeto numa única transação:
+
+    - uma verificação de permissão para o lote
+    - cards, colunas, usuários e a ordem das colunas afetadas carregados uma vez
+    - ranks calculadas em memória por coluna afetada
+    - histórico inserido com um único INSERT e um único commit
+
+    Erros de validação de uma operação (card inexistente, coluna de outro
+    projeto...) ficam no resultado daquela operação; as demais seguem.
+    """
+
+    @staticmethod
+    def apply_batch(
+            db: Session,
+            project_id: int,
+            operations: List[CardBatchOperation],
+            user_id: int
+    ) -> dict:
+        if not ProjectService.user_can_edit_project(db, project_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Sem permissão para editar tarefas neste projeto"
+            )
+
+        columns = db.query(KanbanColumn).filter(
+            KanbanColumn.project_id == project_id
+        ).order_by(KanbanColumn.position.desc(), KanbanColumn.id.desc()).all()
+        columns_by_id = {column.id: column for column in columns}
+        last_column_id = columns[0].id if columns else None
+
+        card_ids = {operation.card_id for operation in operations if operation.card_id is not None}
+        cards_by_id = {
+            card.id: card for card in
+            db.query(Card).options(selectinload(Card.assignees)).filter(
+                Card.id.in_(card_ids),
+                Card.project_id == project_id
+            ).all()
+        } if card_ids else {}
+
+        users_by_id = CardBatchService._load_users(db, operations)
+        orders = CardBatchService._load_column_orders(db, operations, cards_by_id, columns_by_id)
+
+        results: List[dict] = []
+        history: List[Tuple[CardHistoryAction, object, dict]] = []
+        events: Dict[str, list] = {"created": [], "updated": [], "moved": [], "archived": []}
+
+        for index, operation in enumerate(operations):
+            try:
+                if operation.op == CardBatchOperationType.CREATE:
+                    card = CardBatchService._create(
+                        db, project_id, operation.card, user_id, columns_by_id, users_by_id, orders, history
+                    )
+                    events["created"].append(card)
+                else:
+                    card = cards_by_id.get(operation.card_id)
+                    if card is None:
+                        raise HTTPException(
+                            status_code=status.HTTP_404_NOT_FOUND,
+                            detail="Tarefa não encontrada neste projeto"
+                        )
+                    if operation.op == CardBatchOperationType.UPDATE:
+                        CardBatchService._update(card, operation.changes, users_by_id, history)
+                        events["updated"].append(card)
+                    elif operation.op == CardBatchOperationType.MOVE:
+                        moved = CardBatchService._move(
+                            db, card, operation.move, columns_by_id, last_column_id, orders, history
+                        )
+                        if moved:
+                            events["moved"].append(moved)
+                    else:
+                        card.status = CardStatus.ARCHIVED
+                        events["archived"].append(card)
+
+                results.append({
+                    "index": index, "op": operation.op, "success": True,
+                    "card_id": None, "card": card, "error": None
+                })
+
+            except HTTPException as e:
+                results.append({
+                    "index": index, "op": operation.op, "success": False,
+                    "card_id": operation.card_id, "error": e.detail
+                })
+
+        # Um flush para os INSERTs/UPDATEs dos cards (ids dos criados), um INSERT de histórico, um commit
+        db.flush()
+        CardHistoryService.bulk_create_history_entries(
+            db,
+            [(action, card.id, details) for action, card, details in history],
+            project_id,
+            user_id
+        )
+        # Ids lidos antes do commit (depois dele os objetos expiram e cada acesso faria um SELECT)
+        for result in results:
+            if result["success"]:
+                result["card_id"] = result.pop("card").id
+        positions = {}
+        for order in orders.values():
+            positions.update(order.positions())
+        event = CardBatchService._build_event(project_id, events)
+        db.commit()
+
+        for column_id, order in orders.items():
+            if order.entries:
+                CardService._check_rank_length(column_id, max((rank for rank, _ in order.entries), key=len))
+
+        return CardBatchService._build_response(db, results, event, positions)
+
+    # === OPERAÇÕES ===
+
+    @staticmethod
+    def _create(db, project_id, data: CardCreate, user_id, columns_by_id, users_by_id, orders, history) -> Card:
+        if data.column_id not in columns_by_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Coluna não encontrada neste projeto"
+            )
+        assignees = CardBatchService._resolve_users(data.assignee_ids, users_by_id)
+
+        card = Card(
+            title=data.title,
+            description=data.description,
+            priority=data.priority,
+            due_date=data.due_date,
+            column_id=data.column_id,
+            project_id=project_id,
+            created_by_id=user_id
+        )
+        card.rank = CardBatchService._insert_rank(db, orders, data.column_id, card, data.position)
+        card.assignees.extend(assignees)
+        db.add(card)
+
+        history.append((CardHistoryAction.CREATED, card, {"title": card.title}))
+        return card
+
+    @staticmethod
+    def _update(card: Card, changes: CardUpdate, users_by_id, history) -> None:
+        update_data = changes.model_dump(exclude_unset=True, exclude={"assignee_ids"})
+        new_assignees = None
+        if changes.assignee_ids is not None:
+            new_assignees = CardBatchService._resolve_users(changes.assignee_ids, users_by_id)
+
+        details = {}
+        if "title" in update_data and update_data["title"] != card.title:
+            details.update({"title_changed": True, "old_title": card.title, "new_title": update_data["title"]})
+        if "description" in update_data and update_data["description"] != card.description:
+            details["description_changed"] = True
+        if "due_date" in update_data and update_data["due_date"] != card.due_date:
+            details["deadline_changed"] = True
+
+        for field, value in update_data.items():
+            setattr(card, field, value)
+        if details:
+            history.append((CardHistoryAction.UPDATED, card, details))
+
+        if new_assignees is not None:
+            old_ids = {user.id for user in card.assignees}
+            new_ids = {user.id for user in new_assignees}
+            card.assignees = new_assignees
+            for user in new_assignees:
+                if user.id not in old_ids:
+                    history.append((CardHistoryAction.ASSIGNEE_ADDED, card,
+                                    {"assignee_name": user.name, "assignee_id": user.id}))
+            for user_id in sorted(old_ids - new_ids):
+                user = users_by_id.get(user_id)
+                history.append((CardHistoryAction.ASSIGNEE_REMOVED, card,
+                                {"assignee_name": user.name if user else "", "assignee_id": user_id}))
+
+    @staticmethod
+    def _move(db, card: Card, data: CardMove, columns_by_id, last_column_id, orders, history) -> Optional[dict]:
+        target_column = columns_by_id.get(data.column_id)
+        if target_column is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Coluna de destino não encontrada"
+            )
+
+        old_column_id = card.column_id
+        if old_column_id == data.column_id and orders[old_column_id].index_of(card.id) == data.new_position:
+            return None  # Sem mudança
+
+        orders[old_column_id].remove(card.id)
+        card.rank = CardBatchService._insert_rank(db, orders, data.column_id, card.id, data.new_position)
+
+        if old_column_id != data.column_id:
+            card.column_id = data.column_id
+            # Última coluna = concluída (mesma regra de CardService.move_card)
+            card.completed_at = datetime.utcnow() if data.column_id == last_column_id else None
+            history.append((CardHistoryAction.MOVED, card, {
+                "from_column": columns_by_id[old_column_id].title,
+                "to_column": target_column.title
+            }))
+
+        return {"card": card, "from_column_id": old_column_id, "to_column_id": data.column_id}
+
+    # === AUXILIARES ===
+
+    @staticmethod
+    def _insert_rank(db: Session, orders, column_id: int, card, position: Optional[int]) -> str:
+        rank = orders[column_id].insert(card, position)
+        if rank is None:
+            # Ranks repetidas na coluna (escritas concorrentes): grava o que já foi
+            # aplicado, redistribui a coluna e recarrega a ordem dela
+            db.flush()
+            CardService.rebalance_column(db, column_id)
+            orders[column_id] = CardBatchService._column_order(db, column_id)
+            # Card existente movido na própria coluna: a ordem recarregada já o contém
+            orders[column_id].remove(card)
+            rank = orders[column_id].insert(card, position)
+        return rank
+
+    @staticmethod
+    def _column_order(db: Session, column_id: int) -> _ColumnOrder:
+        rows = db.execute(
+            select(Card.rank, Card.id).where(Card.column_id == column_id).order_by(Card.rank, Card.id)
+        ).all()
+        return _ColumnOrder([(rank, card_id) for rank, card_id in rows])
+
+    @staticmethod
+    def _load_column_orders(db: Session, operations, cards_by_id, columns_by_id) -> Dict[int, _ColumnOrder]:
+        """Ordem atual das colunas afetadas por create/move, numa única consulta"""
+        column_ids = set()
+        for operation in operations:
+            if operation.op == CardBatchOperationType.CREATE:
+                column_ids.add(operation.card.column_id)
+            elif operation.op == CardBatchOperationType.MOVE:
+                column_ids.add(operation.move.column_id)
+                if operation.card_id in cards_by_id:
+                    column_ids.add(cards_by_id[operation.card_id].column_id)
+        column_ids &= set(columns_by_id)
+
+        orders = {column_id: _ColumnOrder([]) for column_id in column_ids}
+        if column_ids:
+            rows = db.execute(
+                select(Card.column_id, Card.rank, Card.id)
+                .where(Card.column_id.in_(sorted(column_ids)))
+                .order_by(Card.column_id, Card.rank, Card.id)
+            ).all()
+            for column_id, rank, card_id in rows:
+                orders[column_id].entries.append((rank, card_id))
+        return orders
+
+    @staticmethod
+    def _load_users(db: Session, operations) -> Dict[int, User]:
+        """Usuários citados em assignee_ids (e os atuais dos cards, para o histórico)"""
+        user_ids = set()
+        for operation in operations:
+            payload = operation.card if operation.op == CardBatchOperationType.CREATE else operation.changes
+            if payload is not None and payload.assignee_ids:
+                user_ids.update(payload.assignee_ids)
+        if not user_ids:
+            return {}
+        return {user.id: user for user in db.query(User).filter(User.id.in_(user_ids)).all()}
+
+    @staticmethod
+    def _resolve_users(assignee_ids: Optional[List[int]], users_by_id: Dict[int, User]) -> List[User]:
+        if not assignee_ids:
+            return []
+        missing = [user_id for user_id in assignee_ids if user_id not in users_by_id]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Alguns usuários não foram encontrados"
+            )
+        return [users_by_id[user_id] for user_id in dict.fromkeys(assignee_ids)]
+
+    @staticmethod
+    def _build_event(project_id: int, events: Dict[str, list]) -> dict:
+        """Evento agregado do lote para o WebSocket (posições preenchidas em _build_response)"""
+        return {
+            "project_id": project_id,
+            "created": [
+                {"card_id": card.id, "title": card.title, "column_id": card.column_id}
+                for card in events["created"]
+            ],
+            "updated": sorted({card.id for card in events["updated"]}),
+            "moved": [
+                {
+                    "card_id": moved["card"].id,
+                    "from_column_id": moved["from_column_id"],
+                    "to_column_id": moved["to_column_id"],
+                    "position": None,
+                }
+                for moved in events["moved"]
+            ],
+            "archived": sorted({card.id for card in events["archived"]}),
+        }
+
+    @staticmethod
+    def _build_response(db: Session, results: List[dict], event: dict, positions: Dict[int, int]) -> dict:
+        """
+        Resultados por item com os cards recarregados numa única consulta
+
+        positions: posições já conhecidas pela ordem em memória das colunas
+        afetadas por create/move; só os demais cards (update/archive em outras
+        colunas) têm a posição lida do banco
+        """
+        card_ids = {result["card_id"] for result in results if result["success"]}
+        cards_by_id = {}
+        if card_ids:
+            cards = db.query(Card).options(
+                joinedload(Card.assignees),
+                joinedload(Card.created_by)
+            ).filter(Card.id.in_(card_ids)).all()
+            unknown = []
+            for card in cards:
+                if card.id in positions:
+                    set_committed_value(card, "position", positions[card.id])
+                else:
+                    unknown.append(card)
+            CardService.populate_positions(db, unknown)
+            cards_by_id = {card.id: card for card in cards}
+
+        items = []
+        for result in results:
+            card = cards_by_id.get(result["card_id"]) if result["success"] else None
+            items.append({
+                "index": result["index"],
+                "op": result["op"],
+                "success": result["success"],
+                "card_id": result["card_id"],
+                "error": result["error"],
+                "card": card_response_dict(card) if card is not None else None,
+            })
+
+        for moved in event["moved"]:
+            moved["position"] = cards_by_id[moved["card_id"]].position
+
+        succeeded = sum(1 for item in items if item["success"])
+        return {
+            "results": items,
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded,
+            "event": event,
+        }
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 from typing import List, Optional, Tuple
 from datetime import datetime
 from fastapi import HTTPException, status
@@ -133,6 +133,44 @@ class CardHistoryService:
 
         return history_entry
 
+    @staticmethod
+    def bulk_create_history_entries(
+        db: Session,
+        entries: List[Tuple[CardHistoryAction, int, dict]],
+        project_id: int,
+        user_id: Optional[int]
+    ) -> int:
+        """
+        Insere várias entradas de histórico do mesmo autor com um único INSERT
+
+        Args:
+            db: Sessão do banco de dados
+            entries: Tuplas (ação, card_id, detalhes)
+            project_id: ID do projeto
+            user_id: ID do usuário que realizou as ações
+
+        Returns:
+            int: Quantidade de entradas inseridas (sem commit)
+        """
+        if not entries:
+            return 0
+
+        user_name = CardHistoryService._user_name(db, user_id)
+        now = datetime.utcnow()
+        db.execute(insert(CardHistory), [
+            {
+                "action": action,
+                "card_id": card_id,
+                "project_id": project_id,
+                "user_id": user_id,
+                "message": CardHistoryService._format_message(action, user_name, details),
+                "details": details,
+                "created_at": now,
+            }
+            for action, card_id, details in entries
+        ])
+        return len(entries)
+
     @staticmethod
     def _generate_message(
         db: Session,
@@ -152,14 +190,25 @@ class CardHistoryService:
         Returns:
             str: Mensagem formatada
         """
-        # Buscar nome do usuário
+        return CardHistoryService._format_message(
+            action=action,
+            user_name=CardHistoryService._user_name(db, user_id),
+            details=details
+        )
+
+    @staticmethod
+    def _user_name(db: Session, user_id: Optional[int]) -> str:
+        """Nome do autor da ação ("Sistema" se não houver usuário)"""
         from app.models.user import User
-        user_name = "Sistema"
         if user_id:
             user = db.query(User).filter(User.id == user_id).first()
             if user:
-                user_name = user.name
+                return user.name
+        return "Sistema"
 
+    @staticmethod
+    def _format_message(action: CardHistoryAction, user_name: str, details: Optional[dict] = None) -> str:
+        """Mensagem legível do histórico a partir do nome do autor e dos detalhes"""
         # Mensagens base para cada ação
         messages = {
             CardHistoryAction.CREATED: f"Card criado por {user_name}",
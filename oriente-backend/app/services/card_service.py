@@ -1,9 +1,19 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func
-from typing import List, Optional
+import base64
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.orm import Session, aliased, joinedload, load_only, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, or_, exists, func, select, update, bindparam, tuple_
+from typing import Iterable, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 
+from app.core import database
+from app.core.column_cache import get_project_columns
+from app.core.config import settings
+from app.core.lexorank import rank_between, rebalanced_ranks
 from app.models.Card import Card, CardStatus, CardPriority
 from app.models.Column import KanbanColumn
 from app.models.user import User
@@ -16,6 +26,19 @@ from app.schemas.Card import (
 from app.services.project_service import ProjectService
 from app.services.card_history_service import CardHistoryService
 
+logger = logging.getLogger(__name__)
+
+# Rebalanceamento das ranks em segundo plano (uma coluna por vez, sem repetir colunas pendentes)
+_rebalance_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="card-rank-rebalance")
+_rebalance_pending = set()
+_rebalance_lock = threading.Lock()
+
+# Campos de CardResponse que são colunas de cards (load_only na listagem com fields=)
+_CARD_LIST_COLUMNS = {
+    "title", "description", "priority", "due_date", "status", "column_id",
+    "project_id", "completed_at", "created_at", "updated_at",
+}
+
 
 class CardService:
 
@@ -44,16 +67,8 @@ class CardService:
                 detail="Coluna não encontrada neste projeto"
             )
 
-        # Calcular posição se não informada
-        if card_data.position is None:
-            max_position = db.query(Card).filter(
-                Card.column_id == card_data.column_id
-            ).count()
-            position = max_position
-        else:
-            position = card_data.position
-            # Ajustar posições dos outros cards
-            CardService._adjust_positions_on_insert(db, card_data.column_id, position)
+        # Chave de ordenação na posição pedida (None = última); os outros cards não mudam
+        rank = CardService._rank_for_position(db, card_data.column_id, card_data.position)
 
         # Criar card
         card = Card(
@@ -61,23 +76,21 @@ class CardService:
             description=card_data.description,
             priority=card_data.priority,
             due_date=card_data.due_date,
-            position=position,
+            rank=rank,
             column_id=card_data.column_id,
             project_id=project_id,
             created_by_id=user_id
         )
 
         db.add(card)
-        db.flush()  # Para obter o ID do card
 
-        # Adicionar assignees
+        # Adicionar assignees (antes do flush: card e vínculos gravados juntos)
         if card_data.assignee_ids:
             CardService._add_assignees(db, card, card_data.assignee_ids, project_id)
 
-        db.commit()
-        db.refresh(card)
+        db.flush()  # Para obter o ID do card
 
-        # Registrar histórico de criação
+        # Registrar histórico de criação (mesma transação do card)
         CardHistoryService.create_history_entry(
             db=db,
             action=CardHistoryAction.CREATED,
@@ -86,7 +99,10 @@ class CardService:
             user_id=user_id,
             details={"title": card.title}
         )
+
         db.commit()
+        db.refresh(card)
+        CardService._check_rank_length(card.column_id, rank)
 
         return card
 
@@ -98,6 +114,29 @@ class CardService:
             filters: Optional[CardFilters] = None
     ) -> List[Card]:
         """Buscar todas as tarefas de um projeto com filtros"""
+        cards, _ = CardService.get_project_cards_page(db, project_id, user_id, filters)
+        return cards
+
+    @staticmethod
+    def get_project_cards_page(
+            db: Session,
+            project_id: int,
+            user_id: int,
+            filters: Optional[CardFilters] = None,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            fields: Optional[Set[str]] = None
+    ) -> Tuple[List[Card], Optional[str]]:
+        """
+        Buscar tarefas de um projeto com filtros, paginação por cursor e campos
+
+        - limit/cursor: paginação keyset na ordem do board (posição da coluna,
+          rank do card, id); sem limit, todas as tarefas (projetos pequenos)
+        - fields: campos de CardResponse a carregar; a descrição e os
+          relacionamentos fora da lista não são lidos do banco
+
+        Retorna (cards, cursor da próxima página ou None).
+        """
 
         # Verificar se usuário tem acesso ao projeto
         if not ProjectService.user_can_access_project(db, project_id, user_id):
@@ -106,11 +145,10 @@ class CardService:
                 detail="Sem permissão para acessar este projeto"
             )
 
-        query = db.query(Card).options(
-            joinedload(Card.assignees),
-            joinedload(Card.created_by),
-            joinedload(Card.column)
-        ).filter(Card.project_id == project_id)
+        sort_key = (KanbanColumn.position, KanbanColumn.id, Card.rank, Card.id)
+        query = db.query(Card, KanbanColumn.position).join(Card.column).filter(
+            Card.project_id == project_id
+        ).options(*CardService._list_load_options(fields, paginated=limit is not None))
 
         # Aplicar filtros
         if filters:
@@ -136,13 +174,77 @@ class CardService:
                     )
                 )
 
+        # Continua depois do último card da página anterior
+        if cursor is not None:
+            query = query.filter(tuple_(*sort_key) > tuple_(*CardService._decode_cursor(cursor)))
+
         # Ordenar por coluna e posição
-        cards = query.join(KanbanColumn).order_by(
-            KanbanColumn.position,
-            Card.position
-        ).all()
+        query = query.order_by(*sort_key)
+        if limit is not None:
+            query = query.limit(limit + 1)
+        rows = query.all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last_card, last_column_position = rows[-1]
+            next_cursor = CardService._encode_cursor(
+                last_column_position, last_card.column_id, last_card.rank, last_card.id
+            )
+        cards = [card for card, _ in rows]
 
-        return cards
+        if fields is None or "position" in fields:
+            # Sem filtros nem paginação a lista tem todos os cards de cada coluna:
+            # posição calculada em memória
+            has_filters = filters is not None and any(
+                getattr(filters, field) for field in ("status", "priority", "column_id", "assignee_id", "due_soon")
+            )
+            complete = not has_filters and limit is None and cursor is None
+            CardService.populate_positions(db, cards, complete=complete)
+
+        return cards, next_cursor
+
+    @staticmethod
+    def _list_load_options(fields: Optional[Set[str]], paginated: bool) -> list:
+        """Opções de carregamento da listagem conforme os campos pedidos"""
+        # Com LIMIT, a coleção vem numa consulta à parte (um JOIN multiplicaria as linhas limitadas)
+        load_assignees = selectinload(Card.assignees) if paginated else joinedload(Card.assignees)
+        if fields is None:
+            return [load_assignees, joinedload(Card.created_by)]
+
+        columns = [
+            getattr(Card, name) for name in fields
+            if name in _CARD_LIST_COLUMNS
+        ]
+        options = [load_only(Card.id, Card.column_id, Card.rank, *columns)]
+        if "assignees" in fields:
+            options.append(load_assignees)
+        if "created_by" in fields:
+            options.append(joinedload(Card.created_by))
+        return options
+
+    @staticmethod
+    def _encode_cursor(column_position: int, column_id: int, rank: str, card_id: int) -> str:
+        """Cursor opaco com a chave de ordenação do último card da página"""
+        payload = json.dumps([column_position, column_id, rank, card_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, int, str, int]:
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            column_position, column_id, rank, card_id = json.loads(payload)
+            if not (
+                isinstance(column_position, int) and isinstance(column_id, int)
+                and isinstance(rank, str) and isinstance(card_id, int)
+            ):
+                raise ValueError
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor de paginação inválido"
+            )
+        return column_position, column_id, rank, card_id
 
     @staticmethod
     def get_card_by_id(db: Session, card_id: int, user_id: int) -> Card:
@@ -151,7 +253,9 @@ class CardService:
         card = db.query(Card).options(
             joinedload(Card.assignees),
             joinedload(Card.created_by),
-            joinedload(Card.column)
+            joinedload(Card.column),
+            # Posição na mesma consulta (e no refresh após as alterações): sem um SELECT avulso
+            undefer(Card.position)
         ).filter(Card.id == card_id).first()
 
         if not card:
@@ -188,6 +292,7 @@ class CardService:
         old_description = card.description
         old_due_date = card.due_date
         old_assignee_ids = {u.id for u in card.assignees}
+        assignee_names = {u.id: u.name for u in card.assignees}
 
         # Atualizar campos básicos
         update_data = card_data.model_dump(exclude_unset=True, exclude={'assignee_ids'})
@@ -206,8 +311,12 @@ class CardService:
         if 'due_date' in update_data and old_due_date != card.due_date:
             changes['deadline_changed'] = True
 
+        # Histórico da alteração: (ação, card_id, detalhes)
+        history = []
+        if changes:
+            history.append((CardHistoryAction.UPDATED, card.id, changes))
+
         # Atualizar assignees se informado
-        assignees_changed = False
         if card_data.assignee_ids is not None:
             new_assignee_ids = set(card_data.assignee_ids) if card_data.assignee_ids else set()
 
@@ -220,59 +329,25 @@ class CardService:
             # Adicionar novos assignees
             if card_data.assignee_ids:
                 CardService._add_assignees(db, card, card_data.assignee_ids, card.project_id)
-
-            assignees_changed = bool(added_assignees or removed_assignees)
+            assignee_names.update({u.id: u.name for u in card.assignees})
+
+            # Uma entrada de histórico por assignee adicionado/removido
+            for action, assignee_ids in (
+                (CardHistoryAction.ASSIGNEE_ADDED, added_assignees),
+                (CardHistoryAction.ASSIGNEE_REMOVED, removed_assignees)
+            ):
+                for assignee_id in sorted(assignee_ids):
+                    history.append((
+                        action, card.id,
+                        {"assignee_name": assignee_names[assignee_id], "assignee_id": assignee_id}
+                    ))
+
+        # Card e histórico na mesma transação (histórico em um único INSERT)
+        CardHistoryService.bulk_create_history_entries(db, history, card.project_id, user_id)
 
         db.commit()
         db.refresh(card)
 
-        # Registrar histórico se houve mudanças nos campos básicos
-        if changes:
-            CardHistoryService.create_history_entry(
-                db=db,
-                action=CardHistoryAction.UPDATED,
-                card_id=card.id,
-                project_id=card.project_id,
-                user_id=user_id,
-                details=changes
-            )
-            db.commit()
-
-        # Registrar mudanças de assignees (individualmente)
-        if card_data.assignee_ids is not None:
-            new_assignee_ids = set(card_data.assignee_ids) if card_data.assignee_ids else set()
-            added_assignees = new_assignee_ids - old_assignee_ids
-            removed_assignees = old_assignee_ids - new_assignee_ids
-
-            # Criar histórico para cada assignee adicionado
-            for assignee_id in added_assignees:
-                user = db.query(User).filter(User.id == assignee_id).first()
-                if user:
-                    CardHistoryService.create_history_entry(
-                        db=db,
-                        action=CardHistoryAction.ASSIGNEE_ADDED,
-                        card_id=card.id,
-                        project_id=card.project_id,
-                        user_id=user_id,
-                        details={"assignee_name": user.name, "assignee_id": assignee_id}
-                    )
-
-            # Criar histórico para cada assignee removido
-            for assignee_id in removed_assignees:
-                user = db.query(User).filter(User.id == assignee_id).first()
-                if user:
-                    CardHistoryService.create_history_entry(
-                        db=db,
-                        action=CardHistoryAction.ASSIGNEE_REMOVED,
-                        card_id=card.id,
-                        project_id=card.project_id,
-                        user_id=user_id,
-                        details={"assignee_name": user.name, "assignee_id": assignee_id}
-                    )
-
-            if added_assignees or removed_assignees:
-                db.commit()
-
         return card
 
     @staticmethod
@@ -290,15 +365,9 @@ class CardService:
                 detail="Apenas administradores podem deletar tarefas"
             )
 
-        column_id = card.column_id
-        position = card.position
-
-        # Deletar card
+        # Deletar card (as posições dos demais são derivadas das ranks: nada a ajustar)
         db.delete(card)
 
-        # Ajustar posições dos outros cards
-        CardService._adjust_positions_on_delete(db, column_id, position)
-
         db.commit()
         return True
 
@@ -315,61 +384,64 @@ class CardService:
                 detail="Sem permissão para mover esta tarefa"
             )
 
-        # Verificar se coluna de destino existe no mesmo projeto
-        target_column = db.query(KanbanColumn).filter(
+        # Verificar se coluna de destino existe no mesmo projeto e, na mesma consulta,
+        # se é a última coluna (conclusão) - lido do banco, nunca do cache por worker
+        later_column = aliased(KanbanColumn)
+        is_last_column = ~exists().where(
+            later_column.project_id == KanbanColumn.project_id,
+            or_(
+                later_column.position > KanbanColumn.position,
+                and_(later_column.position == KanbanColumn.position, later_column.id > KanbanColumn.id)
+            )
+        )
+        row = db.query(KanbanColumn, is_last_column.label("is_last")).filter(
             and_(
                 KanbanColumn.id == move_data.column_id,
                 KanbanColumn.project_id == card.project_id
             )
         ).first()
 
-        if not target_column:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Coluna de destino não encontrada"
             )
+        target_column, target_is_last = row
 
         old_column_id = card.column_id
-        old_position = card.position
         new_column_id = move_data.column_id
         new_position = move_data.new_position
-
-        # Guardar nome da coluna antiga para histórico
-        old_column = db.query(KanbanColumn).filter(KanbanColumn.id == old_column_id).first()
-        old_column_name = old_column.title if old_column else "Desconhecida"
+        new_rank = None
 
         # Se mudou de coluna
         if old_column_id != new_column_id:
-            # Ajustar posições na coluna de origem
-            CardService._adjust_positions_on_delete(db, old_column_id, old_position)
+            # Títulos das colunas do projeto (cache): nome da coluna antiga para o histórico
+            project_columns = get_project_columns(db, card.project_id, (old_column_id,))
+            old_column_name = project_columns.titles.get(old_column_id, "Desconhecida")
 
-            # Ajustar posições na coluna de destino
-            CardService._adjust_positions_on_insert(db, new_column_id, new_position)
+            # Nova rank entre os vizinhos da posição de destino: só este card é alterado
+            new_rank = CardService._rank_for_position(db, new_column_id, new_position, card.id)
 
             # Atualizar card
             card.column_id = new_column_id
-            card.position = new_position
+            card.rank = new_rank
 
             # Verificar se moveu para última coluna (tarefa concluída)
             # Usa position da coluna ao invés de verificar nomes específicos
-            last_column = CardService._get_last_column(db, card.project_id)
-
-            if last_column and target_column.id == last_column.id:
+            if target_is_last:
                 # Moveu para última coluna - marcar como concluída
                 card.completed_at = datetime.utcnow()
             else:
                 # Não está na última coluna - limpar data de conclusão
                 card.completed_at = None
 
-        # Se mudou apenas a posição na mesma coluna
-        elif old_position != new_position:
-            CardService._reorder_cards_in_column(db, new_column_id, old_position, new_position)
-            card.position = new_position
-
-        db.commit()
-        db.refresh(card)
+        # Mesma coluna: só muda a rank se o card ainda não estiver na posição de destino
+        else:
+            new_rank = CardService._rank_for_position(db, new_column_id, new_position, card.id, card.rank)
+            if new_rank is not None:
+                card.rank = new_rank
 
-        # Registrar histórico de movimentação (apenas se mudou de coluna)
+        # Registrar histórico de movimentação (apenas se mudou de coluna), na mesma transação
         if old_column_id != new_column_id:
             CardHistoryService.create_history_entry(
                 db=db,
@@ -382,7 +454,11 @@ class CardService:
                     "to_column": target_column.title
                 }
             )
-            db.commit()
+
+        db.commit()
+        db.refresh(card)
+        if new_rank is not None:
+            CardService._check_rank_length(new_column_id, new_rank)
 
         return card
 
@@ -408,27 +484,6 @@ class CardService:
 
     # === MÉTODOS AUXILIARES ===
 
-    @staticmethod
-    def _get_last_column(db: Session, project_id: int) -> Optional[KanbanColumn]:
-        """
-        Retorna a última coluna de um projeto (coluna com maior position)
-
-        Args:
-            db: Sessão do banco de dados
-            project_id: ID do projeto
-
-        Returns:
-            Última coluna do projeto ou None se projeto não tem colunas
-        """
-        last_column = db.query(KanbanColumn).filter(
-            KanbanColumn.project_id == project_id
-        ).order_by(
-            KanbanColumn.position.desc(),
-            KanbanColumn.id.desc()  # Desempate por ID
-        ).first()
-
-        return last_column
-
     @staticmethod
     def _add_assignees(db: Session, card: Card, assignee_ids: List[int], project_id: int):
         """Adicionar usuários atribuídos ao card"""
@@ -456,60 +511,158 @@ class CardService:
 
         card.assignees.extend(users)
 
+    # === POSIÇÃO / RANK ===
+
     @staticmethod
-    def _adjust_positions_on_insert(db: Session, column_id: int, insert_position: int):
-        """Ajustar posições quando inserir novo card"""
+    def populate_positions(db: Session, cards: Iterable[Card], complete: bool = False) -> None:
+        """
+        Preenche card.position das tarefas carregadas, sem uma contagem por card
 
-        cards_to_update = db.query(Card).filter(
-            and_(
-                Card.column_id == column_id,
-                Card.position >= insert_position
-            )
-        ).all()
+        - complete=True: a lista tem todos os cards de cada coluna, já em ordem de rank
+        - complete=False (lista filtrada): uma consulta com row_number() nas colunas envolvidas
+        """
+        cards = list(cards)
+        if complete:
+            counters = {}
+            for card in cards:
+                index = counters.get(card.column_id, 0)
+                set_committed_value(card, "position", index)
+                counters[card.column_id] = index + 1
+            return
 
-        for card in cards_to_update:
-            card.position += 1
+        column_ids = sorted({card.column_id for card in cards})
+        if not column_ids:
+            return
+
+        position = func.row_number().over(
+            partition_by=Card.column_id,
+            order_by=(Card.rank, Card.id)
+        ) - 1
+        positions = dict(db.execute(
+            select(Card.id, position).where(Card.column_id.in_(column_ids))
+        ).all())
+        for card in cards:
+            set_committed_value(card, "position", positions.get(card.id, 0))
 
     @staticmethod
-    def _adjust_positions_on_delete(db: Session, column_id: int, deleted_position: int):
-        """Ajustar posições quando deletar card"""
+    def _neighbor_ranks(
+            db: Session,
+            column_id: int,
+            position: Optional[int],
+            exclude_card_id: Optional[int] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Ranks dos cards que ficarão antes e depois da posição na coluna
+        (sem contar o próprio card, quando ele está sendo movido)
+        """
+        conditions = [Card.column_id == column_id]
+        if exclude_card_id is not None:
+            conditions.append(Card.id != exclude_card_id)
+
+        if position is not None:
+            neighbors = db.execute(
+                select(Card.rank)
+                .where(*conditions)
+                .order_by(Card.rank, Card.id)
+                .offset(max(position - 1, 0))
+                .limit(2)
+            ).scalars().all()
+
+            if position == 0:
+                return None, neighbors[0] if neighbors else None
+            if neighbors:
+                return neighbors[0], neighbors[1] if len(neighbors) > 1 else None
+
+        # Sem posição ou além do fim da coluna: vai para o final
+        last_rank = db.execute(select(func.max(Card.rank)).where(*conditions)).scalar()
+        return last_rank, None
 
-        cards_to_update = db.query(Card).filter(
-            and_(
-                Card.column_id == column_id,
-                Card.position > deleted_position
-            )
-        ).all()
+    @staticmethod
+    def _rank_for_position(
+            db: Session,
+            column_id: int,
+            position: Optional[int],
+            exclude_card_id: Optional[int] = None,
+            current_rank: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Rank para colocar um card na posição da coluna (None = última)
 
-        for card in cards_to_update:
-            card.position -= 1
+        Com current_rank (card movido na própria coluna): retorna None se essa
+        rank já fica entre os vizinhos da posição, ou seja, o card não sai do lugar
+        """
+        before, after = CardService._neighbor_ranks(db, column_id, position, exclude_card_id)
+        if current_rank is not None and (before is None or before < current_rank) and (
+                after is None or current_rank < after):
+            return None
+        if before is not None and after is not None and before >= after:
+            # Ranks repetidas (escritas concorrentes): redistribui a coluna agora e recalcula
+            CardService.rebalance_column(db, column_id)
+            before, after = CardService._neighbor_ranks(db, column_id, position, exclude_card_id)
+        return rank_between(before, after)
 
     @staticmethod
-    def _reorder_cards_in_column(db: Session, column_id: int, old_position: int, new_position: int):
-        """Reordenar cards quando mover dentro da mesma coluna"""
-
-        if old_position < new_position:
-            # Mover para frente
-            cards_to_update = db.query(Card).filter(
-                and_(
-                    Card.column_id == column_id,
-                    Card.position > old_position,
-                    Card.position <= new_position
-                )
-            ).all()
+    def rebalance_column(db: Session, column_id: int) -> int:
+        """
+        Reescreve as ranks da coluna com chaves curtas e igualmente espaçadas
 
-            for card in cards_to_update:
-                card.position -= 1
+        A ordem (e portanto as posições) não muda, então updated_at e
+        board_version ficam como estão. Não faz commit. Retorna quantos cards
+        foram reescritos.
+        """
+        card_ids = db.execute(
+            select(Card.id)
+            .where(Card.column_id == column_id)
+            .order_by(Card.rank, Card.id)
+            .with_for_update()
+        ).scalars().all()
+        if not card_ids:
+            return 0
+
+        cards = Card.__table__
+        db.execute(
+            update(cards)
+            .where(cards.c.id == bindparam("card_id"))
+            .values(rank=bindparam("new_rank"), updated_at=cards.c.updated_at),
+            [
+                {"card_id": card_id, "new_rank": rank}
+                for card_id, rank in zip(card_ids, rebalanced_ranks(len(card_ids)))
+            ]
+        )
 
-        else:
-            # Mover para trás
-            cards_to_update = db.query(Card).filter(
-                and_(
-                    Card.column_id == column_id,
-                    Card.position >= new_position,
-                    Card.position < old_position
-                )
-            ).all()
+        # Cards já carregados nesta sessão voltam a ler a rank do banco
+        for obj in list(db.identity_map.values()):
+            if isinstance(obj, Card) and obj.id in card_ids:
+                db.expire(obj, ["rank"])
+        return len(card_ids)
 
-            for card in cards_to_update:
-                card.position += 1
\ No newline at end of file
+    @staticmethod
+    def _check_rank_length(column_id: int, rank: str) -> None:
+        """Agenda o rebalanceamento da coluna quando a rank gerada ficou longa demais"""
+        if len(rank) > settings.CARD_RANK_REBALANCE_LENGTH:
+            CardService.schedule_rebalance(column_id)
+
+    @staticmethod
+    def schedule_rebalance(column_id: int) -> None:
+        """Rebalanceia a coluna em segundo plano (ignora se já estiver na fila)"""
+        with _rebalance_lock:
+            if column_id in _rebalance_pending:
+                return
+            _rebalance_pending.add(column_id)
+        _rebalance_executor.submit(CardService._run_rebalance, column_id)
+
+    @staticmethod
+    def _run_rebalance(column_id: int) -> None:
+        with _rebalance_lock:
+            _rebalance_pending.discard(column_id)
+
+        db = database.SessionLocal()
+        try:
+            count = CardService.rebalance_column(db, column_id)
+            db.commit()
+            logger.info("Ranks da coluna %s rebalanceadas (%s cards)", column_id, count)
+        except Exception:
+            db.rollback()
+            logger.exception("Falha ao rebalancear as ranks da coluna %s", column_id)
+        finally:
+            db.close()
@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 
@@ -10,7 +12,7 @@ from app.models.user import User
 from app.models.notification import Notification, NotificationType
 from app.schemas.chat import (
     ChatMessageCreate, ChatMessageUpdate, ChatMessageResponse,
-    ChatMessageSender, ChatMessageListResponse
+    ChatMessageSender
 )
 from app.services.chat_service import ChatService
 
@@ -35,11 +37,12 @@ class ChatMessageService:
         return time_since_creation <= timedelta(minutes=ChatMessageService.EDIT_TIME_LIMIT_MINUTES)
 
     @staticmethod
-    def _create_message_notifications(db: Session, message: ChatMessage, chat: Chat) -> None:
+    def _build_message_notifications(message: ChatMessage, chat: Chat, sender: Optional[User]) -> List[Notification]:
         """
-        Cria notificações para participantes do chat (exceto remetente)
+        Monta notificações para participantes do chat (exceto remetente)
+        Não acessa relacionamentos lazy, podendo ser usado com sessão assíncrona
         """
-        sender = message.sender
+        notifications = []
 
         for participant in chat.participants:
             # Não notificar o próprio remetente
@@ -49,15 +52,50 @@ class ChatMessageService:
             # Nome do chat para contexto
             chat_name = chat.get_chat_name_for_user(participant.id)
 
-            notification = Notification(
+            notifications.append(Notification(
                 type=NotificationType.SYSTEM,
                 title=f"Nova mensagem em {chat_name}",
                 message=f"{sender.name if sender else 'Alguém'}: {message.content[:50]}{'...' if len(message.content) > 50 else ''}",
                 recipient_user_id=participant.id,
                 action_url=f"/chats/{chat.id}"
+            ))
+
+        return notifications
+
+    @staticmethod
+    def _create_message_notifications(db: Session, message: ChatMessage, chat: Chat) -> None:
+        """
+        Cria notificações para participantes do chat (exceto remetente)
+        """
+        db.add_all(ChatMessageService._build_message_notifications(message, chat, message.sender))
+
+    @staticmethod
+    def _build_sent_message_response(message: ChatMessage, sender: Optional[User], sender_id: int) -> ChatMessageResponse:
+        """
+        Monta a resposta de uma mensagem recém-enviada
+        """
+        sender_data = None
+        if sender:
+            sender_data = ChatMessageSender(
+                id=sender.id,
+                name=sender.name,
+                email=sender.email
             )
 
-            db.add(notification)
+        return ChatMessageResponse(
+            id=message.id,
+            chat_id=message.chat_id,
+            sender_id=message.sender_id,
+            content=message.content,
+            created_at=message.created_at,
+            updated_at=message.updated_at,
+            is_edited=message.is_edited,
+            edited_at=message.edited_at,
+            sender=sender_data,
+            attachments=[],
+            can_edit=ChatMessageService._can_modify_message(message, sender_id),
+            can_delete=ChatMessageService._can_modify_message(message, sender_id)
+        )
 
     @staticmethod
     def send_message(db: Session, chat_id: int, message_data: ChatMessageCreate, sender_id: int) -> ChatMessageResponse:
@@ -109,29 +147,69 @@ class ChatMessageService:
         ChatService.update_last_read(db, chat_id, sender_id)
 
         # Montar response
-        sender_data = None
-        if sender:
-            sender_data = ChatMessageSender(
-                id=sender.id,
-                name=sender.name,
-                email=sender.email
+        return ChatMessageService._build_sent_message_response(message, sender, sender_id)
+
+    @staticmethod
+    async def send_message_async(
+        db: AsyncSession,
+        chat_id: int,
+        message_data: ChatMessageCreate,
+        sender_id: int
+    ) -> ChatMessageResponse:
+        """
+        Versão assíncrona de send_message (usada pelo WebSocket e pelo POST de mensagens)
+        Persiste mensagem, notificações e última leitura em uma única transação
+        sem bloquear o event loop
+        """
+        # Verificar se usuário tem acesso ao chat
+        if not await ChatService._can_access_chat_async(db, chat_id, sender_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Você não tem acesso a este chat"
             )
 
-        return ChatMessageResponse(
-            id=message.id,
-            chat_id=message.chat_id,
-            sender_id=message.sender_id,
-            content=message.content,
-            created_at=message.created_at,
-            updated_at=message.updated_at,
-            is_edited=message.is_edited,
-            edited_at=message.edited_at,
-            sender=sender_data,
-            attachments=[],
-            can_edit=ChatMessageService._can_modify_message(message, sender_id),
-            can_delete=ChatMessageService._can_modify_message(message, sender_id)
+        # Buscar chat
+        result = await db.execute(
+            select(Chat).where(Chat.id == chat_id).options(selectinload(Chat.participants))
+        )
+        chat = result.scalars().first()
+
+        if not chat:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Chat não encontrado"
+            )
+
+        # Buscar sender (normalmente já está no identity map via participants)
+        sender = await db.get(User, sender_id)
+
+        # Criar mensagem
+        message = ChatMessage(
+            chat_id=chat_id,
+            sender_id=sender_id,
+            content=message_data.content,
+            is_edited=False
         )
 
+        db.add(message)
+
+        # Atualizar updated_at do chat
+        chat.updated_at = datetime.utcnow()
+
+        await db.flush()
+
+        # Criar notificações para participantes
+        db.add_all(ChatMessageService._build_message_notifications(message, chat, sender))
+
+        # Marcar como lida automaticamente para o remetente
+        await ChatService.update_last_read_async(db, chat_id, sender_id, commit=False)
+
+        await db.commit()
+        await db.refresh(message)
+
+        # Montar response
+        return ChatMessageService._build_sent_message_response(message, sender, sender_id)
+
     @staticmethod
     def get_chat_messages(
         db: Session,
@@ -139,9 +217,13 @@ class ChatMessageService:
         user_id: int,
         limit: int = 50,
         offset: int = 0
-    ) -> ChatMessageListResponse:
+    ) -> dict:
         """
         Busca mensagens de um chat (paginadas, mais recentes primeiro)
+
+        Retorna um dict no formato de ChatMessageListResponse, montado direto
+        das linhas do banco (sem validação do Pydantic) para ser serializado
+        com ORJSONResponse
         """
         # Verificar acesso
         if not ChatService._can_access_chat(db, chat_id, user_id):
@@ -163,59 +245,62 @@ class ChatMessageService:
             ChatMessage.created_at.desc()
         ).limit(limit).offset(offset).all()
 
-        # Montar response
-        messages_response = []
-        for message in messages:
-            sender_data = None
-            if message.sender:
-                sender_data = ChatMessageSender(
-                    id=message.sender.id,
-                    name=message.sender.name,
-                    email=message.sender.email
-                )
-
-            # Serializar anexos
-            attachments_data = []
-            if message.attachments:
-                for attachment in message.attachments:
-                    attachments_data.append({
-                        "id": attachment.id,
-                        "filename": attachment.filename,
-                        "file_path": attachment.file_path,
-                        "file_size": attachment.file_size,
-                        "mime_type": attachment.mime_type,
-                        "message_id": attachment.message_id,
-                        "uploaded_by_id": attachment.uploaded_by_id,
-                        "created_at": attachment.created_at,
-                        "uploaded_by": {
-                            "id": attachment.uploaded_by.id,
-                            "name": attachment.uploaded_by.name,
-                            "email": attachment.uploaded_by.email
-                        } if attachment.uploaded_by else None
-                    })
-
-            messages_response.append(ChatMessageResponse(
-                id=message.id,
-                chat_id=message.chat_id,
-                sender_id=message.sender_id,
-                content=message.content,
-                created_at=message.created_at,
-                updated_at=message.updated_at,
-                is_edited=message.is_edited,
-                edited_at=message.edited_at,
-                sender=sender_data,
-                attachments=attachments_data,
-                can_edit=ChatMessageService._can_modify_message(message, user_id),
-                can_delete=ChatMessageService._can_modify_message(message, user_id)
-            ))
+        messages_response = [
+            ChatMessageService._message_response_dict(message, user_id)
+            for message in messages
+        ]
 
         has_more = (offset + limit) < total
 
-        return ChatMessageListResponse(
-            total=total,
-            messages=messages_response,
-            has_more=has_more
-        )
+        return {
+            "total": total,
+            "messages": messages_response,
+            "has_more": has_more
+        }
+
+    @staticmethod
+    def _message_response_dict(message: ChatMessage, user_id: int) -> dict:
+        """
+        Mensagem ORM -> dict no formato de ChatMessageResponse
+        """
+        sender = message.sender
+        can_modify = ChatMessageService._can_modify_message(message, user_id)
+
+        return {
+            "content": message.content,
+            "id": message.id,
+            "chat_id": message.chat_id,
+            "sender_id": message.sender_id,
+            "created_at": message.created_at,
+            "updated_at": message.updated_at,
+            "is_edited": message.is_edited,
+            "edited_at": message.edited_at,
+            "sender": {
+                "id": sender.id,
+                "name": sender.name,
+                "email": sender.email
+            } if sender else None,
+            "attachments": [
+                {
+                    "id": attachment.id,
+                    "filename": attachment.filename,
+                    "file_path": attachment.file_path,
+                    "file_size": attachment.file_size,
+                    "mime_type": attachment.mime_type,
+                    "message_id": attachment.message_id,
+                    "uploaded_by_id": attachment.uploaded_by_id,
+                    "created_at": attachment.created_at,
+                    "uploaded_by": {
+                        "id": attachment.uploaded_by.id,
+                        "name": attachment.uploaded_by.name,
+                        "email": attachment.uploaded_by.email
+                    } if attachment.uploaded_by else None
+                }
+                for attachment in message.attachments
+            ],
+            "can_edit": can_modify,
+            "can_delete": can_modify
+        }
 
     @staticmethod
     def edit_message(
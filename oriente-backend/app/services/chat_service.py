@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, func, select
 from typing import List, Optional
 from datetime import datetime
@@ -33,6 +34,22 @@ class ChatService:
 
         return result is not None
 
+    @staticmethod
+    async def _can_access_chat_async(db: AsyncSession, chat_id: int, user_id: int) -> bool:
+        """
+        Versão assíncrona de _can_access_chat (usada pelo WebSocket)
+        """
+        result = await db.execute(
+            select(chat_participants.c.chat_id).where(
+                and_(
+                    chat_participants.c.chat_id == chat_id,
+                    chat_participants.c.user_id == user_id
+                )
+            )
+        )
+
+        return result.first() is not None
+
     @staticmethod
     def _calculate_unread_count(db: Session, chat_id: int, user_id: int) -> int:
         """
@@ -455,6 +472,31 @@ class ChatService:
 
         db.commit()
 
+    @staticmethod
+    async def update_last_read_async(db: AsyncSession, chat_id: int, user_id: int, commit: bool = True) -> None:
+        """
+        Versão assíncrona de update_last_read (usada pelo WebSocket)
+        """
+        # Verificar permissão
+        if not await ChatService._can_access_chat_async(db, chat_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Você não tem acesso a este chat"
+            )
+
+        # Atualizar last_read_at
+        await db.execute(
+            chat_participants.update().where(
+                and_(
+                    chat_participants.c.chat_id == chat_id,
+                    chat_participants.c.user_id == user_id
+                )
+            ).values(last_read_at=datetime.utcnow())
+        )
+
+        if commit:
+            await db.commit()
+
     @staticmethod
     def update_group_name(db: Session, chat_id: int, new_name: str, user_id: int) -> Chat:
         """
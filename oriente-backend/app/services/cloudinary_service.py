@@ -1,10 +1,11 @@
 """
 Serviço de upload de arquivos usando Cloudinary
 Usado em produção para armazenamento persistente de anexos
+
+O SDK do Cloudinary só é importado no primeiro uso (ou no warm-up após o
+startup), e nunca quando o Cloudinary não está configurado.
 """
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
+import threading
 from app.core.config import settings
 from typing import Optional, Dict
 import os
@@ -16,14 +17,31 @@ class CloudinaryService:
     """
 
     def __init__(self):
-        """Inicializa configuração do Cloudinary"""
-        if settings.use_cloudinary:
-            cloudinary.config(
-                cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-                api_key=settings.CLOUDINARY_API_KEY,
-                api_secret=settings.CLOUDINARY_API_SECRET,
-                secure=True
-            )
+        self._sdk = None
+        self._lock = threading.Lock()
+
+    def sdk(self):
+        """
+        Importa e configura o SDK do Cloudinary (uma única vez)
+
+        Returns:
+            Módulo cloudinary, com uploader e utils carregados
+        """
+        if self._sdk is None:
+            with self._lock:
+                if self._sdk is None:
+                    import cloudinary
+                    import cloudinary.uploader
+                    import cloudinary.utils
+
+                    cloudinary.config(
+                        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+                        api_key=settings.CLOUDINARY_API_KEY,
+                        api_secret=settings.CLOUDINARY_API_SECRET,
+                        secure=True
+                    )
+                    self._sdk = cloudinary
+        return self._sdk
 
     def upload_file(
         self,
@@ -60,7 +78,7 @@ class CloudinaryService:
         if public_id:
             upload_options["public_id"] = public_id
 
-        result = cloudinary.uploader.upload(file_path, **upload_options)
+        result = self.sdk().uploader.upload(file_path, **upload_options)
 
         return {
             "url": result.get("secure_url"),
@@ -124,7 +142,7 @@ class CloudinaryService:
         if not settings.use_cloudinary:
             raise Exception("Cloudinary não está configurado.")
 
-        result = cloudinary.uploader.destroy(public_id, resource_type=resource_type)
+        result = self.sdk().uploader.destroy(public_id, resource_type=resource_type)
         return result
 
     def get_file_url(
@@ -149,7 +167,7 @@ class CloudinaryService:
         if transformation:
             options["transformation"] = transformation
 
-        url, _ = cloudinary.utils.cloudinary_url(public_id, **options)
+        url, _ = self.sdk().utils.cloudinary_url(public_id, **options)
         return url
 
     def is_configured(self) -> bool:
@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import func, select
 from typing import List, Optional
 from fastapi import HTTPException, status
 
+from app.core.board_version import bump_board_version, get_board_version
+from app.core.column_cache import column_cache
+from app.models.board_change import BoardChange
 from app.models.Column import KanbanColumn
-from app.models.Card import Card
+from app.models.Card import Card, CardStatus, card_assignees
 from app.models.project import Project
+from app.models.user import User
 from app.schemas.Column import ColumnCreate, ColumnUpdate, ColumnMove
+from app.services.card_service import CardService
 from app.services.project_service import ProjectService
 
 
@@ -54,6 +59,7 @@ class ColumnService:
         db.add(column)
         db.commit()
         db.refresh(column)
+        column_cache.invalidate(project_id)
 
         return column
 
@@ -74,8 +80,185 @@ class ColumnService:
             joinedload(KanbanColumn.cards).joinedload(Card.assignees)
         ).order_by(KanbanColumn.position).all()
 
+        # column.cards traz todos os cards da coluna em ordem de rank
+        for column in columns:
+            CardService.populate_positions(db, column.cards, complete=True)
+
         return columns
 
+    @staticmethod
+    def get_board(db: Session, project_id: int, user_id: int) -> dict:
+        """
+        Board do projeto (colunas com as tarefas ativas) montado por projeção
+
+        Seleciona só os campos que o board retorna, sem instanciar objetos ORM:
+        uma consulta para as colunas, uma para os cards ativos (status filtrado
+        no SQL, posição por row_number() sobre todos os cards da coluna, como
+        em CardService.populate_positions) e uma para os responsáveis, que são
+        agrupados por card.
+        """
+        ColumnService._check_board_access(db, project_id, user_id)
+
+        cards_by_column = {}
+        for card in ColumnService._board_cards(db, project_id):
+            cards_by_column.setdefault(card.pop("column_id"), []).append(card)
+
+        board = [
+            {**column, "cards": cards_by_column.get(column["id"], [])}
+            for column in ColumnService._board_columns(db, project_id)
+        ]
+        return {"board": board, "total_columns": len(board)}
+
+    @staticmethod
+    def get_board_changes(db: Session, project_id: int, user_id: int, since: int) -> dict:
+        """
+        Alterações do board depois da versão `since` (board_changes)
+
+        Retorna o estado atual (mesmos campos do board) das colunas alteradas e,
+        em `card_column_ids`, as colunas onde algum card entrou, mudou ou saiu
+        do board: `cards` traz todos os cards ativos dessas colunas, na ordem,
+        e o cliente substitui a lista inteira de cada uma (as posições dos
+        vizinhos também mudam). Os ids das colunas/cards removidos ou que saíram
+        do board (arquivados/deletados) vêm nos tombstones; de uma coluna fora
+        de `card_column_ids` o cliente só remove os cards que aparecem na
+        resposta e renumera as posições. `full_reload` indica que o log não
+        cobre o intervalo (versão antiga demais ou alteração sem detalhe) e o
+        cliente deve buscar o board inteiro.
+        """
+        ColumnService._check_board_access(db, project_id, user_id)
+
+        version = get_board_version(db, project_id)
+        response = {
+            "version": version,
+            "since": since,
+            "full_reload": False,
+            "columns": [],
+            "deleted_column_ids": [],
+            "card_column_ids": [],
+            "cards": [],
+            "deleted_card_ids": [],
+        }
+        if since == version:
+            return response
+        if since > version:
+            response["full_reload"] = True
+            return response
+
+        changes = db.execute(
+            select(BoardChange.version, BoardChange.entity, BoardChange.entity_id, BoardChange.deleted)
+            .where(
+                BoardChange.project_id == project_id,
+                BoardChange.version > since,
+                BoardChange.version <= version
+            )
+            .order_by(BoardChange.version, BoardChange.id)
+        ).all()
+
+        # O log precisa começar na versão seguinte à do cliente (versões antigas são podadas)
+        if not changes or changes[0].version != since + 1 or any(c.entity == "board" for c in changes):
+            response["full_reload"] = True
+            return response
+
+        # Último estado de cada entidade no intervalo
+        latest = {}
+        all_columns = False
+        for change in changes:
+            if change.entity == "column" and change.entity_id is None:
+                all_columns = True
+            else:
+                latest[(change.entity, change.entity_id)] = change.deleted
+
+        changed = {"card": set(), "column": set()}
+        deleted = {"card": set(), "column": set()}
+        for (entity, entity_id), was_deleted in latest.items():
+            (deleted if was_deleted else changed)[entity].add(entity_id)
+        card_ids = changed["card"] | deleted["card"]
+        column_ids = sorted(changed["column"])
+
+        # Colunas atuais dos cards alterados (ainda existentes, mesmo arquivados)
+        card_column_ids = sorted(db.scalars(
+            select(Card.column_id).distinct().where(Card.project_id == project_id, Card.id.in_(card_ids))
+        )) if card_ids else []
+        cards = ColumnService._board_cards(db, project_id, card_column_ids) if card_column_ids else []
+        columns = []
+        if all_columns or column_ids:
+            columns = ColumnService._board_columns(db, project_id, None if all_columns else column_ids)
+
+        found_cards = {card["id"] for card in cards}
+        found_columns = {column["id"] for column in columns}
+        response["card_column_ids"] = card_column_ids
+        response["cards"] = cards
+        response["columns"] = columns
+        # Cards arquivados/deletados (ou de outra coluna removida) saem do board como remoções
+        response["deleted_card_ids"] = sorted(deleted["card"] | (changed["card"] - found_cards))
+        response["deleted_column_ids"] = sorted(deleted["column"] | (changed["column"] - found_columns))
+        return response
+
+    @staticmethod
+    def _check_board_access(db: Session, project_id: int, user_id: int) -> None:
+        if not ProjectService.user_can_access_project(db, project_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Sem permissão para acessar este projeto"
+            )
+
+    @staticmethod
+    def _board_columns(db: Session, project_id: int, column_ids: Optional[List[int]] = None) -> List[dict]:
+        """Colunas do board (sem os cards), em ordem de posição"""
+        query = select(
+            KanbanColumn.id, KanbanColumn.title, KanbanColumn.color, KanbanColumn.position
+        ).where(KanbanColumn.project_id == project_id)
+        if column_ids is not None:
+            query = query.where(KanbanColumn.id.in_(column_ids))
+
+        return [
+            {"id": column.id, "title": column.title, "color": column.color, "position": column.position}
+            for column in db.execute(query.order_by(KanbanColumn.position, KanbanColumn.id))
+        ]
+
+    @staticmethod
+    def _board_cards(db: Session, project_id: int, column_ids: Optional[List[int]] = None) -> List[dict]:
+        """Cards ativos do board (com column_id e responsáveis), por coluna e posição"""
+        numbered = select(
+            Card.id, Card.title, Card.description, Card.priority, Card.due_date,
+            Card.status, Card.column_id,
+            (func.row_number().over(partition_by=Card.column_id, order_by=(Card.rank, Card.id)) - 1).label("position")
+        ).where(Card.project_id == project_id).subquery()
+
+        query = select(
+            numbered.c.id, numbered.c.title, numbered.c.description, numbered.c.priority,
+            numbered.c.position, numbered.c.due_date, numbered.c.column_id
+        ).where(numbered.c.status == CardStatus.ACTIVE)
+        assignee_query = (
+            select(card_assignees.c.card_id, User.id, User.name)
+            .join(User, User.id == card_assignees.c.user_id)
+            .join(Card, Card.id == card_assignees.c.card_id)
+            .where(Card.project_id == project_id, Card.status == CardStatus.ACTIVE)
+        )
+        if column_ids is not None:
+            query = query.where(numbered.c.column_id.in_(column_ids))
+            assignee_query = assignee_query.where(Card.column_id.in_(column_ids))
+
+        assignees = {}
+        for card_id, assignee_id, assignee_name in db.execute(
+            assignee_query.order_by(card_assignees.c.card_id, User.id)
+        ):
+            assignees.setdefault(card_id, []).append({"id": assignee_id, "name": assignee_name})
+
+        return [
+            {
+                "id": card.id,
+                "title": card.title,
+                "description": card.description,
+                "priority": card.priority,
+                "position": card.position,
+                "due_date": card.due_date,
+                "assignees": assignees.get(card.id, []),
+                "column_id": card.column_id
+            }
+            for card in db.execute(query.order_by(numbered.c.column_id, numbered.c.position))
+        ]
+
     @staticmethod
     def get_column_by_id(db: Session, column_id: int, user_id: int) -> KanbanColumn:
         """Buscar coluna por ID"""
@@ -116,6 +299,7 @@ class ColumnService:
 
         db.commit()
         db.refresh(column)
+        column_cache.invalidate(column.project_id)
 
         return column
 
@@ -149,6 +333,7 @@ class ColumnService:
         ColumnService._adjust_positions_on_delete(db, project_id, position)
 
         db.commit()
+        column_cache.invalidate(project_id)
         return True
 
     @staticmethod
@@ -177,6 +362,7 @@ class ColumnService:
         column.position = new_position
         db.commit()
         db.refresh(column)
+        column_cache.invalidate(column.project_id)
 
         return column
 
@@ -202,6 +388,7 @@ class ColumnService:
             created_columns.append(column)
 
         db.commit()
+        column_cache.invalidate(project_id)
 
         for column in created_columns:
             db.refresh(column)
@@ -210,33 +397,36 @@ class ColumnService:
 
     # === MÉTODOS AUXILIARES ===
 
+    @staticmethod
+    def _shift_positions(db: Session, project_id: int, delta: int, *conditions) -> int:
+        """
+        UPDATE kanban_columns SET position = position + delta WHERE project_id = ... AND conditions
+
+        Um único statement, sem carregar as colunas. synchronize_session="evaluate"
+        aplica a mesma alteração às colunas já carregadas na sessão. UPDATE em massa
+        não passa pelo flush, então o board_version é incrementado aqui.
+        """
+        shifted = db.query(KanbanColumn).filter(
+            KanbanColumn.project_id == project_id,
+            *conditions
+        ).update(
+            {KanbanColumn.position: KanbanColumn.position + delta},
+            synchronize_session="evaluate"
+        )
+        if shifted:
+            # Log sem ids: o delta do board devolve todas as colunas do projeto
+            bump_board_version(db, [project_id], [(project_id, "column", None, False)])
+        return shifted
+
     @staticmethod
     def _adjust_positions_on_insert(db: Session, project_id: int, insert_position: int):
         """Ajustar posições quando inserir nova coluna"""
-
-        columns_to_update = db.query(KanbanColumn).filter(
-            and_(
-                KanbanColumn.project_id == project_id,
-                KanbanColumn.position >= insert_position
-            )
-        ).all()
-
-        for column in columns_to_update:
-            column.position += 1
+        ColumnService._shift_positions(db, project_id, 1, KanbanColumn.position >= insert_position)
 
     @staticmethod
     def _adjust_positions_on_delete(db: Session, project_id: int, deleted_position: int):
         """Ajustar posições quando deletar coluna"""
-
-        columns_to_update = db.query(KanbanColumn).filter(
-            and_(
-                KanbanColumn.project_id == project_id,
-                KanbanColumn.position > deleted_position
-            )
-        ).all()
-
-        for column in columns_to_update:
-            column.position -= 1
+        ColumnService._shift_positions(db, project_id, -1, KanbanColumn.position > deleted_position)
 
     @staticmethod
     def _reorder_columns(db: Session, project_id: int, old_position: int, new_position: int):
@@ -244,27 +434,15 @@ class ColumnService:
 
         if old_position < new_position:
             # Mover para frente: diminuir posição das colunas intermediárias
-            columns_to_update = db.query(KanbanColumn).filter(
-                and_(
-                    KanbanColumn.project_id == project_id,
-                    KanbanColumn.position > old_position,
-                    KanbanColumn.position <= new_position
-                )
-            ).all()
-
-            for column in columns_to_update:
-                column.position -= 1
-
+            ColumnService._shift_positions(
+                db, project_id, -1,
+                KanbanColumn.position > old_position,
+                KanbanColumn.position <= new_position
+            )
         else:
             # Mover para trás: aumentar posição das colunas intermediárias
-            columns_to_update = db.query(KanbanColumn).filter(
-                and_(
-                    KanbanColumn.project_id == project_id,
-                    KanbanColumn.position >= new_position,
-                    KanbanColumn.position < old_position
-                )
-            ).all()
-
-            for column in columns_to_update:
-                column.position += 1
-
+            ColumnService._shift_positions(
+                db, project_id, 1,
+                KanbanColumn.position >= new_position,
+                KanbanColumn.position < old_position
+            )
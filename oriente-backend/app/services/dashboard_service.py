@@ -0,0 +1,202 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, exists, func, or_, select
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+
+from app.core.http_cache import make_etag
+from app.models.Card import Card, CardStatus, card_assignees
+from app.models.Column import KanbanColumn
+from app.models.project import Project, project_members
+from app.schemas.dashboard import DashboardStageEnum
+
+# Janela de "vencendo em breve" (mesma do filtro due_soon de GET /cards)
+DUE_SOON_DAYS = 7
+
+
+class DashboardService:
+    """
+    Dados do dashboard do usuário em um número fixo de consultas agregadas
+
+    1. projetos do usuário (com board_version, que também forma a versão)
+    2. colunas desses projetos com a contagem de tarefas ativas
+    3. vencidas / vencendo em breve por projeto
+    4. tarefas ativas atribuídas ao usuário
+
+    Se o cliente já tem a versão atual, só a consulta 1 é feita.
+    """
+
+    @staticmethod
+    def get_user_projects(db: Session, user_id: int) -> List[Tuple[int, str, int, object]]:
+        """(id, name, board_version, updated_at) dos projetos onde o usuário é owner ou membro"""
+        is_member = exists().where(and_(
+            project_members.c.project_id == Project.id,
+            project_members.c.user_id == user_id
+        ))
+        rows = db.execute(
+            select(Project.id, Project.name, Project.board_version, Project.updated_at)
+            .where(or_(Project.owner_id == user_id, is_member))
+            .order_by(Project.id)
+        ).all()
+        return [tuple(row) for row in rows]
+
+    @staticmethod
+    def compute_version(user_id: int, projects: List[tuple], today: datetime) -> str:
+        """
+        Versão dos dados do dashboard
+
+        Muda quando cards/colunas de algum projeto mudam (board_version), quando
+        o projeto é alterado, quando o usuário entra/sai de projetos ou quando
+        vira o dia (vencidas e vencendo em breve são contadas por dia)
+        """
+        marker = [(project_id, board_version, updated_at) for project_id, _, board_version, updated_at in projects]
+        return make_etag("dashboard", user_id, today.date().isoformat(), marker).strip('"')
+
+    @staticmethod
+    def get_dashboard(db: Session, user_id: int, version: Optional[str] = None) -> dict:
+        """
+        Monta o dashboard do usuário
+
+        - **version**: versão recebida numa resposta anterior; se ainda for a atual,
+          retorna apenas {"version", "unchanged": true}
+        """
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        projects = DashboardService.get_user_projects(db, user_id)
+        current_version = DashboardService.compute_version(user_id, projects, today)
+
+        if version is not None and version == current_version:
+            return {"version": current_version, "unchanged": True}
+
+        project_ids = [project[0] for project in projects]
+        columns_by_project: Dict[int, List[dict]] = {project_id: [] for project_id in project_ids}
+        stage_by_column: Dict[int, DashboardStageEnum] = {}
+        due_counts: Dict[int, Tuple[int, int]] = {}
+        assigned_cards: List[dict] = []
+
+        if project_ids:
+            for column in DashboardService._get_column_counts(db, project_ids):
+                columns_by_project[column["project_id"]].append(column)
+
+            completion_column_ids: Set[int] = set()
+            for columns in columns_by_project.values():
+                for index, column in enumerate(columns):
+                    column["stage"] = DashboardService._column_stage(index, len(columns))
+                    stage_by_column[column["id"]] = column["stage"]
+                    if column["stage"] == DashboardStageEnum.COMPLETED:
+                        completion_column_ids.add(column["id"])
+
+            due_counts = DashboardService._get_due_counts(db, project_ids, completion_column_ids, today)
+            assigned_cards = DashboardService._get_assigned_cards(db, project_ids, user_id)
+
+        project_names = {project[0]: project[1] for project in projects}
+        for card in assigned_cards:
+            card["project_name"] = project_names[card["project_id"]]
+            card["stage"] = stage_by_column.get(card["column_id"], DashboardStageEnum.PENDING)
+
+        return {
+            "version": current_version,
+            "unchanged": False,
+            "due_soon_days": DUE_SOON_DAYS,
+            "projects": [
+                {
+                    "id": project_id,
+                    "name": name,
+                    "columns": [
+                        {key: column[key] for key in ("id", "title", "position", "stage", "card_count")}
+                        for column in columns_by_project[project_id]
+                    ],
+                    "overdue_count": due_counts.get(project_id, (0, 0))[0],
+                    "due_soon_count": due_counts.get(project_id, (0, 0))[1],
+                }
+                for project_id, name, _, _ in projects
+            ],
+            "assigned_cards": assigned_cards,
+        }
+
+    @staticmethod
+    def _column_stage(index: int, total: int) -> DashboardStageEnum:
+        """Última coluna = concluído, primeira = pendente, as do meio = em andamento"""
+        if index == total - 1:
+            return DashboardStageEnum.COMPLETED
+        if index == 0:
+            return DashboardStageEnum.PENDING
+        return DashboardStageEnum.IN_PROGRESS
+
+    @staticmethod
+    def _get_column_counts(db: Session, project_ids: List[int]) -> List[dict]:
+        """Colunas dos projetos (em ordem) com a contagem de tarefas ativas"""
+        rows = db.execute(
+            select(
+                KanbanColumn.id, KanbanColumn.project_id, KanbanColumn.title, KanbanColumn.position,
+                func.count(Card.id)
+            )
+            .select_from(KanbanColumn)
+            .outerjoin(Card, and_(Card.column_id == KanbanColumn.id, Card.status == CardStatus.ACTIVE))
+            .where(KanbanColumn.project_id.in_(project_ids))
+            .group_by(KanbanColumn.id, KanbanColumn.project_id, KanbanColumn.title, KanbanColumn.position)
+            .order_by(KanbanColumn.project_id, KanbanColumn.position, KanbanColumn.id)
+        ).all()
+        return [
+            {"id": column_id, "project_id": project_id, "title": title, "position": position, "card_count": count}
+            for column_id, project_id, title, position, count in rows
+        ]
+
+    @staticmethod
+    def _get_due_counts(
+            db: Session,
+            project_ids: List[int],
+            completion_column_ids: Set[int],
+            today: datetime
+    ) -> Dict[int, Tuple[int, int]]:
+        """(vencidas, vencendo em breve) por projeto, ignorando a coluna de conclusão"""
+        due_soon_limit = today + timedelta(days=DUE_SOON_DAYS + 1)
+        query = (
+            select(
+                Card.project_id,
+                func.sum(case((Card.due_date < today, 1), else_=0)),
+                func.sum(case((and_(Card.due_date >= today, Card.due_date < due_soon_limit), 1), else_=0))
+            )
+            .where(
+                Card.project_id.in_(project_ids),
+                Card.status == CardStatus.ACTIVE,
+                Card.due_date.isnot(None)
+            )
+            .group_by(Card.project_id)
+        )
+        if completion_column_ids:
+            query = query.where(Card.column_id.notin_(sorted(completion_column_ids)))
+
+        return {
+            project_id: (int(overdue or 0), int(due_soon or 0))
+            for project_id, overdue, due_soon in db.execute(query).all()
+        }
+
+    @staticmethod
+    def _get_assigned_cards(db: Session, project_ids: List[int], user_id: int) -> List[dict]:
+        """Tarefas ativas atribuídas ao usuário, mais recentes primeiro"""
+        rows = db.execute(
+            select(
+                Card.id, Card.title, Card.priority, Card.status, Card.due_date,
+                Card.completed_at, Card.created_at, Card.column_id, Card.project_id
+            )
+            .join(card_assignees, card_assignees.c.card_id == Card.id)
+            .where(
+                card_assignees.c.user_id == user_id,
+                Card.project_id.in_(project_ids),
+                Card.status == CardStatus.ACTIVE
+            )
+            .order_by(Card.created_at.desc(), Card.id.desc())
+        ).all()
+        return [
+            {
+                "id": row.id,
+                "title": row.title,
+                "priority": row.priority.value,
+                "status": row.status.value,
+                "due_date": row.due_date,
+                "completed_at": row.completed_at,
+                "created_at": row.created_at,
+                "column_id": row.column_id,
+                "project_id": row.project_id,
+            }
+            for row in rows
+        ]
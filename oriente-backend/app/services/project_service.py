@@ -1,8 +1,10 @@
+from sqlalchemy import exists, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List, Optional
-from app.models.project import Project
-from app.models.user import User
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from app.models.project import Project, project_members
+from app.models.user import User, UserRole
 from app.schemas.project import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
@@ -11,6 +13,34 @@ from app.schemas.project import (
 )
 
 
+# Chave do cache de permissões em Session.info (a sessão vive uma requisição)
+_PERMISSIONS_KEY = "project_permissions"
+
+
+@dataclass(frozen=True)
+class ProjectPermission:
+    """
+    Relação do usuário com um projeto, resolvida uma vez por requisição
+    """
+    project_exists: bool
+    user_exists: bool
+    is_owner: bool
+    is_member: bool
+    user_role: Optional[UserRole]
+
+    @property
+    def can_access(self) -> bool:
+        """Owner ou membro do projeto"""
+        return self.project_exists and (self.is_owner or (self.user_exists and self.is_member))
+
+    @property
+    def can_edit(self) -> bool:
+        """Owner, membro do projeto, ou MANAGER"""
+        if not self.project_exists or not self.user_exists:
+            return False
+        return self.user_role == UserRole.MANAGER or self.is_owner or self.is_member
+
+
 class ProjectService:
     """
     Serviço de projetos
@@ -29,6 +59,9 @@ class ProjectService:
                 detail="Nome do projeto é obrigatório"
             )
 
+        # O usuário autenticado chega como snapshot; o relacionamento precisa do objeto ORM
+        owner = db.query(User).filter(User.id == owner.id).first()
+
         # Criar projeto com owner e team
         project = Project(
             name=request.name,
@@ -53,6 +86,7 @@ class ProjectService:
         db.add(project)
         db.commit()
         db.refresh(project)
+        ProjectService.clear_permission_cache(db)
 
         # Criar colunas padrão do Kanban (import aqui para evitar circular import)
         from app.services.column_service import ColumnService
@@ -74,11 +108,28 @@ class ProjectService:
         """
         # Buscar projetos onde o usuário é owner ou membro
         projects = db.query(Project).filter(
-            (Project.owner_id == user.id) | (Project.members.contains(user))
+            (Project.owner_id == user.id) | (Project.members.any(User.id == user.id))
         ).all()
 
         return [ProjectService._convert_to_project_summary(p) for p in projects]
 
+    @staticmethod
+    def get_user_projects_marker(user_id: int, db: Session) -> List[Tuple]:
+        """
+        (id, updated_at, updated_at do owner) dos projetos do usuário, para o
+        ETag de GET /api/projects
+
+        O owner entra porque ProjectSummary traz owner_email, que muda sem
+        alterar projects.updated_at. Consulta leve: não carrega owner nem membros.
+        """
+        rows = db.execute(
+            select(Project.id, Project.updated_at, User.updated_at)
+            .join(User, User.id == Project.owner_id)
+            .where((Project.owner_id == user_id) | Project.members.any(User.id == user_id))
+            .order_by(Project.id)
+        ).all()
+        return [tuple(row) for row in rows]
+
     @staticmethod
     def update_project(
         project_id: int,
@@ -144,6 +195,7 @@ class ProjectService:
 
         db.commit()
         db.refresh(project)
+        ProjectService.clear_permission_cache(db)
 
         return project
 
@@ -170,6 +222,7 @@ class ProjectService:
 
         db.delete(project)
         db.commit()
+        ProjectService.clear_permission_cache(db)
 
     @staticmethod
     def convert_to_project_response(project: Project) -> ProjectResponse:
@@ -228,52 +281,80 @@ class ProjectService:
         return users
 
     @staticmethod
-    def user_can_access_project(db: Session, project_id: int, user_id: int) -> bool:
-        """
-        Verifica se o usuário tem acesso ao projeto
-        (é owner ou membro do projeto)
+    def get_permission(db: Session, project_id: int, user_id: int) -> ProjectPermission:
         """
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            return False
+        Relação do usuário com o projeto, memorizada na sessão do banco
 
-        # Verificar se é owner
-        if project.owner_id == user_id:
-            return True
+        Como a sessão é criada por requisição (get_db), todas as verificações
+        de acesso/edição da mesma requisição reaproveitam o resultado,
+        em qualquer service que use ProjectService.
+        """
+        permissions: Dict[Tuple[int, int], ProjectPermission] = db.info.setdefault(_PERMISSIONS_KEY, {})
+        key = (project_id, user_id)
 
-        # Verificar se é membro
-        user = db.query(User).filter(User.id == user_id).first()
-        if user and user in project.members:
-            return True
+        permission = permissions.get(key)
+        if permission is None:
+            permission = ProjectService._resolve_permission(db, project_id, user_id)
+            permissions[key] = permission
 
-        return False
+        return permission
 
     @staticmethod
-    def user_can_edit_project(db: Session, project_id: int, user_id: int) -> bool:
+    def clear_permission_cache(db: Session) -> None:
         """
-        Verifica se o usuário tem permissão para editar o projeto
-        (owner, membro do projeto, ou MANAGER)
+        Descarta as permissões memorizadas na sessão
+        (chamar após alterar owner ou membros de um projeto)
         """
-        from app.models.user import UserRole
-
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            return False
+        db.info.pop(_PERMISSIONS_KEY, None)
 
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return False
+    @staticmethod
+    def _resolve_permission(db: Session, project_id: int, user_id: int) -> ProjectPermission:
+        """
+        Calcula a relação entre usuário e projeto em uma única consulta
 
-        # MANAGER pode editar qualquer projeto
-        if user.role == UserRole.MANAGER:
-            return True
+        Usa EXISTS na PK (project_id, user_id) de project_members em vez de
+        carregar a lista de membros do projeto.
+        """
+        is_member = exists().where(
+            project_members.c.project_id == project_id,
+            project_members.c.user_id == user_id
+        )
+        user_role = select(User.role).where(User.id == user_id).scalar_subquery()
+
+        row = db.execute(
+            select(Project.owner_id, is_member, user_role).where(Project.id == project_id)
+        ).first()
+
+        if row is None:
+            return ProjectPermission(
+                project_exists=False,
+                user_exists=False,
+                is_owner=False,
+                is_member=False,
+                user_role=None
+            )
 
-        # Verificar se é owner
-        if project.owner_id == user_id:
-            return True
+        owner_id, member, role = row
+        return ProjectPermission(
+            project_exists=True,
+            user_exists=role is not None,
+            is_owner=owner_id == user_id,
+            is_member=role is not None and bool(member),
+            user_role=role
+        )
 
-        # Verificar se é membro
-        if user in project.members:
-            return True
+    @staticmethod
+    def user_can_access_project(db: Session, project_id: int, user_id: int) -> bool:
+        """
+        Verifica se o usuário tem acesso ao projeto
+        (é owner ou membro do projeto)
+        """
+        return ProjectService.get_permission(db, project_id, user_id).can_access
 
-        return False
+    @staticmethod
+    def user_can_edit_project(db: Session, project_id: int, user_id: int) -> bool:
+        """
+        Verifica se o usuário tem permissão para editar o projeto
+        (owner, membro do projeto, ou MANAGER)
+        """
+        return ProjectService.get_permission(db, project_id, user_id).can_edit
@@ -7,14 +7,9 @@ from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 from io import BytesIO
+from types import SimpleNamespace
 
-# ReportLab imports para geração de PDF
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+# ReportLab é importado só em ReportService._reportlab(), ao gerar um PDF
 
 from app.models.Card import Card, CardStatus, CardPriority
 from app.models.project import Project
@@ -701,6 +696,26 @@ class ReportService:
 
     # === MÉTODOS DE GERAÇÃO DE PDF ===
 
+    @staticmethod
+    def _reportlab() -> SimpleNamespace:
+        """
+        Nomes do ReportLab usados nos PDFs, importados só quando um PDF é gerado
+        (carregar a stack do platypus no import do módulo deixa o startup da API mais lento)
+        """
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+        return SimpleNamespace(
+            colors=colors, TA_CENTER=TA_CENTER, A4=A4, inch=inch,
+            getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+            SimpleDocTemplate=SimpleDocTemplate, Table=Table, TableStyle=TableStyle,
+            Paragraph=Paragraph, Spacer=Spacer
+        )
+
     @staticmethod
     def generate_user_efficiency_pdf(
         db: Session,
@@ -731,47 +746,49 @@ class ReportService:
             db, user_id, current_user_id, start_date, end_date, period_preset, project_id
         )
 
+        rl = ReportService._reportlab()
+
         # Criar buffer para o PDF
         buffer = BytesIO()
 
         # Criar documento PDF
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        doc = rl.SimpleDocTemplate(buffer, pagesize=rl.A4, topMargin=0.5*rl.inch, bottomMargin=0.5*rl.inch)
         elements = []
 
         # Estilos
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
+        styles = rl.getSampleStyleSheet()
+        title_style = rl.ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=18,
-            textColor=colors.HexColor('#8B6B47'),
+            textColor=rl.colors.HexColor('#8B6B47'),
             spaceAfter=30,
-            alignment=TA_CENTER
+            alignment=rl.TA_CENTER
         )
-        heading_style = ParagraphStyle(
+        heading_style = rl.ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=14,
-            textColor=colors.HexColor('#8B6B47'),
+            textColor=rl.colors.HexColor('#8B6B47'),
             spaceAfter=12,
             spaceBefore=20
         )
         normal_style = styles['Normal']
 
         # Título
-        title = Paragraph(f"Relatório de Eficiência - {report_data['user_name']}", title_style)
+        title = rl.Paragraph(f"Relatório de Eficiência - {report_data['user_name']}", title_style)
         elements.append(title)
 
         # Informações do período
         start_date_str = report_data['period_start'].strftime('%d/%m/%Y') if report_data['period_start'] else 'N/A'
         end_date_str = report_data['period_end'].strftime('%d/%m/%Y') if report_data['period_end'] else 'N/A'
         period_text = f"<b>Período:</b> {start_date_str} a {end_date_str}"
-        elements.append(Paragraph(period_text, normal_style))
-        elements.append(Paragraph(f"<b>Email:</b> {report_data['user_email']}", normal_style))
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Paragraph(period_text, normal_style))
+        elements.append(rl.Paragraph(f"<b>Email:</b> {report_data['user_email']}", normal_style))
+        elements.append(rl.Spacer(1, 20))
 
         # Métricas de Tarefas
-        elements.append(Paragraph("Métricas de Tarefas", heading_style))
+        elements.append(rl.Paragraph("Métricas de Tarefas", heading_style))
         task_data = [
             ['Métrica', 'Valor'],
             ['Total de Tarefas', str(report_data['task_metrics']['total'])],
@@ -780,45 +797,45 @@ class ReportService:
             ['Tarefas Atrasadas', str(report_data['task_metrics']['overdue'])],
             ['Taxa de Conclusão', f"{report_data['task_metrics']['completion_rate']:.2f}%"]
         ]
-        task_table = Table(task_data, colWidths=[3.5*inch, 2*inch])
-        task_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        task_table = rl.Table(task_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+        task_table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
         ]))
         elements.append(task_table)
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Spacer(1, 20))
 
         # Métricas de Tempo
         if report_data['time_metrics']['average_completion_time_hours'] is not None:
-            elements.append(Paragraph("Métricas de Tempo", heading_style))
+            elements.append(rl.Paragraph("Métricas de Tempo", heading_style))
             time_data = [
                 ['Métrica', 'Valor'],
                 ['Tempo Médio de Conclusão', f"{report_data['time_metrics']['average_completion_time_hours']:.2f} horas"],
                 ['Concluídas no Prazo', str(report_data['time_metrics']['completed_on_time'])],
                 ['Concluídas Atrasadas', str(report_data['time_metrics']['completed_late'])]
             ]
-            time_table = Table(time_data, colWidths=[3.5*inch, 2*inch])
-            time_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            time_table = rl.Table(time_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+            time_table.setStyle(rl.TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 0), (-1, 0), 12),
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
             ]))
             elements.append(time_table)
-            elements.append(Spacer(1, 20))
+            elements.append(rl.Spacer(1, 20))
 
         # Distribuição por Prioridade
-        elements.append(Paragraph("Distribuição por Prioridade", heading_style))
+        elements.append(rl.Paragraph("Distribuição por Prioridade", heading_style))
         priority_data = [
             ['Prioridade', 'Quantidade'],
             ['Urgente', str(report_data['priority_distribution']['urgent'])],
@@ -826,56 +843,56 @@ class ReportService:
             ['Média', str(report_data['priority_distribution']['medium'])],
             ['Baixa', str(report_data['priority_distribution']['low'])]
         ]
-        priority_table = Table(priority_data, colWidths=[3.5*inch, 2*inch])
-        priority_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        priority_table = rl.Table(priority_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+        priority_table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
         ]))
         elements.append(priority_table)
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Spacer(1, 20))
 
         # Projetos Envolvidos
         if report_data['projects_involved']:
-            elements.append(Paragraph("Projetos Envolvidos", heading_style))
+            elements.append(rl.Paragraph("Projetos Envolvidos", heading_style))
             project_data = [['Projeto', 'Tarefas']]
             for proj in report_data['projects_involved']:
                 project_name = proj['project_name'] or 'Sem nome'
                 project_data.append([project_name, str(proj['task_count'])])
 
-            project_table = Table(project_data, colWidths=[3.5*inch, 2*inch])
-            project_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            project_table = rl.Table(project_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+            project_table.setStyle(rl.TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 0), (-1, 0), 12),
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
             ]))
             elements.append(project_table)
-            elements.append(Spacer(1, 20))
+            elements.append(rl.Spacer(1, 20))
 
         # Atividade Total
-        elements.append(Paragraph(f"<b>Total de Atividades Registradas:</b> {report_data['total_activity_count']}", normal_style))
+        elements.append(rl.Paragraph(f"<b>Total de Atividades Registradas:</b> {report_data['total_activity_count']}", normal_style))
 
         # Rodapé
-        elements.append(Spacer(1, 30))
+        elements.append(rl.Spacer(1, 30))
         footer_text = f"Relatório gerado em {datetime.utcnow().strftime('%d/%m/%Y às %H:%M:%S')} - Sistema Oriente"
-        footer_style = ParagraphStyle(
+        footer_style = rl.ParagraphStyle(
             'Footer',
             parent=styles['Normal'],
             fontSize=8,
-            textColor=colors.grey,
-            alignment=TA_CENTER
+            textColor=rl.colors.grey,
+            alignment=rl.TA_CENTER
         )
-        elements.append(Paragraph(footer_text, footer_style))
+        elements.append(rl.Paragraph(footer_text, footer_style))
 
         # Construir PDF
         doc.build(elements)
@@ -912,48 +929,52 @@ class ReportService:
             db, project_id, current_user_id, start_date, end_date, period_preset
         )
 
+        rl = ReportService._reportlab()
+
         # Criar buffer para o PDF
         buffer = BytesIO()
 
         # Criar documento PDF
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        doc = rl.SimpleDocTemplate(buffer, pagesize=rl.A4, topMargin=0.5*rl.inch, bottomMargin=0.5*rl.inch)
         elements = []
 
         # Estilos
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
+        styles = rl.getSampleStyleSheet()
+        title_style = rl.ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=18,
-            textColor=colors.HexColor('#8B6B47'),
+            textColor=rl.colors.HexColor('#8B6B47'),
             spaceAfter=30,
-            alignment=TA_CENTER
+            alignment=rl.TA_CENTER
         )
-        heading_style = ParagraphStyle(
+        heading_style = rl.ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=14,
-            textColor=colors.HexColor('#8B6B47'),
+            textColor=rl.colors.HexColor('#8B6B47'),
             spaceAfter=12,
             spaceBefore=20
         )
         normal_style = styles['Normal']
 
         # Título
-        title = Paragraph(f"Relatório do Projeto - {report_data['project_name']}", title_style)
+        title = rl.Paragraph(f"Relatório do Projeto - {report_data['project_name']}", title_style)
         elements.append(title)
 
         # Informações do período
         start_date_str = report_data['period_start'].strftime('%d/%m/%Y') if report_data['period_start'] else 'N/A'
         end_date_str = report_data['period_end'].strftime('%d/%m/%Y') if report_data['period_end'] else 'N/A'
         period_text = f"<b>Período:</b> {start_date_str} a {end_date_str}"
-        elements.append(Paragraph(period_text, normal_style))
-        elements.append(Paragraph(f"<b>Descrição:</b> {report_data['project_description'] or 'N/A'}", normal_style))
-        elements.append(Paragraph(f"<b>Total de Membros:</b> {report_data['total_members']}", normal_style))
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Paragraph(period_text, normal_style))
+        elements.append(rl.Paragraph(
+            f"<b>Descrição:</b> {report_data['project_description'] or 'N/A'}", normal_style
+        ))
+        elements.append(rl.Paragraph(f"<b>Total de Membros:</b> {report_data['total_members']}", normal_style))
+        elements.append(rl.Spacer(1, 20))
 
         # Métricas de Tarefas
-        elements.append(Paragraph("Métricas Gerais", heading_style))
+        elements.append(rl.Paragraph("Métricas Gerais", heading_style))
         task_data = [
             ['Métrica', 'Valor'],
             ['Total de Tarefas', str(report_data['task_metrics']['total'])],
@@ -962,22 +983,22 @@ class ReportService:
             ['Tarefas Atrasadas', str(report_data['task_metrics']['overdue'])],
             ['Taxa de Conclusão', f"{report_data['task_metrics']['completion_rate']:.2f}%"]
         ]
-        task_table = Table(task_data, colWidths=[3.5*inch, 2*inch])
-        task_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        task_table = rl.Table(task_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+        task_table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
         ]))
         elements.append(task_table)
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Spacer(1, 20))
 
         # Distribuição por Prioridade
-        elements.append(Paragraph("Distribuição por Prioridade", heading_style))
+        elements.append(rl.Paragraph("Distribuição por Prioridade", heading_style))
         priority_data = [
             ['Prioridade', 'Quantidade'],
             ['Urgente', str(report_data['priority_distribution']['urgent'])],
@@ -985,44 +1006,44 @@ class ReportService:
             ['Média', str(report_data['priority_distribution']['medium'])],
             ['Baixa', str(report_data['priority_distribution']['low'])]
         ]
-        priority_table = Table(priority_data, colWidths=[3.5*inch, 2*inch])
-        priority_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        priority_table = rl.Table(priority_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+        priority_table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
         ]))
         elements.append(priority_table)
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Spacer(1, 20))
 
         # Distribuição por Coluna
         if report_data['column_distribution']:
-            elements.append(Paragraph("Distribuição por Coluna Kanban", heading_style))
+            elements.append(rl.Paragraph("Distribuição por Coluna Kanban", heading_style))
             column_data = [['Coluna', 'Quantidade']]
             for col in report_data['column_distribution']:
                 column_data.append([col['column_title'], str(col['card_count'])])
 
-            column_table = Table(column_data, colWidths=[3.5*inch, 2*inch])
-            column_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            column_table = rl.Table(column_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+            column_table.setStyle(rl.TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 0), (-1, 0), 12),
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
             ]))
             elements.append(column_table)
-            elements.append(Spacer(1, 20))
+            elements.append(rl.Spacer(1, 20))
 
         # Top Contribuidores
         if report_data['top_contributors']:
-            elements.append(Paragraph("Top Contribuidores", heading_style))
+            elements.append(rl.Paragraph("Top Contribuidores", heading_style))
             contrib_data = [['Nome', 'Tarefas', 'Concluídas', 'Eficiência']]
             for contrib in report_data['top_contributors'][:10]:
                 contrib_data.append([
@@ -1032,30 +1053,30 @@ class ReportService:
                     f"{contrib['efficiency_rate']:.1f}%"
                 ])
 
-            contrib_table = Table(contrib_data, colWidths=[2*inch, 1.2*inch, 1.2*inch, 1.2*inch])
-            contrib_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            contrib_table = rl.Table(contrib_data, colWidths=[2*rl.inch, 1.2*rl.inch, 1.2*rl.inch, 1.2*rl.inch])
+            contrib_table.setStyle(rl.TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 0), (-1, 0), 10),
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
             ]))
             elements.append(contrib_table)
 
         # Rodapé
-        elements.append(Spacer(1, 30))
+        elements.append(rl.Spacer(1, 30))
         footer_text = f"Relatório gerado em {datetime.utcnow().strftime('%d/%m/%Y às %H:%M:%S')} - Sistema Oriente"
-        footer_style = ParagraphStyle(
+        footer_style = rl.ParagraphStyle(
             'Footer',
             parent=styles['Normal'],
             fontSize=8,
-            textColor=colors.grey,
-            alignment=TA_CENTER
+            textColor=rl.colors.grey,
+            alignment=rl.TA_CENTER
         )
-        elements.append(Paragraph(footer_text, footer_style))
+        elements.append(rl.Paragraph(footer_text, footer_style))
 
         # Construir PDF
         doc.build(elements)
@@ -1092,46 +1113,48 @@ class ReportService:
             db, project_id, current_user_id, start_date, end_date, period_preset
         )
 
+        rl = ReportService._reportlab()
+
         # Criar buffer para o PDF
         buffer = BytesIO()
 
         # Criar documento PDF
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        doc = rl.SimpleDocTemplate(buffer, pagesize=rl.A4, topMargin=0.5*rl.inch, bottomMargin=0.5*rl.inch)
         elements = []
 
         # Estilos
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
+        styles = rl.getSampleStyleSheet()
+        title_style = rl.ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=18,
-            textColor=colors.HexColor('#8B6B47'),
+            textColor=rl.colors.HexColor('#8B6B47'),
             spaceAfter=30,
-            alignment=TA_CENTER
+            alignment=rl.TA_CENTER
         )
-        heading_style = ParagraphStyle(
+        heading_style = rl.ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=14,
-            textColor=colors.HexColor('#8B6B47'),
+            textColor=rl.colors.HexColor('#8B6B47'),
             spaceAfter=12,
             spaceBefore=20
         )
         normal_style = styles['Normal']
 
         # Título
-        title = Paragraph(f"Relatório de Eficiência da Equipe - {report_data['project_name']}", title_style)
+        title = rl.Paragraph(f"Relatório de Eficiência da Equipe - {report_data['project_name']}", title_style)
         elements.append(title)
 
         # Informações do período
         start_date_str = report_data['period_start'].strftime('%d/%m/%Y') if report_data['period_start'] else 'N/A'
         end_date_str = report_data['period_end'].strftime('%d/%m/%Y') if report_data['period_end'] else 'N/A'
         period_text = f"<b>Período:</b> {start_date_str} a {end_date_str}"
-        elements.append(Paragraph(period_text, normal_style))
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Paragraph(period_text, normal_style))
+        elements.append(rl.Spacer(1, 20))
 
         # Métricas Gerais da Equipe
-        elements.append(Paragraph("Métricas Gerais da Equipe", heading_style))
+        elements.append(rl.Paragraph("Métricas Gerais da Equipe", heading_style))
         team_data = [
             ['Métrica', 'Valor'],
             ['Total de Tarefas', str(report_data['team_task_metrics']['total'])],
@@ -1139,33 +1162,33 @@ class ReportService:
             ['Tarefas Pendentes', str(report_data['team_task_metrics']['pending'])],
             ['Taxa de Conclusão Média', f"{report_data['average_efficiency_rate']:.2f}%"]
         ]
-        team_table = Table(team_data, colWidths=[3.5*inch, 2*inch])
-        team_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        team_table = rl.Table(team_data, colWidths=[3.5*rl.inch, 2*rl.inch])
+        team_table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
         ]))
         elements.append(team_table)
-        elements.append(Spacer(1, 20))
+        elements.append(rl.Spacer(1, 20))
 
         # Membro Mais Produtivo
         if report_data['most_productive_member']:
             most_prod = report_data['most_productive_member']
-            elements.append(Paragraph("Membro Mais Produtivo", heading_style))
-            elements.append(Paragraph(
+            elements.append(rl.Paragraph("Membro Mais Produtivo", heading_style))
+            elements.append(rl.Paragraph(
                 f"<b>{most_prod['user_name']}</b> - {most_prod['tasks_completed']} tarefas concluídas ({most_prod['efficiency_rate']:.2f}% de eficiência)",
                 normal_style
             ))
-            elements.append(Spacer(1, 20))
+            elements.append(rl.Spacer(1, 20))
 
         # Eficiência Individual dos Membros
         if report_data['members_efficiency']:
-            elements.append(Paragraph("Eficiência Individual dos Membros", heading_style))
+            elements.append(rl.Paragraph("Eficiência Individual dos Membros", heading_style))
             member_data = [['Nome', 'Atribuídas', 'Concluídas', 'Eficiência', 'Atividades']]
             for member in report_data['members_efficiency']:
                 member_data.append([
@@ -1176,30 +1199,30 @@ class ReportService:
                     str(member['activity_count'])
                 ])
 
-            member_table = Table(member_data, colWidths=[1.8*inch, 1*inch, 1*inch, 1*inch, 1*inch])
-            member_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B6B47')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            member_table = rl.Table(member_data, colWidths=[1.8*rl.inch, 1*rl.inch, 1*rl.inch, 1*rl.inch, 1*rl.inch])
+            member_table.setStyle(rl.TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), rl.colors.HexColor('#8B6B47')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 0), (-1, 0), 9),
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ('BACKGROUND', (0, 1), (-1, -1), rl.colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, rl.colors.black)
             ]))
             elements.append(member_table)
 
         # Rodapé
-        elements.append(Spacer(1, 30))
+        elements.append(rl.Spacer(1, 30))
         footer_text = f"Relatório gerado em {datetime.utcnow().strftime('%d/%m/%Y às %H:%M:%S')} - Sistema Oriente"
-        footer_style = ParagraphStyle(
+        footer_style = rl.ParagraphStyle(
             'Footer',
             parent=styles['Normal'],
             fontSize=8,
-            textColor=colors.grey,
-            alignment=TA_CENTER
+            textColor=rl.colors.grey,
+            alignment=rl.TA_CENTER
         )
-        elements.append(Paragraph(footer_text, footer_style))
+        elements.append(rl.Paragraph(footer_text, footer_style))
 
         # Construir PDF
         doc.build(elements)
@@ -0,0 +1,184 @@
+import re
+import unicodedata
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, column, func, literal_column, or_, select, table
+from sqlalchemy.orm import Session
+
+from app.models.Card import Card, CardStatus
+from app.models.chat import chat_participants
+from app.models.project import Project, project_members
+from app.models.search_document import SearchDocument, SEARCH_FTS_TABLE, SEARCH_TEXT_CONFIG
+from app.schemas.search import SearchTypeEnum
+
+# Termos considerados por busca (o restante é ignorado)
+_MAX_TERMS = 8
+
+# Peso do título em relação ao conteúdo no ranking do SQLite (bm25)
+_TITLE_WEIGHT = 10.0
+
+# Tamanho aproximado do trecho devolvido em cada resultado
+_SNIPPET_LENGTH = 160
+
+
+class SearchService:
+    """
+    Busca textual em cards (título e descrição), comentários e mensagens de chat
+
+    Consulta o índice de search_documents (tsvector/GIN no PostgreSQL, FTS5 no
+    SQLite), com as permissões aplicadas na mesma consulta: cards e comentários
+    só de projetos em que o usuário é owner ou membro (e de cards ativos),
+    mensagens só de chats de que ele participa.
+    """
+
+    @staticmethod
+    def search(
+        db: Session,
+        user_id: int,
+        query: str,
+        types: Optional[List[SearchTypeEnum]] = None,
+        project_id: Optional[int] = None,
+        chat_id: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> dict:
+        """
+        Resultados ordenados por relevância, paginados por offset
+
+        Todos os termos precisam aparecer (cada um também casa como prefixo).
+        Retorna um dict no formato de SearchResponse.
+        """
+        terms = SearchService._terms(query)
+        if not terms:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos um termo de busca"
+            )
+
+        documents = SearchDocument.__table__
+        if db.get_bind().dialect.name == "postgresql":
+            match, score, source = SearchService._postgres_match(documents, terms)
+        else:
+            match, score, source = SearchService._sqlite_match(documents, terms)
+
+        query_stmt = (
+            select(
+                documents.c.kind, documents.c.ref_id, documents.c.project_id, documents.c.card_id,
+                documents.c.chat_id, documents.c.title, documents.c.content,
+                Card.title.label("card_title"), score.label("score")
+            )
+            .select_from(source.outerjoin(Card, Card.id == documents.c.card_id))
+            .where(match, SearchService._visible_to(documents, user_id))
+        )
+        if types:
+            query_stmt = query_stmt.where(documents.c.kind.in_([search_type.value for search_type in types]))
+        if project_id is not None:
+            query_stmt = query_stmt.where(documents.c.project_id == project_id)
+        if chat_id is not None:
+            query_stmt = query_stmt.where(documents.c.chat_id == chat_id)
+
+        # Uma linha a mais indica que existe próxima página
+        rows = db.execute(
+            query_stmt.order_by(literal_column("score").desc(), documents.c.id.desc())
+            .limit(limit + 1).offset(offset)
+        ).all()
+
+        results = [
+            {
+                "type": row.kind,
+                "id": row.ref_id,
+                "project_id": row.project_id,
+                "card_id": row.card_id,
+                "card_title": row.card_title,
+                "chat_id": row.chat_id,
+                "snippet": SearchService._snippet(row.content, row.title, terms),
+                "score": round(float(row.score), 4)
+            }
+            for row in rows[:limit]
+        ]
+        return {
+            "query": query,
+            "results": results,
+            "next_offset": offset + limit if len(rows) > limit else None
+        }
+
+    # === MÉTODOS AUXILIARES ===
+
+    @staticmethod
+    def _terms(query: str) -> List[str]:
+        """Palavras da busca, sem operadores nem pontuação"""
+        return re.findall(r"\w+", query.lower())[:_MAX_TERMS]
+
+    @staticmethod
+    def _sqlite_match(documents, terms: List[str]):
+        """MATCH na tabela FTS5; bm25 é menor para os mais relevantes"""
+        fts = table(SEARCH_FTS_TABLE, column("rowid"))
+        fts_ref = literal_column(SEARCH_FTS_TABLE)
+        expression = " ".join(f'"{term}"*' for term in terms)
+
+        match = fts_ref.op("MATCH")(expression)
+        score = -func.bm25(fts_ref, _TITLE_WEIGHT, 1.0)
+        source = fts.join(documents, documents.c.id == fts.c.rowid)
+        return match, score, source
+
+    @staticmethod
+    def _postgres_match(documents, terms: List[str]):
+        """@@ na coluna search_vector (índice GIN); ts_rank_cd considera os pesos A/B"""
+        vector = literal_column("search_documents.search_vector")
+        tsquery = func.to_tsquery(
+            literal_column(f"'{SEARCH_TEXT_CONFIG}'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms)
+        )
+        return vector.op("@@")(tsquery), func.ts_rank_cd(vector, tsquery), documents
+
+    @staticmethod
+    def _visible_to(documents, user_id: int):
+        """Condição de permissão: projetos acessíveis (cards ativos) ou chats do usuário"""
+        user_projects = select(Project.id).where(
+            or_(
+                Project.owner_id == user_id,
+                Project.id.in_(select(project_members.c.project_id).where(project_members.c.user_id == user_id))
+            )
+        )
+        user_chats = select(chat_participants.c.chat_id).where(chat_participants.c.user_id == user_id)
+
+        return or_(
+            and_(
+                documents.c.project_id.in_(user_projects),
+                Card.status == CardStatus.ACTIVE
+            ),
+            documents.c.chat_id.in_(user_chats)
+        )
+
+    @staticmethod
+    def _fold(text: str) -> str:
+        """Minúsculas sem acentos, mantendo o mesmo tamanho do texto original"""
+        return "".join(unicodedata.normalize("NFD", char)[0] for char in text.lower())
+
+    @staticmethod
+    def _snippet(content: Optional[str], title: Optional[str], terms: List[str]) -> str:
+        """Trecho do texto (conteúdo ou título) em volta do primeiro termo encontrado"""
+        folded_terms = [SearchService._fold(term) for term in terms]
+        for text in (content, title):
+            if not text:
+                continue
+            folded = SearchService._fold(text)
+            positions = [position for position in (folded.find(term) for term in folded_terms) if position >= 0]
+            if positions:
+                break
+        else:
+            text = content or title or ""
+            positions = [0]
+
+        if len(text) <= _SNIPPET_LENGTH:
+            return text
+
+        start = max(0, min(positions) - _SNIPPET_LENGTH // 3)
+        if start:
+            # Começa no início de uma palavra
+            space = text.find(" ", start)
+            start = space + 1 if 0 <= space < min(positions) else start
+        end = start + _SNIPPET_LENGTH
+        snippet = text[start:end].strip()
+        return f"{'…' if start else ''}{snippet}{'…' if end < len(text) else ''}"
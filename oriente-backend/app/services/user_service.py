@@ -1,10 +1,13 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import Optional, Tuple
+from datetime import datetime
 from fastapi import HTTPException, status
 from app.models.user import User, UserStatus, UserRole
 from app.schemas.user import UserUpdateRequest, PasswordChangeRequest, UserResponse, UserListResponse
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_pooled, verify_password_pooled
+from app.core.token_revocation import token_revocations
+from app.core.user_cache import user_cache
 import math
 
 
@@ -106,6 +109,8 @@ class UserService:
         self.db.commit()
         self.db.refresh(user)
 
+        self._invalidate_auth_state(user)
+
         return UserResponse.model_validate(user)
 
     def change_password(self, user_id: int, password_data: PasswordChangeRequest, current_user_id: int) -> bool:
@@ -133,18 +138,21 @@ class UserService:
             )
 
         # Verificar senha antiga
-        if not verify_password(password_data.old_password, user.password_hash):
+        if not verify_password_pooled(password_data.old_password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Senha atual incorreta"
             )
 
         # Atualizar senha
-        user.password_hash = hash_password(password_data.new_password)
+        user.password_hash = hash_password_pooled(password_data.new_password)
+        self._revoke_tokens(user)
 
         # Salvar mudanças
         self.db.commit()
 
+        self._invalidate_auth_state(user, tokens_revoked=True)
+
         return True
 
     def deactivate_user(self, user_id: int, current_user_id: int, current_user_role: str) -> UserResponse:
@@ -180,11 +188,14 @@ class UserService:
 
         # Desativar usuário
         user.status = UserStatus.INACTIVE
+        self._revoke_tokens(user)
 
         # Salvar mudanças
         self.db.commit()
         self.db.refresh(user)
 
+        self._invalidate_auth_state(user, tokens_revoked=True)
+
         return UserResponse.model_validate(user)
 
     def activate_user(self, user_id: int, current_user_role: str) -> UserResponse:
@@ -216,11 +227,14 @@ class UserService:
 
         # Ativar usuário
         user.status = UserStatus.ACTIVE
+        self._revoke_tokens(user)
 
         # Salvar mudanças
         self.db.commit()
         self.db.refresh(user)
 
+        self._invalidate_auth_state(user, tokens_revoked=True)
+
         return UserResponse.model_validate(user)
 
     def update_user_role(self, user_id: int, new_role: str, current_user_id: int, current_user_role: str) -> UserResponse:
@@ -266,13 +280,37 @@ class UserService:
 
         # Atualizar role
         user.role = new_role_enum
+        self._revoke_tokens(user)
 
         # Salva mudanças
         self.db.commit()
         self.db.refresh(user)
 
+        self._invalidate_auth_state(user, tokens_revoked=True)
+
         return UserResponse.model_validate(user)
 
+    def _revoke_tokens(self, user: User) -> None:
+        """
+        Invalida os access tokens já emitidos (troca de senha, role ou status):
+        nova token_version, gravada junto com a alteração
+        """
+        user.token_version = (user.token_version or 0) + 1
+        user.tokens_revoked_at = datetime.utcnow()
+
+    def _invalidate_auth_state(self, user: User, tokens_revoked: bool = False) -> None:
+        """
+        Descarta o estado de autenticação em memória após alterar o usuário:
+        snapshot no cache do get_current_user e, no modo stateless, se a
+        alteração revogou tokens (_revoke_tokens), os de versão anterior
+        """
+        user_cache.invalidate(user.id)
+        if tokens_revoked:
+            token_revocations.revoke_user(
+                user.id,
+                active=user.status == UserStatus.ACTIVE,
+                token_version=user.token_version
+            )
 
 
 def get_user_service(db: Session) -> UserService:
@@ -0,0 +1,170 @@
+"""
+Benchmark da montagem do board (GET /{project_id}/board)
+
+Compara, num projeto com vários milhares de cards:
+
+- antes: ColumnService.get_project_columns (joinedload de colunas -> cards ->
+  responsáveis, objetos ORM de todos os cards, inclusive arquivados) e filtro
+  de status + dicts em Python, como o router fazia
+- depois: ColumnService.get_board (projeção só dos campos do board, ativos
+  filtrados no SQL, responsáveis agrupados por card)
+
+Cada montagem usa uma sessão nova, como uma requisição. Mede a latência
+(p50/p95), o pico de memória (tracemalloc) e o tamanho do JSON.
+
+Uso:
+    python benchmarks/bench_board_view.py --cards 5000 --columns 5 --repeat 10
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "oriente_bench_board.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+import app.models  # noqa: E402,F401
+import app.models.chat_message_attachment  # noqa: E402,F401
+import app.models.comment_attachment  # noqa: E402,F401
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.lexorank import rebalanced_ranks  # noqa: E402
+from app.core.responses import ORJSONResponse  # noqa: E402
+from app.models.Card import Card, CardPriority, CardStatus, card_assignees  # noqa: E402
+from app.models.Column import KanbanColumn  # noqa: E402
+from app.models.project import Project, project_members  # noqa: E402
+from app.models.team import Team  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.column_service import ColumnService  # noqa: E402
+
+PROJECT_ID = 1
+USERS = 20
+
+
+def setup(cards: int, columns: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    per_column = -(-cards // columns)
+    ranks = rebalanced_ranks(per_column)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "name": f"Usuário {i}", "email": f"usuario{i}@oriente-bench.com",
+             "password_hash": "x", "role": UserRole.USER}
+            for i in range(1, USERS + 1)
+        ])
+        conn.execute(insert(Team), [{"id": 1, "name": "Time"}])
+        conn.execute(insert(Project), [{"id": PROJECT_ID, "name": "Projeto", "owner_id": 1, "team_id": 1}])
+        conn.execute(insert(project_members), [{"project_id": PROJECT_ID, "user_id": 1}])
+        conn.execute(insert(KanbanColumn), [
+            {"id": i + 1, "title": f"Coluna {i}", "position": i, "project_id": PROJECT_ID}
+            for i in range(columns)
+        ])
+        # 1 em cada 5 cards arquivado, como num projeto com histórico
+        conn.execute(insert(Card), [
+            {
+                "id": i + 1, "title": f"Tarefa {i}", "description": "Descrição da tarefa " * 10,
+                "priority": list(CardPriority)[i % 4],
+                "status": CardStatus.ARCHIVED if i % 5 == 0 else CardStatus.ACTIVE,
+                "rank": ranks[i // columns], "column_id": 1 + i % columns, "project_id": PROJECT_ID,
+            }
+            for i in range(cards)
+        ])
+        conn.execute(insert(card_assignees), [
+            {"card_id": i + 1, "user_id": 1 + (i + offset) % USERS}
+            for i in range(cards) for offset in (0, 7)
+        ])
+
+
+def orm_board(db) -> dict:
+    """Montagem anterior do router"""
+    columns = ColumnService.get_project_columns(db, PROJECT_ID, 1)
+    board = [
+        {
+            "id": column.id,
+            "title": column.title,
+            "color": column.color,
+            "position": column.position,
+            "cards": [
+                {
+                    "id": card.id,
+                    "title": card.title,
+                    "description": card.description,
+                    "priority": card.priority,
+                    "position": card.position,
+                    "due_date": card.due_date,
+                    "assignees": [{"id": u.id, "name": u.name} for u in card.assignees]
+                }
+                for card in column.cards
+                if card.status == CardStatus.ACTIVE
+            ]
+        }
+        for column in columns
+    ]
+    return {"board": board, "total_columns": len(board)}
+
+
+def projection_board(db) -> dict:
+    return ColumnService.get_board(db, PROJECT_ID, 1)
+
+
+def render(build) -> bytes:
+    db = SessionLocal()
+    try:
+        return ORJSONResponse(build(db)).body
+    finally:
+        db.close()
+
+
+def measure(build, repeat: int) -> tuple:
+    render(build)  # aquecimento
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = render(build)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    render(build)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return statistics.median(timings), p95, peak, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark da montagem do board")
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    try:
+        setup(args.cards, args.columns)
+        print(f"{args.cards} cards em {args.columns} colunas, {args.repeat} repetições")
+
+        results = {}
+        for name, build in (("antes (ORM + filtro)", orm_board), ("depois (projeção)", projection_board)):
+            p50, p95, peak, body = measure(build, args.repeat)
+            results[name] = (p50, peak, body)
+            print(f"  {name:<22} p50={p50 * 1000:8.1f} ms  p95={p95 * 1000:8.1f} ms  "
+                  f"pico {peak / 1024 / 1024:6.1f} MiB  {len(body) / 1024:.0f} KiB")
+
+        (before_time, before_peak, before_body), (after_time, after_peak, after_body) = results.values()
+        print(f"  ganho: {before_time / after_time:.1f}x tempo, {before_peak / max(after_peak, 1):.1f}x memória")
+        print(f"  mesmo JSON: {'sim' if before_body == after_body else 'não (ordem dos responsáveis)'}")
+    finally:
+        engine.dispose()
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
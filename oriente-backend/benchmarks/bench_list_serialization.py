@@ -0,0 +1,162 @@
+"""
+Benchmark de serialização das listas grandes (cards, notificações, mensagens)
+
+Compara, para a mesma lista de objetos ORM:
+
+- antes: modelo Pydantic de resposta + response_model do FastAPI
+  (validação de cada objeto, jsonable_encoder e json.dumps do JSONResponse)
+- depois: dicts montados direto das linhas ORM + ORJSONResponse
+
+Mede o tempo (mediana de várias repetições) e o pico de memória (tracemalloc).
+Não usa banco: os objetos ORM são montados em memória, com relacionamentos
+já carregados, como ficam depois do joinedload.
+
+Uso:
+    python benchmarks/bench_list_serialization.py --size 2000 --repeat 5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+import app.models  # noqa: E402,F401
+import app.models.chat_message_attachment  # noqa: E402,F401
+import app.models.comment_attachment  # noqa: E402,F401
+from app.core.responses import ORJSONResponse  # noqa: E402
+from app.models.Card import Card, CardPriority, CardStatus  # noqa: E402
+from app.models.chat_message import ChatMessage  # noqa: E402
+from app.models.notification import Notification, NotificationType  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.Card import CardListResponse, card_list_response_dict  # noqa: E402
+from app.schemas.chat import ChatMessageListResponse, ChatMessageResponse  # noqa: E402
+from app.schemas.notification import (  # noqa: E402
+    NotificationListResponse, NotificationResponse, notification_response_dict
+)
+from app.services.chat_message_service import ChatMessageService  # noqa: E402
+
+
+def build_rows(size: int) -> dict:
+    users = [
+        User(id=i, name=f"Usuário {i}", email=f"usuario{i}@oriente-bench.com", password_hash="x")
+        for i in range(1, 21)
+    ]
+    now = datetime.utcnow()
+
+    cards = [
+        Card(
+            id=i, title=f"Tarefa {i}", description="Descrição da tarefa " * 5,
+            priority=list(CardPriority)[i % 4], status=CardStatus.ACTIVE,
+            position=i, column_id=1 + i % 4, project_id=1,
+            due_date=now + timedelta(days=i % 30), completed_at=None,
+            created_at=now, updated_at=now,
+            created_by=users[i % 20], assignees=[users[i % 20], users[(i + 7) % 20]]
+        )
+        for i in range(size)
+    ]
+    notifications = [
+        Notification(
+            id=i, type=NotificationType.TASK, title=f"Notificação {i}", message="Você foi atribuído",
+            is_read=i % 3 == 0, created_at=now, recipient_user_id=1, recipient=users[0]
+        )
+        for i in range(size)
+    ]
+    messages = [
+        ChatMessage(
+            id=i, chat_id=1, sender_id=users[i % 20].id, content=f"Mensagem {i}",
+            is_edited=False, edited_at=None, created_at=now, updated_at=now,
+            sender=users[i % 20], attachments=[]
+        )
+        for i in range(size)
+    ]
+    return {"cards": cards, "notifications": notifications, "messages": messages}
+
+
+def pydantic_path(response_model, content) -> bytes:
+    """Caminho anterior: response_model do FastAPI + JSONResponse"""
+    field = create_response_field(name="Response", type_=response_model)
+    encoded = asyncio.run(serialize_response(field=field, response_content=content, is_coroutine=True))
+    return JSONResponse(encoded).body
+
+
+def cases(rows: dict) -> dict:
+    cards, notifications, messages = rows["cards"], rows["notifications"], rows["messages"]
+    return {
+        "cards": (
+            lambda: pydantic_path(CardListResponse, CardListResponse(cards=cards, total=len(cards))),
+            lambda: ORJSONResponse(card_list_response_dict(cards)).body,
+        ),
+        "notificações": (
+            lambda: pydantic_path(NotificationListResponse, NotificationListResponse(
+                notifications=[NotificationResponse.model_validate(n) for n in notifications],
+                total=len(notifications),
+                unread_count=0
+            )),
+            lambda: ORJSONResponse({
+                "notifications": [notification_response_dict(n) for n in notifications],
+                "total": len(notifications),
+                "unread_count": 0
+            }).body,
+        ),
+        "mensagens": (
+            lambda: pydantic_path(ChatMessageListResponse, ChatMessageListResponse(
+                total=len(messages),
+                messages=[
+                    ChatMessageResponse(**ChatMessageService._message_response_dict(m, 1)) for m in messages
+                ],
+                has_more=False
+            )),
+            lambda: ORJSONResponse({
+                "total": len(messages),
+                "messages": [ChatMessageService._message_response_dict(m, 1) for m in messages],
+                "has_more": False
+            }).body,
+        ),
+    }
+
+
+def measure(render, repeat: int) -> tuple:
+    render()  # aquecimento (caches de schema do Pydantic/FastAPI)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = render()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de serialização de listas grandes")
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.size)
+    print(f"{args.size} itens por lista, mediana de {args.repeat} repetições")
+    for name, (before, after) in cases(rows).items():
+        before_time, before_peak, before_size = measure(before, args.repeat)
+        after_time, after_peak, after_size = measure(after, args.repeat)
+        print(f"\n{name}")
+        print(f"  antes  (Pydantic + json): {before_time * 1000:8.1f} ms  pico {before_peak / 1024 / 1024:6.1f} MiB  {before_size / 1024:.0f} KiB")
+        print(f"  depois (dicts + orjson):  {after_time * 1000:8.1f} ms  pico {after_peak / 1024 / 1024:6.1f} MiB  {after_size / 1024:.0f} KiB")
+        print(f"  ganho: {before_time / after_time:.1f}x tempo, {before_peak / max(after_peak, 1):.1f}x memória")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark de throughput de login com logins concorrentes
+
+Cria usuários em um SQLite temporário e dispara logins simultâneos contra
+a aplicação (em processo, via ASGI). Em paralelo mede a latência de
+GET /health para mostrar se o event loop continua respondendo durante o pico.
+
+Uso:
+    python benchmarks/bench_login.py --users 50 --concurrency 20 --rounds 3
+    BCRYPT_ROUNDS=10 PASSWORD_HASH_WORKERS=4 python benchmarks/bench_login.py
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "oriente_bench_login.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
+from app.models.user import User, UserStatus  # noqa: E402
+from main import app  # noqa: E402
+
+PASSWORD = "senha-benchmark"
+
+
+def setup_users(count: int) -> list:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        password_hash = hash_password(PASSWORD)
+        emails = [f"bench{i}@oriente-bench.com" for i in range(count)]
+        db.add_all([
+            User(name=f"Bench {i}", email=email, password_hash=password_hash, status=UserStatus.ACTIVE)
+            for i, email in enumerate(emails)
+        ])
+        db.commit()
+        return emails
+    finally:
+        db.close()
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(emails: list, concurrency: int, rounds: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        login_latencies = []
+        health_latencies = []
+        failures = 0
+
+        async def login(email: str) -> None:
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+                login_latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    failures += 1
+
+        async def probe_health(stop: asyncio.Event) -> None:
+            while not stop.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_health(stop))
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(login(email) for email in emails))
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await probe
+
+    total = len(emails) * rounds
+    print(f"bcrypt rounds={settings.BCRYPT_ROUNDS} hash workers={settings.PASSWORD_HASH_WORKERS} concurrency={concurrency}")
+    print(f"logins: {total} em {elapsed:.2f}s -> {total / elapsed:.1f} logins/s ({failures} falhas)")
+    print(
+        f"latência login: p50={statistics.median(login_latencies) * 1000:.0f} ms "
+        f"p95={percentile(login_latencies, 95) * 1000:.0f} ms"
+    )
+    if health_latencies:
+        print(
+            f"latência /health durante o pico: p50={statistics.median(health_latencies) * 1000:.1f} ms "
+            f"p95={percentile(health_latencies, 95) * 1000:.1f} ms "
+            f"max={max(health_latencies) * 1000:.1f} ms ({len(health_latencies)} amostras)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de logins concorrentes")
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    emails = setup_users(args.users)
+    try:
+        asyncio.run(run(emails, args.concurrency, args.rounds))
+    finally:
+        engine.dispose()
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark da latência de mover colunas e cards em função do tamanho
+
+Colunas: compara o deslocamento anterior (SELECT das colunas intermediárias
++ um UPDATE por objeto no flush) com o UPDATE único
+`SET position = position ± 1` de ColumnService._reorder_columns.
+
+Cards: mede CardService.move_card (rank fracionária, escreve só o card
+movido) para colunas de tamanhos diferentes; a latência não deve crescer
+com o tamanho da coluna.
+
+Cada movimento usa uma sessão nova e faz commit, como uma requisição.
+
+Uso:
+    python benchmarks/bench_position_moves.py --sizes 10,100,1000 --card-sizes 100,1000,5000 --moves 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "oriente_bench_moves.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import and_, insert  # noqa: E402
+
+import app.models  # noqa: E402,F401
+import app.models.chat_message_attachment  # noqa: E402,F401
+import app.models.comment_attachment  # noqa: E402,F401
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.lexorank import rebalanced_ranks  # noqa: E402
+from app.models.Card import Card  # noqa: E402
+from app.models.Column import KanbanColumn  # noqa: E402
+from app.models.project import Project, project_members  # noqa: E402
+from app.models.team import Team  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.schemas.Card import CardMove  # noqa: E402
+from app.services.card_service import CardService  # noqa: E402
+from app.services.column_service import ColumnService  # noqa: E402
+
+PROJECT_ID = 1
+
+
+def legacy_reorder_columns(db, project_id: int, old_position: int, new_position: int) -> None:
+    """Implementação anterior de ColumnService._reorder_columns"""
+    if old_position < new_position:
+        columns = db.query(KanbanColumn).filter(
+            and_(
+                KanbanColumn.project_id == project_id,
+                KanbanColumn.position > old_position,
+                KanbanColumn.position <= new_position
+            )
+        ).all()
+        for column in columns:
+            column.position -= 1
+    else:
+        columns = db.query(KanbanColumn).filter(
+            and_(
+                KanbanColumn.project_id == project_id,
+                KanbanColumn.position >= new_position,
+                KanbanColumn.position < old_position
+            )
+        ).all()
+        for column in columns:
+            column.position += 1
+
+
+def setup(columns: int, cards: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{
+            "id": 1, "name": "Dono", "email": "dono@oriente-bench.com",
+            "password_hash": "x", "role": UserRole.USER,
+        }])
+        conn.execute(insert(Team), [{"id": 1, "name": "Time"}])
+        conn.execute(insert(Project), [{"id": PROJECT_ID, "name": "Projeto", "owner_id": 1, "team_id": 1}])
+        conn.execute(insert(project_members), [{"project_id": PROJECT_ID, "user_id": 1}])
+        conn.execute(insert(KanbanColumn), [
+            {"id": i + 1, "title": f"Coluna {i}", "position": i, "project_id": PROJECT_ID}
+            for i in range(max(columns, 2))
+        ])
+        if cards:
+            conn.execute(insert(Card), [
+                {"title": f"Tarefa {i}", "rank": rank, "column_id": 1, "project_id": PROJECT_ID}
+                for i, rank in enumerate(rebalanced_ranks(cards))
+            ])
+
+
+def move_column(reorder, size: int, index: int) -> float:
+    """Move a coluna da primeira para a última posição (e volta), como move_column"""
+    db = SessionLocal()
+    try:
+        old_position, new_position = (0, size - 1) if index % 2 == 0 else (size - 1, 0)
+        start = time.perf_counter()
+        column = db.query(KanbanColumn).filter(
+            KanbanColumn.project_id == PROJECT_ID,
+            KanbanColumn.position == old_position
+        ).first()
+        reorder(db, PROJECT_ID, old_position, new_position)
+        column.position = new_position
+        db.commit()
+        return time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def move_card(card_id: int, size: int, index: int) -> float:
+    """Move o card entre o início e o meio da coluna grande"""
+    db = SessionLocal()
+    try:
+        new_position = size // 2 if index % 2 == 0 else 0
+        start = time.perf_counter()
+        CardService.move_card(db, card_id, CardMove(column_id=1, new_position=new_position), 1)
+        return time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def report(name: str, latencies: list) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    print(f"  {name:<24} p50={statistics.median(latencies) * 1000:8.2f} ms  p95={p95 * 1000:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de mover colunas e cards por tamanho")
+    parser.add_argument("--sizes", default="10,100,1000", help="quantidades de colunas no projeto")
+    parser.add_argument("--card-sizes", default="100,1000,5000", help="quantidades de cards na coluna")
+    parser.add_argument("--moves", type=int, default=50)
+    args = parser.parse_args()
+
+    # Mede o caminho do movimento, sem o rebalanceamento em segundo plano
+    settings.CARD_RANK_REBALANCE_LENGTH = 1000
+
+    try:
+        print("Mover coluna (primeira <-> última)")
+        for size in [int(value) for value in args.sizes.split(",")]:
+            print(f" {size} colunas")
+            for name, reorder in (
+                ("antes (loop ORM)", legacy_reorder_columns),
+                ("depois (UPDATE único)", ColumnService._reorder_columns),
+            ):
+                setup(size, 0)
+                report(name, [move_column(reorder, size, i) for i in range(args.moves)])
+
+        print("\nMover card na coluna (rank fracionária)")
+        for size in [int(value) for value in args.card_sizes.split(",")]:
+            setup(2, size)
+            card_id = size  # último card da coluna
+            print(f" {size} cards na coluna")
+            report("move_card", [move_card(card_id, size, i) for i in range(args.moves)])
+    finally:
+        engine.dispose()
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
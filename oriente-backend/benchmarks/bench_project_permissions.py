@@ -0,0 +1,153 @@
+"""
+Benchmark das verificações de permissão de projeto
+
+Compara a implementação anterior (carrega Project e User e avalia
+`user in project.members`, o que carrega toda a lista de membros)
+com a consulta única com EXISTS em project_members usada hoje por
+ProjectService, em um projeto com muitos membros.
+
+Cada verificação usa uma sessão nova, como uma requisição.
+
+Uso:
+    python benchmarks/bench_project_permissions.py --members 1000 --checks 500
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "oriente_bench_permissions.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+import app.models  # noqa: E402,F401
+import app.models.chat_message_attachment  # noqa: E402,F401
+import app.models.comment_attachment  # noqa: E402,F401
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.project import Project, project_members  # noqa: E402
+from app.models.team import Team  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.project_service import ProjectService  # noqa: E402
+
+PROJECT_ID = 1
+
+
+def legacy_can_access(db, project_id: int, user_id: int) -> bool:
+    """Implementação anterior de user_can_access_project"""
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        return False
+    if project.owner_id == user_id:
+        return True
+    user = db.query(User).filter(User.id == user_id).first()
+    return bool(user and user in project.members)
+
+
+def legacy_can_edit(db, project_id: int, user_id: int) -> bool:
+    """Implementação anterior de user_can_edit_project"""
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        return False
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return False
+    if user.role == UserRole.MANAGER:
+        return True
+    if project.owner_id == user_id:
+        return True
+    return user in project.members
+
+
+def exists_can_access(db, project_id: int, user_id: int) -> bool:
+    return ProjectService.user_can_access_project(db, project_id, user_id)
+
+
+def exists_can_edit(db, project_id: int, user_id: int) -> bool:
+    return ProjectService.user_can_edit_project(db, project_id, user_id)
+
+
+def setup(members: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {
+                "id": i,
+                "name": f"Membro {i}",
+                "email": f"membro{i}@oriente-bench.com",
+                "password_hash": "x",
+                "role": UserRole.USER,
+            }
+            for i in range(1, members + 2)
+        ])
+        conn.execute(insert(Team), [{"id": 1, "name": "Time"}])
+        conn.execute(insert(Project), [{"id": PROJECT_ID, "name": "Projeto", "owner_id": 1, "team_id": 1}])
+        # O último usuário fica fora do projeto (caso negativo)
+        conn.execute(insert(project_members), [
+            {"project_id": PROJECT_ID, "user_id": i} for i in range(1, members + 1)
+        ])
+
+
+def measure(check, user_ids: list) -> list:
+    latencies = []
+    for user_id in user_ids:
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            check(db, PROJECT_ID, user_id)
+            latencies.append(time.perf_counter() - start)
+        finally:
+            db.close()
+    return latencies
+
+
+def report(name: str, latencies: list) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    print(
+        f"{name:<16} p50={statistics.median(latencies) * 1000:7.3f} ms "
+        f"p95={p95 * 1000:7.3f} ms total={sum(latencies):.3f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark das verificações de permissão de projeto")
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--checks", type=int, default=300)
+    args = parser.parse_args()
+
+    setup(args.members)
+    try:
+        # Membros variados (não o owner) e um usuário que não é membro
+        step = max(1, args.members // args.checks)
+        user_ids = [2 + (i * step) % (args.members - 1) for i in range(args.checks)]
+        user_ids[::10] = [args.members + 1] * len(user_ids[::10])
+
+        # Os resultados precisam ser iguais antes de comparar tempos
+        db = SessionLocal()
+        try:
+            for user_id in set(user_ids) | {1}:
+                ProjectService.clear_permission_cache(db)
+                assert legacy_can_access(db, PROJECT_ID, user_id) == exists_can_access(db, PROJECT_ID, user_id)
+                assert legacy_can_edit(db, PROJECT_ID, user_id) == exists_can_edit(db, PROJECT_ID, user_id)
+        finally:
+            db.close()
+
+        print(f"projeto com {args.members} membros, {args.checks} verificações (sessão nova em cada)")
+        report("legado acesso", measure(legacy_can_access, user_ids))
+        report("EXISTS acesso", measure(exists_can_access, user_ids))
+        report("legado edição", measure(legacy_can_edit, user_ids))
+        report("EXISTS edição", measure(exists_can_edit, user_ids))
+    finally:
+        engine.dispose()
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Benchmark da busca textual (GET /api/search)
+
+Compara, numa base com milhares de cards, comentários e mensagens:
+
+- antes: LIKE '%termo%' em cards (título/descrição), comentários e mensagens,
+  com as mesmas permissões, sem ranking (varredura completa das tabelas)
+- depois: SearchService.search (FTS5 no SQLite; tsvector/GIN no PostgreSQL)
+
+Cada busca usa uma sessão nova, como uma requisição. Mede a latência (p50/p95)
+de termos frequentes, raros e com vários termos, e o custo da escrita de um
+card (o flush também atualiza search_documents).
+
+Uso:
+    python benchmarks/bench_search.py --cards 20000 --repeat 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "oriente_bench_search.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("SLOW_QUERY_THRESHOLD_MS", "100000")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, or_, select, union_all  # noqa: E402
+
+import app.models  # noqa: E402,F401
+import app.models.chat_message_attachment  # noqa: E402,F401
+import app.models.comment_attachment  # noqa: E402,F401
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.Card import Card, CardStatus  # noqa: E402
+from app.models.chat import Chat, chat_participants  # noqa: E402
+from app.models.chat_message import ChatMessage  # noqa: E402
+from app.models.Column import KanbanColumn  # noqa: E402
+from app.models.comment import Comment  # noqa: E402
+from app.models.project import Project, project_members  # noqa: E402
+from app.models.search_document import SearchDocument  # noqa: E402
+from app.models.team import Team  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.search_service import SearchService  # noqa: E402
+
+PROJECTS = 20
+CHATS = 50
+USER_ID = 1
+
+WORDS = (
+    "relatório vendas reunião cliente entrega prazo revisar contrato orçamento equipe "
+    "planilha apresentação campanha fornecedor pagamento auditoria backlog deploy servidor "
+    "banco dados integração teste homologação produção documentação treinamento suporte "
+    "chamado melhoria correção layout tela cadastro login permissão notificação exportar"
+).split()
+
+# Vocabulário com frequência de Zipf: as palavras acima ficam espalhadas entre
+# milhares de palavras sintéticas, como num texto real
+SYLLABLES = ["ba", "ce", "di", "fo", "gu", "la", "me", "ni", "po", "ru", "sa", "te", "vi", "xo", "zu"]
+
+QUERIES = {
+    "termo frequente": "relatório",
+    "termo raro": "quarentena",
+    "dois termos": "contrato fornecedor",
+    "prefixo": "homolog",
+}
+
+
+def _vocabulary(rng: random.Random, size: int = 3000) -> tuple:
+    words = list({"".join(rng.choices(SYLLABLES, k=3)) for _ in range(size)})
+    for i, word in enumerate(WORDS):
+        words.insert(5 + i * 40, word)
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+VOCABULARY, WEIGHTS = _vocabulary(random.Random(0))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, WEIGHTS, k=words))
+
+
+def setup(cards: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "name": f"Usuário {i}", "email": f"usuario{i}@oriente-bench.com",
+             "password_hash": "x", "role": UserRole.USER}
+            for i in range(1, 11)
+        ])
+        conn.execute(insert(Team), [{"id": 1, "name": "Time"}])
+        conn.execute(insert(Project), [
+            {"id": i, "name": f"Projeto {i}", "owner_id": 1 + i % 10, "team_id": 1}
+            for i in range(1, PROJECTS + 1)
+        ])
+        # O usuário do benchmark participa de metade dos projetos e dos chats
+        conn.execute(insert(project_members), [
+            {"project_id": i, "user_id": USER_ID} for i in range(1, PROJECTS + 1, 2)
+        ])
+        conn.execute(insert(KanbanColumn), [
+            {"id": i, "title": "A Fazer", "position": 0, "project_id": i} for i in range(1, PROJECTS + 1)
+        ])
+        conn.execute(insert(Chat), [{"id": i} for i in range(1, CHATS + 1)])
+        conn.execute(insert(chat_participants), [
+            {"chat_id": i, "user_id": USER_ID} for i in range(1, CHATS + 1, 2)
+        ])
+
+    # Pela sessão, para o flush popular search_documents como na aplicação
+    db = SessionLocal()
+    try:
+        for i in range(cards):
+            project_id = 1 + i % PROJECTS
+            title = _text(rng, 4) + (" quarentena" if i % 997 == 0 else "")
+            db.add(Card(
+                id=i + 1, title=title, description=_text(rng, 40), column_id=project_id,
+                project_id=project_id,
+                status=CardStatus.ARCHIVED if i % 10 == 0 else CardStatus.ACTIVE,
+            ))
+            db.add(Comment(card_id=i + 1, user_id=USER_ID, content=_text(rng, 20)))
+            db.add(ChatMessage(chat_id=1 + i % CHATS, sender_id=USER_ID, content=_text(rng, 12)))
+            if i % 2000 == 1999:
+                db.commit()
+        db.commit()
+    finally:
+        db.close()
+
+
+def like_search(db, query: str) -> list:
+    """Busca anterior possível: LIKE em cada tabela, sem índice nem ranking (mais recentes primeiro)"""
+    terms = SearchService._terms(query)
+    user_projects = select(Project.id).where(or_(
+        Project.owner_id == USER_ID,
+        Project.id.in_(select(project_members.c.project_id).where(project_members.c.user_id == USER_ID))
+    ))
+    user_chats = select(chat_participants.c.chat_id).where(chat_participants.c.user_id == USER_ID)
+
+    cards = select(Card.id.label("id")).where(Card.project_id.in_(user_projects), Card.status == CardStatus.ACTIVE)
+    comments = select(Comment.id).join(Card).where(Card.project_id.in_(user_projects), Card.status == CardStatus.ACTIVE)
+    messages = select(ChatMessage.id).where(ChatMessage.chat_id.in_(user_chats))
+    for term in terms:
+        cards = cards.where(or_(Card.title.ilike(f"%{term}%"), Card.description.ilike(f"%{term}%")))
+        comments = comments.where(Comment.content.ilike(f"%{term}%"))
+        messages = messages.where(ChatMessage.content.ilike(f"%{term}%"))
+    found = union_all(cards, comments, messages).subquery()
+    return db.execute(select(found.c.id).order_by(found.c.id.desc()).limit(20)).all()
+
+
+def fts_search(db, query: str) -> list:
+    return SearchService.search(db, USER_ID, query, limit=20)["results"]
+
+
+def measure(search, query: str, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat + 1):
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            results = search(db, query)
+            timings.append(time.perf_counter() - start)
+        finally:
+            db.close()
+    timings = timings[1:]  # descarta o aquecimento
+
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return statistics.median(timings), p95, len(results)
+
+
+def measure_write(repeat: int) -> float:
+    """Tempo de criar e commitar um card (inclui a atualização do índice)"""
+    rng = random.Random(7)
+    timings = []
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            db.add(Card(title=_text(rng, 4), description=_text(rng, 40), column_id=1, project_id=1))
+            db.commit()
+            timings.append(time.perf_counter() - start)
+        finally:
+            db.close()
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark da busca textual")
+    parser.add_argument("--cards", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        setup(args.cards)
+        db = SessionLocal()
+        indexed = db.query(SearchDocument).count()
+        db.close()
+        print(f"{args.cards} cards + {args.cards} comentários + {args.cards} mensagens "
+              f"({indexed} documentos indexados), {args.repeat} repetições")
+
+        for label, query in QUERIES.items():
+            print(f"  {label} ({query!r})")
+            for name, search in (("antes (LIKE)", like_search), ("depois (FTS)", fts_search)):
+                p50, p95, found = measure(search, query, args.repeat)
+                print(f"    {name:<14} p50={p50 * 1000:8.2f} ms  p95={p95 * 1000:8.2f} ms  {found} resultados")
+
+        print(f"  escrita de um card (com índice): {measure_write(args.repeat) * 1000:.2f} ms")
+    finally:
+        engine.dispose()
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark de cold start da API baseado em `python -X importtime`
+
+Importa `main` em processos novos (como o gunicorn faz em cada worker) e
+mede o tempo total de import, os pacotes mais caros e se as dependências
+adiadas (ReportLab, Cloudinary) foram carregadas no startup. Também mede
+quanto essas dependências custariam se fossem importadas junto com a API.
+
+Uso:
+    python benchmarks/bench_startup.py --runs 5 --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFERRED_PACKAGES = ("reportlab", "cloudinary")
+DEFERRED_IMPORTS = "import reportlab.platypus, reportlab.lib.styles, cloudinary.uploader, cloudinary.utils"
+
+
+def run_importtime(code: str) -> tuple:
+    """Executa o código em um processo novo; devolve (tempo de parede em s, linhas do importtime)"""
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'oriente_bench_startup.db')}")
+    env.setdefault("DEBUG", "false")
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return time.perf_counter() - start, result.stderr.splitlines()
+
+
+def parse_importtime(lines: list) -> dict:
+    """Tempo próprio (self, em µs) de cada módulo importado"""
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        modules[name] = int(self_us)
+    return modules
+
+
+def by_package(modules: dict) -> dict:
+    """Agrupa o tempo próprio pelo pacote de topo (fastapi, sqlalchemy, app, ...)"""
+    totals = defaultdict(int)
+    for name, self_us in modules.items():
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de cold start (python -X importtime)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    walls, imports, package_samples = [], [], []
+    modules = {}
+    for _ in range(args.runs):
+        wall, lines = run_importtime("import main")
+        modules = parse_importtime(lines)
+        walls.append(wall)
+        imports.append(sum(modules.values()) / 1e6)
+        package_samples.append(by_package(modules))
+
+    deferred_loaded = sorted(
+        name for name in modules if name.split(".")[0] in DEFERRED_PACKAGES
+    )
+
+    eager_costs = []
+    for _ in range(args.runs):
+        _, lines = run_importtime(f"import main; {DEFERRED_IMPORTS}")
+        eager_modules = parse_importtime(lines)
+        eager_costs.append(sum(
+            self_us for name, self_us in eager_modules.items() if name.split(".")[0] in DEFERRED_PACKAGES
+        ) / 1e6)
+
+    print(f"import main ({args.runs} processos novos)")
+    print(f"  tempo de parede do processo: p50={statistics.median(walls) * 1000:.0f} ms")
+    print(f"  tempo total de import:      p50={statistics.median(imports) * 1000:.0f} ms")
+    print(f"  ReportLab/Cloudinary no startup: {', '.join(deferred_loaded) if deferred_loaded else 'nenhum (adiados)'}")
+    print(f"  custo que foi adiado (import sob demanda): p50={statistics.median(eager_costs) * 1000:.0f} ms")
+
+    print(f"\npacotes mais caros (tempo próprio, mediana de {args.runs} execuções):")
+    packages = set().union(*package_samples)
+    medians = {
+        package: statistics.median(sample.get(package, 0) for sample in package_samples)
+        for package in packages
+    }
+    for package, self_us in sorted(medians.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {package:<24} {self_us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,21 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.routers import auth, projects, users, teams, notifications, reports, attachments, chat, chat_ws, cards_ws
+from app.core.database import engine, async_engine, read_engine, Base
+from app.core.dependencies import require_metrics_access
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.responses import ORJSONResponse
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.board_cache import board_cache
+from app.core.column_cache import column_cache
+from app.core.user_cache import user_cache
+from app.core.token_revocation import load_revocations, revocation_refresh_loop
+from app.core.warmup import readiness, warm_up_deferred
+from app.routers import auth, projects, users, teams, notifications, reports, attachments, chat, chat_ws, cards_ws, admin, dashboard, search
 from app.routers import Columns as columns, Cards as cards, comments, card_history, comment_attachments, chat_message_attachments
 
 # Criar tabelas no banco de dados
@@ -10,13 +23,17 @@ from app.routers import Columns as columns, Cards as cards, comments, card_histo
 # COMENTADO: O banco Railway já possui estrutura/dados
 # Base.metadata.create_all(bind=engine)
 
+# Logs da aplicação (app.*) em INFO; uvicorn/gunicorn configuram os próprios loggers
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
 # Criar aplicação FastAPI
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     docs_url="/swagger-ui.html",  # Equivalente ao Swagger do Spring
-    redoc_url="/api-docs"
+    redoc_url="/api-docs",
+    default_response_class=ORJSONResponse
 )
 
 # Configurar CORS
@@ -27,14 +44,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Queries", "X-DB-Time-ms", "ETag"],
 )
 
+# Compressão brotli/gzip das respostas acima de COMPRESSION_MIN_SIZE
+app.add_middleware(CompressionMiddleware)
+
+# Contagem de queries/tempo de banco por requisição
+app.add_middleware(QueryStatsMiddleware)
+
+# Latência por rota e requisições em andamento (/metrics)
+app.add_middleware(MetricsMiddleware)
+
 # Registrar routers
 app.include_router(auth.router)
 app.include_router(projects.router)
 app.include_router(users.router)
 app.include_router(teams.router)
 app.include_router(notifications.router)
+app.include_router(dashboard.router)
+app.include_router(search.router)
 
 # Routers do Kanban
 app.include_router(columns.router, prefix="/api/projects", tags=["Columns"])
@@ -55,6 +84,36 @@ app.include_router(chat_message_attachments.router, prefix="/api/chats", tags=["
 # Router WebSocket para Cards/Tarefas
 app.include_router(cards_ws.router, prefix="/ws", tags=["WebSocket Cards"])
 
+# Router de administração (métricas operacionais)
+app.include_router(admin.router)
+
+
+@app.on_event("startup")
+async def start_revocation_refresh():
+    """
+    Modo AUTH_STATELESS: carrega o conjunto de revogação e agenda a recarga periódica
+    """
+    if settings.AUTH_STATELESS:
+        await asyncio.to_thread(load_revocations)
+        app.state.revocation_task = asyncio.create_task(revocation_refresh_loop())
+
+
+@app.on_event("startup")
+async def start_deferred_warmup():
+    """
+    Carrega em segundo plano as dependências pesadas adiadas (ReportLab, Cloudinary)
+    O servidor já aceita requisições enquanto isso acontece
+    """
+    if settings.WARMUP_DEFERRED_ON_STARTUP:
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warm_up_deferred))
+
+
+@app.on_event("shutdown")
+async def stop_revocation_refresh():
+    task = getattr(app.state, "revocation_task", None)
+    if task is not None:
+        task.cancel()
+
 
 @app.get("/")
 def root():
@@ -80,6 +139,49 @@ def health_check():
     }
 
 
+@app.get("/health/ready")
+def readiness_check():
+    """
+    Prontidão: 200 quando os subsistemas carregados sob demanda já estão aquecidos,
+    503 enquanto ainda estão carregando
+    """
+    state = readiness()
+    return JSONResponse(
+        status_code=200 if state["ready"] else 503,
+        content={
+            "status": "READY" if state["ready"] else "WARMING_UP",
+            "application": settings.APP_NAME,
+            "subsystems": state["subsystems"]
+        }
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False,
+         dependencies=[Depends(require_metrics_access)])
+def metrics():
+    """
+    Métricas no formato Prometheus (por worker)
+    Latência por rota/status, requisições em andamento, WebSockets, pools e caches
+    Requer o METRICS_TOKEN ou o JWT de um administrador
+    """
+    engines = {"primary": engine, "async": async_engine}
+    if read_engine is not None:
+        engines["read"] = read_engine
+
+    return PlainTextResponse(
+        render_metrics(
+            ws_managers={"chat": chat_ws.manager, "cards": cards_ws.manager},
+            engines=engines,
+            caches={
+                "users": user_cache.stats(),
+                "boards": board_cache.stats(),
+                "columns": column_cache.stats()
+            }
+        ),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,82 @@
+"""
+Fixtures compartilhadas dos testes
+
+Cada arquivo de teste define só os dados do cenário, numa função
+`seed(db)` no nível do módulo; as fixtures abaixo criam um SQLite novo por
+teste com esses dados:
+
+- session_factory: sessionmaker ligado ao banco do teste (com os hooks de
+  app/core/query_stats.py, como os engines da aplicação)
+- db: uma sessão desse banco (fechada ao final)
+- client: TestClient da aplicação usando o banco do teste (sem réplica de leitura)
+
+auth_headers() monta o header Authorization de um usuário.
+"""
+import os
+
+# Antes de importar a aplicação: o engine global não deve apontar para o banco real
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - registra todos os models no metadata
+import app.models.chat_message_attachment  # noqa: F401
+import app.models.comment_attachment  # noqa: F401
+from app.core import database
+from app.core.board_cache import board_cache
+from app.core.column_cache import column_cache
+from app.core.database import Base
+from app.core.query_stats import install_query_hooks
+from app.core.security import create_access_token
+from app.core.user_cache import user_cache
+from main import app
+
+
+def auth_headers(user_id: int = 1, role: str = "USER", **extra) -> dict:
+    """Header Authorization (Bearer) do usuário, com headers extras opcionais"""
+    token = create_access_token(user_id, f"u{user_id}@test.com", f"Usuário {user_id}", role)
+    return {"Authorization": f"Bearer {token}", **extra}
+
+
+def _clear_caches() -> None:
+    user_cache.clear()
+    board_cache.clear()
+    column_cache.clear()
+
+
+@pytest.fixture
+def session_factory(request, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    install_query_hooks(engine)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    seed = getattr(request.module, "seed", None)
+    if seed is not None:
+        db = Session()
+        seed(db)
+        db.commit()
+        db.close()
+    _clear_caches()
+
+    yield Session
+
+    _clear_caches()
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(session_factory, monkeypatch):
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    monkeypatch.setattr(database, "ReadSessionLocal", None)
+    return TestClient(app)
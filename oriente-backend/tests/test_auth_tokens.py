@@ -0,0 +1,138 @@
+"""
+Testes do modo AUTH_STATELESS (access token curto + refresh token)
+
+- POST /api/auth/refresh emite novos tokens
+- Access e refresh tokens não são intercambiáveis
+- Troca de senha/role/status revoga os tokens já emitidos; o token renovado
+  logo em seguida (mesmo segundo) vale
+- Outras escritas no usuário (perfil, rehash da senha no login) não revogam
+"""
+import pytest
+
+from app.core.config import settings
+from app.core.security import decode_access_token, hash_password
+from app.core.token_revocation import TokenRevocationSet, load_revocations, token_revocations
+from app.models.user import User, UserRole
+
+PASSWORD = "senha-de-teste"
+
+
+@pytest.fixture(autouse=True)
+def stateless_auth(monkeypatch):
+    # Autouse: roda antes do seed, que já gera os hashes com o custo baixo
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    token_revocations.replace({})
+    yield
+    token_revocations.replace({})
+
+
+def seed(db) -> None:
+    password_hash = hash_password(PASSWORD)
+    db.add_all([
+        User(id=1, name="Admin", email="admin@oriente.com", password_hash=password_hash, role=UserRole.ADMIN),
+        User(id=2, name="Ana", email="ana@oriente.com", password_hash=password_hash, role=UserRole.USER),
+    ])
+
+
+def _login(client, email: str) -> dict:
+    response = client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def _me(client, token: str):
+    """Rota autenticada por get_current_user (claims + revogação no modo stateless)"""
+    return client.get("/api/projects", headers={"Authorization": f"Bearer {token}"})
+
+
+def _refresh(client, refresh_token: str):
+    return client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_refresh_issues_new_tokens(client):
+    tokens = _login(client, "ana@oriente.com")
+    assert tokens["refresh_token"]
+    assert _me(client, tokens["token"]).status_code == 200
+
+    response = _refresh(client, tokens["refresh_token"])
+    assert response.status_code == 200
+    renewed = response.json()["data"]
+    assert renewed["refresh_token"] and renewed["user"]["email"] == "ana@oriente.com"
+    assert _me(client, renewed["token"]).status_code == 200
+    assert decode_access_token(renewed["token"])["sub"] == "2"
+
+
+def test_access_and_refresh_tokens_are_not_interchangeable(client):
+    tokens = _login(client, "ana@oriente.com")
+
+    assert _me(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, tokens["token"]).status_code == 401
+    assert _refresh(client, "nao-e-um-jwt").status_code == 401
+
+
+def test_user_changes_revoke_issued_tokens(client):
+    admin = _login(client, "admin@oriente.com")["token"]
+    ana = _login(client, "ana@oriente.com")
+
+    # Troca de role no mesmo segundo do login: o token antigo não vale mais
+    response = client.patch("/api/users/2/role", json={"role": "ADMIN"}, headers={"Authorization": f"Bearer {admin}"})
+    assert response.status_code == 200
+    assert _me(client, ana["token"]).status_code == 401
+
+    # O refresh relê o usuário: novo token (mesmo segundo) com a role e a versão atuais
+    renewed = _refresh(client, ana["refresh_token"]).json()["data"]
+    assert decode_access_token(renewed["token"])["role"] == "ADMIN"
+    assert _me(client, renewed["token"]).status_code == 200
+
+    # Desativação: nem o token nem o refresh são aceitos
+    response = client.delete("/api/users/2", headers={"Authorization": f"Bearer {admin}"})
+    assert response.status_code == 200
+    assert _me(client, renewed["token"]).status_code == 401
+    assert _refresh(client, ana["refresh_token"]).status_code == 401
+
+
+def test_password_change_revokes_and_refresh_recovers(client):
+    ana = _login(client, "ana@oriente.com")
+    headers = {"Authorization": f"Bearer {ana['token']}"}
+    response = client.put(
+        "/api/users/2/password", json={"old_password": PASSWORD, "new_password": "outra-senha"}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert _me(client, ana["token"]).status_code == 401
+
+    # Renovação imediata (o retry do frontend) e recarga do banco: o token novo continua valendo
+    renewed = _refresh(client, ana["refresh_token"]).json()["data"]
+    assert _me(client, renewed["token"]).status_code == 200
+    load_revocations()
+    assert _me(client, ana["token"]).status_code == 401
+    assert _me(client, renewed["token"]).status_code == 200
+
+
+def test_profile_edit_and_login_rehash_do_not_revoke(client, monkeypatch):
+    ana = _login(client, "ana@oriente.com")
+    response = client.put(
+        "/api/users/2", json={"name": "Ana Maria"}, headers={"Authorization": f"Bearer {ana['token']}"}
+    )
+    assert response.status_code == 200, response.text
+    assert _me(client, ana["token"]).status_code == 200
+
+    # Custo do bcrypt aumentado: o login refaz o hash (updated_at muda), sem revogar o token emitido
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    relogged = _login(client, "ana@oriente.com")
+    load_revocations()
+    assert _me(client, relogged["token"]).status_code == 200
+    assert _me(client, ana["token"]).status_code == 200
+
+
+def test_revocation_set_compares_token_versions():
+    revocations = TokenRevocationSet()
+    revocations.revoke_user(5, active=True, token_version=2)
+
+    assert revocations.is_revoked(5, 1)
+    assert revocations.is_revoked(5, None)
+    assert not revocations.is_revoked(5, 2)
+    assert not revocations.is_revoked(6, 0)
+
+    revocations.revoke_user(5, active=False, token_version=3)
+    assert revocations.is_revoked(5, 3)
@@ -0,0 +1,101 @@
+"""
+Testes do cache de boards serializados (app/core/board_cache.py)
+
+- Leituras repetidas da mesma versão saem do cache, com os mesmos bytes
+- Toda mutação de CardService/ColumnService incrementa a versão do board
+- Entradas de versão anterior não são servidas; LRU por tamanho
+"""
+from app.core.board_cache import BoardCache, board_cache
+from app.core.board_version import get_board_version
+from app.models.Card import Card
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.schemas.Card import CardCreate, CardMove, CardStatusUpdate, CardStatusEnum, CardUpdate
+from app.schemas.Column import ColumnCreate, ColumnMove, ColumnUpdate
+from app.services.card_service import CardService
+from app.services.column_service import ColumnService
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    admin = User(id=1, name="Admin", email="admin@test.com", password_hash="x", role=UserRole.ADMIN)
+    db.add_all([admin, Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(admin)
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="Feito", position=1, project_id=1),
+    ])
+    db.add(Card(id=1, title="Primeira", column_id=1, project_id=1))
+
+
+def test_repeat_reads_are_served_from_cache(client):
+    before = board_cache.stats()
+    first = client.get("/api/projects/1/board", headers=auth_headers())
+    second = client.get("/api/projects/1/board", headers=auth_headers())
+    after = board_cache.stats()
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert second.headers["content-type"] == "application/json"
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+    client.post("/api/projects/1/cards", json={"title": "Nova", "column_id": 1}, headers=auth_headers())
+    third = client.get("/api/projects/1/board", headers=auth_headers())
+    assert [card["title"] for card in third.json()["board"][0]["cards"]] == ["Primeira", "Nova"]
+    assert board_cache.stats()["misses"] - after["misses"] == 1
+
+    stats = client.get("/api/admin/cache/boards", headers=auth_headers()).json()["data"]
+    assert stats["hits"] >= 1 and stats["size"] == 1
+
+
+def test_every_service_mutation_bumps_version(session_factory):
+    db = session_factory()
+    mutations = {
+        "create_card": lambda: CardService.create_card(db, 1, CardCreate(title="X", column_id=1), 1),
+        "update_card": lambda: CardService.update_card(db, 1, CardUpdate(title="Renomeada"), 1),
+        "move_card": lambda: CardService.move_card(db, 1, CardMove(column_id=2, new_position=0), 1),
+        "update_card_status": lambda: CardService.update_card_status(
+            db, 1, CardStatusUpdate(status=CardStatusEnum.ARCHIVED), 1
+        ),
+        "delete_card": lambda: CardService.delete_card(db, 1, 1),
+        "create_column": lambda: ColumnService.create_column(db, 1, ColumnCreate(title="Nova", position=0), 1),
+        "update_column": lambda: ColumnService.update_column(db, 2, ColumnUpdate(title="Concluído"), 1),
+        "move_column": lambda: ColumnService.move_column(db, 2, ColumnMove(new_position=0), 1),
+        "delete_column": lambda: ColumnService.delete_column(db, 2, 1),
+    }
+    try:
+        unchanged = []
+        for name, mutate in mutations.items():
+            version = get_board_version(db, 1)
+            mutate()
+            if get_board_version(db, 1) <= version:
+                unchanged.append(name)
+        assert not unchanged
+    finally:
+        db.close()
+
+
+def test_stale_versions_and_eviction():
+    cache = BoardCache(max_size=2)
+    cache.set(1, 5, b"v5")
+    assert cache.get(1, 5) == b"v5"
+    assert cache.get(1, 6) is None
+
+    # Snapshot mais antigo não substitui o mais novo
+    cache.set(1, 4, b"v4")
+    assert cache.get(1, 5) == b"v5"
+
+    cache.set(2, 1, b"a")
+    cache.get(1, 5)
+    cache.set(3, 1, b"b")
+    assert cache.get(2, 1) is None and cache.get(1, 5) == b"v5"
+
+    cache.invalidate([1])
+    stats = cache.stats()
+    assert (stats["stale"], stats["evictions"], stats["invalidations"], stats["size"]) == (1, 1, 1, 1)
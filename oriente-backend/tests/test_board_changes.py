@@ -0,0 +1,121 @@
+"""
+Testes de GET /api/projects/{project_id}/board/changes?since=
+
+- Cards/colunas criados, alterados e movidos depois da versão, com o estado atual
+- Todos os cards das colunas afetadas (posições dos vizinhos)
+- Remoções (e tarefas arquivadas) como tombstones
+- full_reload quando o log não cobre o intervalo
+"""
+from sqlalchemy import delete
+
+from app.models.board_change import BoardChange
+from app.models.Card import Card
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    admin = User(id=1, name="Admin", email="admin@test.com", password_hash="x", role=UserRole.ADMIN)
+    db.add_all([admin, Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(admin)
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="Fazendo", position=1, project_id=1),
+        KanbanColumn(id=3, title="Feito", position=2, project_id=1),
+    ])
+    db.add_all([Card(id=i, title=f"Tarefa {i}", column_id=1, project_id=1) for i in (1, 2, 3, 4)])
+
+
+def _changes(client, since: int) -> dict:
+    response = client.get("/api/projects/1/board/changes", params={"since": since}, headers=auth_headers())
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_changes_since_board_version(client):
+    version = client.get("/api/projects/1/board", headers=auth_headers()).json()["version"]
+
+    created = client.post(
+        "/api/projects/1/cards", json={"title": "Nova", "column_id": 2}, headers=auth_headers()
+    ).json()
+    client.patch("/api/projects/1/cards/1/move", json={"column_id": 3, "new_position": 0}, headers=auth_headers())
+    client.put("/api/projects/1/cards/2", json={"title": "Renomeada"}, headers=auth_headers())
+    client.patch("/api/projects/1/cards/3/status", json={"status": "archived"}, headers=auth_headers())
+    client.delete("/api/projects/1/cards/4", headers=auth_headers())
+    client.put("/api/projects/1/columns/2", json={"title": "Em andamento"}, headers=auth_headers())
+
+    changes = _changes(client, version)
+    assert changes["full_reload"] is False
+    assert changes["version"] > version
+
+    cards = {card["id"]: card for card in changes["cards"]}
+    assert changes["card_column_ids"] == [1, 2, 3]
+    assert set(cards) == {created["id"], 1, 2}
+    assert cards[2]["position"] == 0
+    assert (cards[1]["column_id"], cards[1]["position"]) == (3, 0)
+    assert cards[2]["title"] == "Renomeada"
+    assert cards[created["id"]]["column_id"] == 2
+    assert changes["deleted_card_ids"] == [3, 4]
+    assert [column["title"] for column in changes["columns"]] == ["Em andamento"]
+    assert changes["deleted_column_ids"] == []
+
+    # Já sincronizado: nada a aplicar
+    current = _changes(client, changes["version"])
+    assert (current["full_reload"], current["cards"], current["deleted_card_ids"]) == (False, [], [])
+
+    # Intermediário: só o que mudou depois dele
+    partial = _changes(client, changes["version"] - 1)
+    assert [column["id"] for column in partial["columns"]] == [2]
+    assert partial["cards"] == []
+
+
+def test_changes_include_shifted_siblings(client):
+    version = client.get("/api/projects/1/board", headers=auth_headers()).json()["version"]
+
+    # Card 4 para o topo da mesma coluna: todos os vizinhos mudam de posição
+    client.patch("/api/projects/1/cards/4/move", json={"column_id": 1, "new_position": 0}, headers=auth_headers())
+    changes = _changes(client, version)
+    assert changes["card_column_ids"] == [1]
+    assert [(card["id"], card["position"]) for card in changes["cards"]] == [(4, 0), (1, 1), (2, 2), (3, 3)]
+
+    # Card 1 para outra coluna: a de destino volta inteira; a de origem o cliente renumera
+    client.patch("/api/projects/1/cards/1/move", json={"column_id": 2, "new_position": 0}, headers=auth_headers())
+    changes = _changes(client, changes["version"])
+    assert changes["card_column_ids"] == [2]
+    assert [(card["id"], card["column_id"], card["position"]) for card in changes["cards"]] == [(1, 2, 0)]
+
+
+def test_column_shift_and_delete(client):
+    version = client.get("/api/projects/1/board", headers=auth_headers()).json()["version"]
+
+    client.patch("/api/projects/1/columns/3/move", json={"new_position": 0}, headers=auth_headers())
+    changes = _changes(client, version)
+    # O deslocamento em massa não tem ids: todas as colunas voltam, na ordem nova
+    assert [(column["id"], column["position"]) for column in changes["columns"]] == [(3, 0), (1, 1), (2, 2)]
+
+    version = changes["version"]
+    client.delete("/api/projects/1/columns/2", headers=auth_headers())
+    changes = _changes(client, version)
+    assert 2 in changes["deleted_column_ids"]
+    assert 2 not in [column["id"] for column in changes["columns"]]
+
+
+def test_full_reload_when_log_does_not_cover(client, session_factory):
+    version = client.get("/api/projects/1/board", headers=auth_headers()).json()["version"]
+    client.post("/api/projects/1/cards", json={"title": "Nova", "column_id": 1}, headers=auth_headers())
+
+    # Versão à frente da atual (ex.: banco restaurado)
+    assert _changes(client, version + 10)["full_reload"] is True
+
+    # Versões já podadas do log
+    db = session_factory()
+    db.execute(delete(BoardChange).where(BoardChange.version <= version + 1))
+    db.commit()
+    db.close()
+    assert _changes(client, version)["full_reload"] is True
@@ -0,0 +1,113 @@
+"""
+Testes do board montado por projeção (ColumnService.get_board)
+
+- Mesmo conteúdo da montagem a partir dos objetos ORM (get_project_columns)
+- Tarefas arquivadas/deletadas ficam de fora, sem mudar a posição das ativas
+- Número de consultas fixo, independente do número de cards
+"""
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.lexorank import rebalanced_ranks
+from app.models.Card import Card, CardPriority, CardStatus
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.services.column_service import ColumnService
+
+
+def seed(db) -> None:
+    users = [
+        User(id=i, name=f"Usuário {i}", email=f"u{i}@test.com", password_hash="x", role=UserRole.USER)
+        for i in (1, 2, 3)
+    ]
+    db.add_all(users + [Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(users[0])
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="Feito", color="#00ff00", position=1, project_id=1),
+        KanbanColumn(id=2, title="A Fazer", color="#ff0000", position=0, project_id=1),
+        KanbanColumn(id=3, title="Vazia", position=2, project_id=1),
+    ])
+    statuses = [CardStatus.ACTIVE, CardStatus.ARCHIVED, CardStatus.ACTIVE, CardStatus.DELETED, CardStatus.ACTIVE]
+    for column_id in (1, 2):
+        for index, rank in enumerate(rebalanced_ranks(len(statuses))):
+            db.add(Card(
+                title=f"Tarefa {column_id}-{index}", description=f"Descrição {index}" if index % 2 else None,
+                rank=rank, column_id=column_id, project_id=1, status=statuses[index],
+                priority=list(CardPriority)[index % 4], assignees=users[:index % 3]
+            ))
+
+
+def _orm_board(db) -> dict:
+    """Montagem anterior: objetos ORM de todos os cards, filtro de status em Python"""
+    columns = ColumnService.get_project_columns(db, 1, 1)
+    board = [
+        {
+            "id": column.id,
+            "title": column.title,
+            "color": column.color,
+            "position": column.position,
+            "cards": [
+                {
+                    "id": card.id,
+                    "title": card.title,
+                    "description": card.description,
+                    "priority": card.priority,
+                    "position": card.position,
+                    "due_date": card.due_date,
+                    "assignees": sorted(
+                        ({"id": u.id, "name": u.name} for u in card.assignees), key=lambda u: u["id"]
+                    )
+                }
+                for card in column.cards
+                if card.status == CardStatus.ACTIVE
+            ]
+        }
+        for column in columns
+    ]
+    return {"board": board, "total_columns": len(board)}
+
+
+def test_board_matches_orm_build(db):
+    board = ColumnService.get_board(db, 1, 1)
+    assert orjson.loads(orjson.dumps(board)) == orjson.loads(orjson.dumps(_orm_board(db)))
+
+    first = board["board"][0]
+    assert first["title"] == "A Fazer"
+    # Posições contam as arquivadas (mesmo índice usado por move_card)
+    assert [card["position"] for card in first["cards"]] == [0, 2, 4]
+    assert board["board"][2]["cards"] == []
+
+
+def test_board_query_count_is_constant(db):
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def count_board_queries() -> int:
+        statements.clear()
+        session = Session()
+        try:
+            ColumnService.get_board(session, 1, 1)
+        finally:
+            session.close()
+        return len(statements)
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    try:
+        few = count_board_queries()
+        db.add_all([Card(title=f"Extra {i}", column_id=2, project_id=1) for i in range(50)])
+        db.commit()
+        many = count_board_queries()
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+
+    # Acesso ao projeto, colunas, cards e responsáveis
+    assert few == many == 4
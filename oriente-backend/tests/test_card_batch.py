@@ -0,0 +1,157 @@
+"""
+Testes de POST /api/projects/{project_id}/cards/batch
+
+- Operações mistas aplicadas em ordem, com as posições finais corretas
+- Erro de uma operação fica no item; as demais são aplicadas
+- Um único commit e um único INSERT de histórico por lote
+"""
+from sqlalchemy import event
+
+from app.core.lexorank import rebalanced_ranks
+from app.models.Card import Card, CardStatus
+from app.models.card_history import CardHistory, CardHistoryAction
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.schemas.Card import CardBatchRequest
+from app.services.card_batch_service import CardBatchService
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    owner = User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER)
+    other = User(id=2, name="Outro", email="outro@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([owner, other, Team(id=1, name="Time")])
+    db.flush()
+    for project_id in (1, 2):
+        project = Project(id=project_id, name=f"Projeto {project_id}", owner_id=1, team_id=1)
+        project.members.append(owner)
+        db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="Feito", position=1, project_id=1),
+        KanbanColumn(id=3, title="Outro projeto", position=0, project_id=2),
+    ])
+    db.add_all([
+        Card(id=i + 1, title=title, rank=rank, column_id=1, project_id=1)
+        for i, (title, rank) in enumerate(zip("ABC", rebalanced_ranks(3)))
+    ])
+    db.add(Card(id=10, title="Alheio", column_id=3, project_id=2))
+
+
+def _titles(db, column_id: int):
+    return [
+        title for (title,) in
+        db.query(Card.title).filter(Card.column_id == column_id).order_by(Card.rank, Card.id)
+    ]
+
+
+def test_mixed_operations_with_item_errors(client, session_factory):
+    response = client.post("/api/projects/1/cards/batch", headers=auth_headers(), json={"operations": [
+        {"op": "create", "card": {"title": "X", "column_id": 1, "position": 0, "assignee_ids": [2]}},
+        {"op": "create", "card": {"title": "Y", "column_id": 1, "position": 2}},
+        {"op": "move", "card_id": 3, "move": {"column_id": 2, "new_position": 0}},
+        {"op": "update", "card_id": 1, "changes": {"title": "A2", "assignee_ids": [1]}},
+        {"op": "archive", "card_id": 2},
+        {"op": "move", "card_id": 10, "move": {"column_id": 1, "new_position": 0}},
+        {"op": "create", "card": {"title": "Z", "column_id": 3}},
+        {"op": "move", "card_id": 1, "move": {"column_id": 1, "new_position": 3}},
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+
+    assert (data["succeeded"], data["failed"]) == (6, 2)
+    assert [item["success"] for item in data["results"]] == [True] * 5 + [False, False, True]
+    assert data["results"][5]["card_id"] == 10
+    assert data["results"][5]["error"] == "Tarefa não encontrada neste projeto"
+    assert data["results"][6]["error"] == "Coluna não encontrada neste projeto"
+
+    created = data["results"][0]["card"]
+    assert created["title"] == "X" and [u["id"] for u in created["assignees"]] == [2]
+    moved = data["results"][2]["card"]
+    assert moved["column_id"] == 2 and moved["position"] == 0 and moved["completed_at"] is not None
+    assert data["results"][4]["card"]["status"] == "archived"
+    assert data["results"][7]["card"]["position"] == 3
+
+    db = session_factory()
+    try:
+        assert _titles(db, 1) == ["X", "Y", "B", "A2"]
+        assert _titles(db, 2) == ["C"]
+        assert db.get(Card, 2).status == CardStatus.ARCHIVED
+        assert db.get(Card, 10).column_id == 3
+        actions = sorted(action.value for (action,) in db.query(CardHistory.action))
+        assert actions == sorted([
+            CardHistoryAction.CREATED.value, CardHistoryAction.CREATED.value,
+            CardHistoryAction.MOVED.value, CardHistoryAction.UPDATED.value,
+            CardHistoryAction.ASSIGNEE_ADDED.value,
+        ])
+    finally:
+        db.close()
+
+
+def test_batch_requires_edit_permission(client):
+    response = client.post("/api/projects/1/cards/batch", headers=auth_headers(2), json={"operations": [
+        {"op": "archive", "card_id": 1},
+    ]})
+    assert response.status_code == 403
+
+    response = client.post("/api/projects/1/cards/batch", headers=auth_headers(), json={"operations": [
+        {"op": "move", "card_id": 1},
+    ]})
+    assert response.status_code == 422
+
+
+def test_single_commit_and_history_insert(session_factory):
+    db = session_factory()
+    statements = []
+    commits = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    event.listen(db, "after_commit", commits.append)
+    try:
+        request = CardBatchRequest(operations=[
+            {"op": "create", "card": {"title": f"Nova {i}", "column_id": 2}} for i in range(20)
+        ] + [
+            {"op": "move", "card_id": card_id, "move": {"column_id": 2, "new_position": 0}} for card_id in (1, 2, 3)
+        ])
+        result = CardBatchService.apply_batch(db, 1, request.operations, 1)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+        db.close()
+
+    assert result["succeeded"] == 23
+    assert len(commits) == 1
+    history_inserts = [s for s in statements if s.lstrip().startswith("INSERT INTO card_histories")]
+    assert len(history_inserts) == 1
+    # Leituras não crescem com o número de operações (os INSERTs dos cards
+    # novos saem num único executemany no PostgreSQL; no SQLite, um por card)
+    selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+    assert len(selects) == 7
+    assert len([s for s in statements if s.lstrip().startswith("UPDATE cards")]) == 1
+    assert [moved["card_id"] for moved in result["event"]["moved"]] == [1, 2, 3]
+    assert [moved["position"] for moved in result["event"]["moved"]] == [2, 1, 0]
+
+
+def test_move_within_column_on_rank_tie(session_factory):
+    # Ranks repetidas (escritas concorrentes): o lote rebalanceia a coluna e recarrega a ordem
+    db = session_factory()
+    try:
+        db.query(Card).filter(Card.column_id == 1).update({Card.rank: "m"})
+        db.commit()
+
+        request = CardBatchRequest(operations=[
+            {"op": "move", "card_id": 3, "move": {"column_id": 1, "new_position": 1}},
+            {"op": "create", "card": {"title": "D", "column_id": 1}},
+        ])
+        result = CardBatchService.apply_batch(db, 1, request.operations, 1)
+
+        assert [item["card"]["position"] for item in result["results"]] == [1, 3]
+        assert [moved["position"] for moved in result["event"]["moved"]] == [1]
+        assert _titles(db, 1) == ["A", "C", "B", "D"]
+        assert len({card.rank for card in db.query(Card).filter(Card.column_id == 1)}) == 4
+    finally:
+        db.close()
@@ -0,0 +1,94 @@
+"""
+Testes da paginação por cursor e de fields= em GET /api/projects/{project_id}/cards
+
+- Páginas percorrem todas as tarefas na ordem do board, sem repetir
+- Sem limit, a listagem completa continua igual
+- fields= restringe o JSON e o que é lido do banco
+"""
+from sqlalchemy import event
+
+from app.core.lexorank import rebalanced_ranks
+from app.models.Card import Card
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.services.card_service import CardService
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    owner = User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([owner, Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(owner)
+    db.add(project)
+    # Ordem das colunas diferente da ordem dos ids
+    db.add_all([
+        KanbanColumn(id=1, title="Feito", position=2, project_id=1),
+        KanbanColumn(id=2, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=3, title="Fazendo", position=1, project_id=1),
+    ])
+    card_id = 1
+    for column_id, count in ((1, 4), (2, 7), (3, 0)):
+        for rank in reversed(rebalanced_ranks(count)):
+            db.add(Card(id=card_id, title=f"Tarefa {card_id}", description="x" * 200, rank=rank,
+                        column_id=column_id, project_id=1, assignees=[owner]))
+            card_id += 1
+
+
+def test_pages_follow_board_order(client):
+    full = client.get("/api/projects/1/cards", headers=auth_headers()).json()
+    assert full["total"] == 11 and full["next_cursor"] is None
+
+    pages, params = [], {"limit": 3}
+    while True:
+        page = client.get("/api/projects/1/cards", params=params, headers=auth_headers()).json()
+        pages.append(page)
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 3, "cursor": page["next_cursor"]}
+
+    assert [page["total"] for page in pages] == [3, 3, 3, 2]
+    paged = [card for page in pages for card in page["cards"]]
+    assert paged == full["cards"]
+    assert [(card["column_id"], card["position"]) for card in paged[:8]] == [
+        (2, i) for i in range(7)
+    ] + [(1, 0)]
+
+
+def test_fields_limits_response_and_loading(client, session_factory):
+    response = client.get(
+        "/api/projects/1/cards", params={"fields": "title,position", "limit": 5}, headers=auth_headers()
+    )
+    assert response.status_code == 200
+    assert set(response.json()["cards"][0]) == {"id", "title", "position"}
+
+    db = session_factory()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    try:
+        cards, _ = CardService.get_project_cards_page(db, 1, 1, limit=5, fields={"id", "title"})
+        assert len(cards) == 5
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+        db.close()
+
+    # Só a verificação de acesso e a página: sem descrição, usuários nem posições
+    assert len(statements) == 2
+    assert "cards.description" not in statements[-1]
+
+
+def test_invalid_parameters(client):
+    response = client.get("/api/projects/1/cards", params={"fields": "title,senha"}, headers=auth_headers())
+    assert response.status_code == 400
+
+    response = client.get(
+        "/api/projects/1/cards", params={"limit": 2, "cursor": "nao-e-cursor"}, headers=auth_headers()
+    )
+    assert response.status_code == 400
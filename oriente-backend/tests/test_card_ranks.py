@@ -0,0 +1,137 @@
+"""
+Testes da ordem dos cards por rank fracionária
+
+- Chaves geradas sempre entre os vizinhos (app/core/lexorank.py)
+- Criar/mover card escreve uma única linha em cards
+- "position" da API continua sendo o índice do card na coluna
+- Rebalanceamento mantém a ordem com chaves curtas
+"""
+import random
+import re
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.lexorank import rank_between, rebalanced_ranks
+from app.models.Card import Card
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.schemas.Card import CardCreate, CardMove
+from app.services.card_service import CardService
+from app.services.column_service import ColumnService
+
+_CARD_WRITE = re.compile(r"\s*(INSERT INTO|UPDATE|DELETE FROM) cards\b")
+
+
+def test_rank_between_keeps_order():
+    rng = random.Random(7)
+    keys = []
+    for _ in range(2000):
+        index = rng.randint(0, len(keys))
+        before = keys[index - 1] if index > 0 else None
+        after = keys[index] if index < len(keys) else None
+        key = rank_between(before, after)
+        assert before is None or before < key
+        assert after is None or key < after
+        assert not key.endswith("0")
+        keys.insert(index, key)
+
+
+def test_rebalanced_ranks_are_short_and_sorted():
+    ranks = rebalanced_ranks(500)
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == 500
+    assert max(len(rank) for rank in ranks) <= 3
+
+
+def seed(db) -> None:
+    db.add(User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER))
+    db.add(Team(id=1, name="Time"))
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(db.get(User, 1))
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="Feito", position=1, project_id=1),
+    ])
+
+
+def _titles(db, column_id: int):
+    return [
+        card.title for card in
+        db.query(Card).filter(Card.column_id == column_id).order_by(Card.rank, Card.id).all()
+    ]
+
+
+def _card_writes(db, action) -> list:
+    """INSERT/UPDATE/DELETE em cards executados por action"""
+    writes = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if _CARD_WRITE.match(statement):
+            writes.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    try:
+        action()
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+    return writes
+
+
+def test_create_and_move_keep_position_semantics(db):
+    for title in ("A", "B", "C", "D"):
+        CardService.create_card(db, 1, CardCreate(title=title, column_id=1), 1)
+
+    # Inserção no meio escreve só o card novo
+    writes = _card_writes(db, lambda: CardService.create_card(db, 1, CardCreate(title="X", column_id=1, position=1), 1))
+    assert len(writes) == 1
+    assert _titles(db, 1) == ["A", "X", "B", "C", "D"]
+
+    card_d = db.query(Card).filter(Card.title == "D").one()
+    writes = _card_writes(db, lambda: CardService.move_card(db, card_d.id, CardMove(column_id=1, new_position=0), 1))
+    assert len(writes) == 1
+    assert _titles(db, 1) == ["D", "A", "X", "B", "C"]
+
+    moved = CardService.move_card(db, card_d.id, CardMove(column_id=1, new_position=3), 1)
+    assert _titles(db, 1) == ["A", "X", "B", "D", "C"]
+    assert moved.position == 3
+
+    # Já está na posição (ou além do fim sendo o último): nenhuma escrita
+    card_c = db.query(Card).filter(Card.title == "C").one()
+    for card, position in ((card_d, 3), (card_c, 9)):
+        move = CardMove(column_id=1, new_position=position)
+        assert _card_writes(db, lambda: CardService.move_card(db, card.id, move, 1)) == []
+    assert _titles(db, 1) == ["A", "X", "B", "D", "C"]
+
+    card_a = db.query(Card).filter(Card.title == "A").one()
+    moved = CardService.move_card(db, card_a.id, CardMove(column_id=2, new_position=5), 1)
+    assert moved.column_id == 2 and moved.position == 0
+    assert _titles(db, 1) == ["X", "B", "D", "C"]
+
+    cards = CardService.get_project_cards(db, 1, 1)
+    assert [(card.title, card.column_id, card.position) for card in cards] == [
+        ("X", 1, 0), ("B", 1, 1), ("D", 1, 2), ("C", 1, 3), ("A", 2, 0),
+    ]
+
+    columns = ColumnService.get_project_columns(db, 1, 1)
+    assert [card.position for card in columns[0].cards] == [0, 1, 2, 3]
+
+
+def test_rebalance_keeps_order(db, monkeypatch):
+    # Sem o rebalanceamento em segundo plano: aqui ele é chamado diretamente
+    monkeypatch.setattr(settings, "CARD_RANK_REBALANCE_LENGTH", 1000)
+    for i in range(40):
+        # Sempre na posição 1: as chaves crescem
+        CardService.create_card(db, 1, CardCreate(title=f"C{i}", column_id=1, position=1 if i else None), 1)
+    before = _titles(db, 1)
+    assert max(len(card.rank) for card in db.query(Card).all()) > 5
+
+    assert CardService.rebalance_column(db, 1) == 40
+    db.commit()
+
+    assert _titles(db, 1) == before
+    assert max(len(card.rank) for card in db.query(Card).all()) <= 3
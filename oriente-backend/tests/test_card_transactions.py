@@ -0,0 +1,101 @@
+"""
+Regressão de transações/consultas por endpoint de cards
+
+Cada mutação de card (incluindo o histórico) é gravada em um único commit,
+e o número de statements por requisição não cresce sem percebermos.
+Leituras não fazem commit.
+"""
+from sqlalchemy import event
+
+from app.models.Card import Card
+from app.models.card_history import CardHistory
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    admin = User(id=1, name="Admin", email="admin@test.com", password_hash="x", role=UserRole.ADMIN)
+    bia = User(id=2, name="Bia", email="bia@test.com", password_hash="x", role=UserRole.USER)
+    caio = User(id=3, name="Caio", email="caio@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([admin, bia, caio, Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.extend([admin, bia, caio])
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="Feito", position=1, project_id=1),
+    ])
+    card = Card(id=1, title="Primeira", column_id=1, project_id=1)
+    card.assignees.append(bia)
+    db.add_all([card, Card(id=2, title="Segunda", column_id=1, project_id=1)])
+
+
+def _request(client, session_factory, method: str, url: str, **kwargs) -> tuple:
+    """Executa a requisição e devolve (status, statements, commits)"""
+    engine = session_factory.kw["bind"]
+    counts = {"statements": 0, "commits": 0}
+
+    def count_statement(*args):
+        counts["statements"] += 1
+
+    def count_commit(conn):
+        counts["commits"] += 1
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    event.listen(engine, "commit", count_commit)
+    try:
+        response = client.request(method, url, headers=auth_headers(), **kwargs)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        event.remove(engine, "commit", count_commit)
+    return response.status_code, counts["statements"], counts["commits"]
+
+
+# (método, url, corpo, status esperado, statements, commits)
+# Statements incluem board_version/board_changes/search_documents gravados no flush
+# e as leituras da resposta após o commit
+ENDPOINTS = [
+    ("POST", "/api/projects/1/cards", {"title": "Nova", "column_id": 1, "assignee_ids": [2]}, 201, 16, 1),
+    ("PUT", "/api/projects/1/cards/1", {"title": "Renomeada", "assignee_ids": [3]}, 200, 13, 1),
+    ("PATCH", "/api/projects/1/cards/1/move", {"column_id": 2, "new_position": 0}, 200, 11, 1),
+    ("PATCH", "/api/projects/1/cards/1/status", {"status": "archived"}, 200, 6, 1),
+    ("POST", "/api/projects/1/cards/batch", {"operations": [
+        {"op": "update", "card_id": 2, "changes": {"title": "Lote"}},
+    ]}, 200, 13, 1),
+    ("DELETE", "/api/projects/1/cards/2", None, 204, 12, 1),
+    ("GET", "/api/projects/1/cards", None, 200, 3, 0),
+    ("GET", "/api/projects/1/cards/1", None, 200, 2, 0),
+    ("GET", "/api/projects/1/board", None, 200, 5, 0),
+]
+
+
+def test_card_endpoint_transactions(client, session_factory):
+    # Aquece caches por processo (usuário autenticado) antes de medir
+    client.get("/api/projects/1/board/changes", params={"since": 0}, headers=auth_headers())
+
+    measured = []
+    for method, url, body, expected_status, _, _ in ENDPOINTS:
+        kwargs = {"json": body} if body is not None else {}
+        measured.append(_request(client, session_factory, method, url, **kwargs))
+
+    expected = [(status, statements, commits) for _, _, _, status, statements, commits in ENDPOINTS]
+    assert measured == expected
+
+
+def test_history_is_written_with_the_card(client, session_factory):
+    client.put("/api/projects/1/cards/1", json={"title": "Renomeada", "assignee_ids": [3]}, headers=auth_headers())
+    client.patch("/api/projects/1/cards/1/move", json={"column_id": 2, "new_position": 0}, headers=auth_headers())
+
+    db = session_factory()
+    entries = [(entry.action.value, entry.details) for entry in db.query(CardHistory).order_by(CardHistory.id)]
+    db.close()
+    assert entries == [
+        ("UPDATED", {"title_changed": True, "old_title": "Primeira", "new_title": "Renomeada"}),
+        ("ASSIGNEE_ADDED", {"assignee_name": "Caio", "assignee_id": 3}),
+        ("ASSIGNEE_REMOVED", {"assignee_name": "Bia", "assignee_id": 2}),
+        ("MOVED", {"from_column": "A Fazer", "to_column": "Feito"}),
+    ]
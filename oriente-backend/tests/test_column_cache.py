@@ -0,0 +1,129 @@
+"""
+Testes do cache de colunas por projeto (app/core/column_cache.py)
+
+- move_card não consulta as colunas do projeto com o cache aquecido
+- Alterações do ColumnService invalidam a entrada (títulos)
+- Coluna de conclusão vem do banco, mesmo com o cache desatualizado
+- Coluna criada depois da entrada força a releitura; TTL e LRU
+"""
+import time
+
+from sqlalchemy import event
+
+from app.core.column_cache import ColumnCache, ProjectColumns, get_project_columns
+from app.models.Card import Card
+from app.models.card_history import CardHistory
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.schemas.Card import CardMove
+from app.schemas.Column import ColumnCreate, ColumnMove, ColumnUpdate
+from app.services.card_service import CardService
+from app.services.column_service import ColumnService
+
+
+def seed(db) -> None:
+    admin = User(id=1, name="Admin", email="admin@test.com", password_hash="x", role=UserRole.ADMIN)
+    db.add_all([admin, Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(admin)
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="Fazendo", position=1, project_id=1),
+        KanbanColumn(id=3, title="Feito", position=2, project_id=1),
+    ])
+    db.add(Card(id=1, title="Tarefa", column_id=1, project_id=1))
+
+
+def _move(Session, column_id: int) -> tuple:
+    """Move o card 1 numa sessão nova; devolve (card, SELECTs em kanban_columns)"""
+    db = Session()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM kanban_columns" in statement:
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    try:
+        card = CardService.move_card(db, 1, CardMove(column_id=column_id, new_position=0), 1)
+        result = (card.column_id, card.completed_at is not None)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+        db.close()
+    return result, len(statements)
+
+
+def test_move_card_uses_cached_columns(session_factory):
+    # Primeira movimentação lê as colunas; as seguintes só validam a coluna de destino
+    assert _move(session_factory, 2) == ((2, False), 2)
+    assert _move(session_factory, 3) == ((3, True), 1)
+    assert _move(session_factory, 1) == ((1, False), 1)
+
+    db = session_factory()
+    details = [entry.details for entry in db.query(CardHistory).order_by(CardHistory.id)]
+    db.close()
+    assert [(d["from_column"], d["to_column"]) for d in details if d and "from_column" in d] == [
+        ("A Fazer", "Fazendo"), ("Fazendo", "Feito"), ("Feito", "A Fazer")
+    ]
+
+
+def test_column_changes_invalidate(session_factory):
+    assert _move(session_factory, 3) == ((3, True), 2)
+
+    db = session_factory()
+    ColumnService.move_column(db, 3, ColumnMove(new_position=1), 1)
+    db.close()
+    # "Fazendo" passou a ser a última coluna
+    assert _move(session_factory, 2) == ((2, True), 2)
+    assert _move(session_factory, 3) == ((3, False), 1)
+
+    db = session_factory()
+    ColumnService.update_column(db, 2, ColumnUpdate(title="Em andamento"), 1)
+    new_column_id = ColumnService.create_column(db, 1, ColumnCreate(title="Arquivo", position=3), 1).id
+    db.close()
+
+    assert _move(session_factory, 1) == ((1, False), 2)
+    assert _move(session_factory, new_column_id) == ((new_column_id, True), 1)
+    assert get_project_columns(session_factory(), 1).titles[2] == "Em andamento"
+
+    # Coluna criada por outro worker (sem invalidar este cache): concluída pelo banco
+    # e releitura quando ela é a coluna de origem
+    db = session_factory()
+    db.add(KanbanColumn(id=10, title="Entregue", position=4, project_id=1))
+    db.commit()
+    db.close()
+    assert _move(session_factory, 10) == ((10, True), 1)
+    assert _move(session_factory, 1) == ((1, False), 2)
+
+
+def test_done_column_ignores_stale_cache(session_factory):
+    assert _move(session_factory, 2) == ((2, False), 2)
+
+    # Outro worker reordena as colunas: "Fazendo" passa a ser a última
+    db = session_factory()
+    db.get(KanbanColumn, 2).position = 5
+    db.commit()
+    db.close()
+
+    assert _move(session_factory, 3) == ((3, False), 1)
+    assert _move(session_factory, 2) == ((2, True), 1)
+
+
+def test_lru_and_expiry(monkeypatch):
+    cache_entry = ProjectColumns(project_id=7, ids=(1, 2), titles={1: "A", 2: "B"})
+    cache = ColumnCache(max_size=1, ttl_seconds=60)
+    cache.set(cache_entry)
+    assert cache.get(7) is cache_entry
+    assert cache_entry.has_columns([2]) and not cache_entry.has_columns([3])
+
+    cache.set(ProjectColumns(project_id=8, ids=(), titles={}))
+    assert cache.get(7) is None and cache.stats()["evictions"] == 1
+    assert cache.get(8).ids == ()
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get(8) is None
@@ -0,0 +1,95 @@
+"""
+Testes do deslocamento de posições das colunas (ColumnService)
+
+- Mover/criar/deletar desloca as demais com um único UPDATE
+- Colunas já carregadas na sessão ficam com a posição nova (identity map)
+"""
+import re
+
+from sqlalchemy import event
+
+from app.core.board_version import get_board_version
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.schemas.Column import ColumnCreate, ColumnMove
+from app.services.column_service import ColumnService
+
+_COLUMN_WRITE = re.compile(r"\s*(INSERT INTO|UPDATE|DELETE FROM) kanban_columns\b")
+
+
+def seed(db) -> None:
+    db.add(User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER))
+    db.add(Team(id=1, name="Time"))
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(db.get(User, 1))
+    db.add(project)
+    db.add_all([
+        KanbanColumn(id=i + 1, title=f"Coluna {i}", position=i, project_id=1)
+        for i in range(6)
+    ])
+
+
+def _order(db):
+    return [
+        column_id for (column_id,) in
+        db.query(KanbanColumn.id).filter(KanbanColumn.project_id == 1).order_by(KanbanColumn.position)
+    ]
+
+
+def _column_writes(db, action) -> list:
+    writes = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if _COLUMN_WRITE.match(statement):
+            writes.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    try:
+        action()
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+    return writes
+
+
+def test_move_shifts_with_single_update(db):
+    columns = db.query(KanbanColumn).order_by(KanbanColumn.position).all()
+    version = get_board_version(db, 1)
+
+    # Coluna 2 -> posição 5: deslocamento das intermediárias + a própria coluna
+    writes = _column_writes(db, lambda: ColumnService.move_column(db, 2, ColumnMove(new_position=5), 1))
+    assert len(writes) == 2
+    assert _order(db) == [1, 3, 4, 5, 6, 2]
+    assert [column.position for column in columns] == [0, 5, 1, 2, 3, 4]
+    assert get_board_version(db, 1) > version
+
+    ColumnService.move_column(db, 2, ColumnMove(new_position=0), 1)
+    assert _order(db) == [2, 1, 3, 4, 5, 6]
+
+
+def test_insert_and_delete_shift_positions(db):
+    writes = _column_writes(
+        db, lambda: ColumnService.create_column(db, 1, ColumnCreate(title="Nova", position=2), 1)
+    )
+    assert len(writes) == 2
+    new_id = _order(db)[2]
+    assert _order(db) == [1, 2, new_id, 3, 4, 5, 6]
+
+    loaded = db.get(KanbanColumn, 6)
+    ColumnService.delete_column(db, 2, 1)
+    assert _order(db) == [1, new_id, 3, 4, 5, 6]
+    assert loaded.position == 5
+    assert [column.position for column in db.query(KanbanColumn).order_by(KanbanColumn.position)] == list(range(6))
+
+
+def test_shift_updates_loaded_columns_before_commit(db):
+    columns = db.query(KanbanColumn).order_by(KanbanColumn.position).all()
+
+    ColumnService._reorder_columns(db, 1, 0, 3)
+
+    # Sem commit/expire: os objetos da sessão já refletem o UPDATE
+    assert [column.position for column in columns] == [0, 0, 1, 2, 4, 5]
+    assert not db.dirty
+    db.rollback()
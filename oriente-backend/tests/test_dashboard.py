@@ -0,0 +1,122 @@
+"""
+Testes de GET /api/dashboard
+
+- Contagens por coluna, vencidas/vencendo e tarefas atribuídas ao usuário
+- Número de consultas constante, independente da quantidade de projetos
+- Token de versão: sem mudanças, a resposta volta sem os dados
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from app.models.Card import Card, CardPriority, CardStatus
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.services.dashboard_service import DashboardService
+from conftest import auth_headers
+
+
+def _add_project(db, project_id: int, owner: User) -> None:
+    """Projeto com 3 colunas (pendente, em andamento, concluído)"""
+    project = Project(id=project_id, name=f"Projeto {project_id}", owner_id=owner.id, team_id=1)
+    project.members.append(owner)
+    db.add(project)
+    base = project_id * 10
+    db.add_all([
+        KanbanColumn(id=base + 1, title="A Fazer", position=0, project_id=project_id),
+        KanbanColumn(id=base + 2, title="Fazendo", position=1, project_id=project_id),
+        KanbanColumn(id=base + 3, title="Feito", position=2, project_id=project_id),
+    ])
+
+
+def seed(db) -> None:
+    owner = User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER)
+    other = User(id=2, name="Outro", email="outro@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([owner, other, Team(id=1, name="Time")])
+    db.flush()
+    _add_project(db, 1, owner)
+    db.flush()
+
+    now = datetime.utcnow()
+    cards = [
+        # Pendente, vencida, atribuída ao dono
+        Card(id=1, title="Vencida", column_id=11, project_id=1, priority=CardPriority.URGENT,
+             due_date=now - timedelta(days=3), assignees=[owner]),
+        # Em andamento, vence em breve, atribuída ao dono
+        Card(id=2, title="Em breve", column_id=12, project_id=1, due_date=now + timedelta(days=2),
+             assignees=[owner]),
+        # Concluída com data passada: não conta como vencida
+        Card(id=3, title="Feita", column_id=13, project_id=1, due_date=now - timedelta(days=5),
+             assignees=[owner]),
+        # De outro usuário
+        Card(id=4, title="Do outro", column_id=11, project_id=1, assignees=[other]),
+        # Arquivada: fora de tudo
+        Card(id=5, title="Arquivada", column_id=11, project_id=1, status=CardStatus.ARCHIVED,
+             due_date=now - timedelta(days=1), assignees=[owner]),
+    ]
+    db.add_all(cards)
+
+
+def test_dashboard_counts(client):
+    response = client.get("/api/dashboard", headers=auth_headers())
+    assert response.status_code == 200
+    data = response.json()
+
+    project = data["projects"][0]
+    assert [(c["title"], c["stage"], c["card_count"]) for c in project["columns"]] == [
+        ("A Fazer", "pending", 2),
+        ("Fazendo", "in_progress", 1),
+        ("Feito", "completed", 1),
+    ]
+    assert project["overdue_count"] == 1
+    assert project["due_soon_count"] == 1
+
+    assigned = {card["id"]: card for card in data["assigned_cards"]}
+    assert set(assigned) == {1, 2, 3}
+    assert assigned[1]["stage"] == "pending"
+    assert assigned[1]["priority"] == "urgent"
+    assert assigned[3]["stage"] == "completed"
+    assert assigned[2]["project_name"] == "Projeto 1"
+
+
+def test_version_token_skips_unchanged_data(client):
+    version = client.get("/api/dashboard", headers=auth_headers()).json()["version"]
+
+    unchanged = client.get("/api/dashboard", params={"version": version}, headers=auth_headers()).json()
+    assert unchanged == {"version": version, "unchanged": True}
+
+    client.post("/api/projects/1/cards", json={"title": "Nova", "column_id": 11}, headers=auth_headers())
+
+    changed = client.get("/api/dashboard", params={"version": version}, headers=auth_headers()).json()
+    assert changed["unchanged"] is False
+    assert changed["version"] != version
+    assert changed["projects"][0]["columns"][0]["card_count"] == 3
+
+
+def test_query_count_does_not_grow_with_projects(session_factory):
+    db = session_factory()
+    statements = []
+
+    @event.listens_for(db.get_bind(), "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    try:
+        DashboardService.get_dashboard(db, 1)
+        with_one_project = len(statements)
+
+        owner = db.get(User, 1)
+        for project_id in range(2, 12):
+            _add_project(db, project_id, owner)
+        db.flush()
+        statements.clear()
+
+        dashboard = DashboardService.get_dashboard(db, 1)
+        assert len(dashboard["projects"]) == 11
+        assert len(statements) == with_one_project == 4
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", count)
+        db.rollback()
+        db.close()
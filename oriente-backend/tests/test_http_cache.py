@@ -0,0 +1,142 @@
+"""
+Testes de GET condicional (ETag / 304) e compressão das respostas do board
+"""
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    owner = User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([owner, User(id=2, name="Externo", email="externo@test.com", password_hash="x")])
+    db.add(Team(id=1, name="Time"))
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(owner)
+    db.add(project)
+    db.add(KanbanColumn(id=1, title="A Fazer", position=0, project_id=1))
+
+
+def test_unchanged_board_returns_304(client):
+    first = client.get("/api/projects/1/board", headers=auth_headers(**{"Accept-Encoding": "identity"}))
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/api/projects/1/board", headers=auth_headers(**{"If-None-Match": etag}))
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_card_mutation_changes_etag(client):
+    etag = client.get("/api/projects/1/board", headers=auth_headers()).headers["etag"]
+
+    created = client.post(
+        "/api/projects/1/cards",
+        json={"title": "Nova tarefa", "column_id": 1},
+        headers=auth_headers()
+    )
+    assert created.status_code == 201
+
+    response = client.get("/api/projects/1/board", headers=auth_headers(**{"If-None-Match": etag}))
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["board"][0]["cards"][0]["title"] == "Nova tarefa"
+
+
+def test_card_mutation_keeps_project_updated_at(client, session_factory):
+    db = session_factory()
+    updated_at, version = db.query(Project.updated_at, Project.board_version).filter(Project.id == 1).one()
+    db.close()
+    projects_etag = client.get("/api/projects", headers=auth_headers()).headers["etag"]
+
+    created = client.post(
+        "/api/projects/1/cards",
+        json={"title": "Outra tarefa", "column_id": 1},
+        headers=auth_headers()
+    )
+    assert created.status_code == 201
+
+    db = session_factory()
+    assert db.query(Project.updated_at, Project.board_version).filter(Project.id == 1).one() == (
+        updated_at, version + 1
+    )
+    db.close()
+    # Lista de projetos não muda com as tarefas: continua 304
+    response = client.get("/api/projects", headers=auth_headers(**{"If-None-Match": projects_etag}))
+    assert response.status_code == 304
+
+
+def test_projects_etag_follows_owner_and_members(client):
+    etag = client.get("/api/projects", headers=auth_headers()).headers["etag"]
+
+    # owner_email vem do usuário: trocar o e-mail não altera projects.updated_at
+    response = client.put("/api/users/1", json={"email": "novo@test.com"}, headers=auth_headers())
+    assert response.status_code == 200, response.text
+    response = client.get("/api/projects", headers=auth_headers(**{"If-None-Match": etag}))
+    assert response.status_code == 200
+    assert response.json()[0]["owner_email"] == "novo@test.com"
+    etag = response.headers["etag"]
+
+    # member_count: trocar os membros também gera um ETag novo
+    response = client.put("/api/projects/1", json={"member_names": ["Externo"]}, headers=auth_headers())
+    assert response.status_code == 200, response.text
+    response = client.get("/api/projects", headers=auth_headers(**{"If-None-Match": etag}))
+    assert response.status_code == 200
+    assert response.json()[0]["member_count"] == 2
+
+
+def test_cards_etag_depends_on_filters(client):
+    all_cards = client.get("/api/projects/1/cards", headers=auth_headers())
+    filtered = client.get("/api/projects/1/cards?priority=high", headers=auth_headers())
+    assert all_cards.headers["etag"] != filtered.headers["etag"]
+
+    again = client.get(
+        "/api/projects/1/cards?priority=high",
+        headers=auth_headers(**{"If-None-Match": filtered.headers["etag"]})
+    )
+    assert again.status_code == 304
+
+
+def test_no_304_without_access(client):
+    etag = client.get("/api/projects/1/board", headers=auth_headers()).headers["etag"]
+    response = client.get("/api/projects/1/board", headers=auth_headers(2, **{"If-None-Match": etag}))
+    assert response.status_code == 403
+
+
+def test_projects_list_conditional_get(client):
+    first = client.get("/api/projects", headers=auth_headers())
+    assert first.status_code == 200
+    second = client.get("/api/projects", headers=auth_headers(**{"If-None-Match": first.headers["etag"]}))
+    assert second.status_code == 304
+
+
+def test_large_response_is_compressed_with_encoded_etag(client):
+    for i in range(30):
+        client.post(
+            "/api/projects/1/cards",
+            json={"title": f"Tarefa {i}", "description": "Descrição longa " * 10, "column_id": 1},
+            headers=auth_headers()
+        )
+
+    response = client.get("/api/projects/1/cards", headers=auth_headers(**{"Accept-Encoding": "gzip"}))
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["total"] >= 30
+
+    # A tag com sufixo de encoding continua valendo para o GET condicional
+    cached = client.get(
+        "/api/projects/1/cards",
+        headers=auth_headers(**{"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == response.headers["etag"]
+
+
+def test_small_response_is_not_compressed(client):
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,92 @@
+"""
+Testes da serialização sem validação das listas grandes
+
+O JSON montado direto das linhas ORM (ORJSONResponse) precisa ser idêntico
+ao que o Pydantic gera a partir do response_model.
+"""
+from datetime import datetime, timedelta, timezone
+
+import orjson
+
+from app.core.responses import ORJSONResponse
+from app.models.Card import Card, CardPriority, CardStatus
+from app.models.chat_message import ChatMessage
+from app.models.chat_message_attachment import ChatMessageAttachment
+from app.models.notification import Notification, NotificationType, RelatedEntityType
+from app.models.user import User
+from app.schemas.Card import CardListResponse, card_list_response_dict
+from app.schemas.chat import ChatMessageResponse
+from app.schemas.notification import NotificationResponse, notification_response_dict
+from app.services.chat_message_service import ChatMessageService
+
+UTC_NOW = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+BRT_NOW = datetime(2026, 3, 1, 9, 30, tzinfo=timezone(timedelta(hours=-3)))
+
+
+def _user(user_id: int) -> User:
+    return User(id=user_id, name=f"Usuário {user_id}", email=f"u{user_id}@test.com", password_hash="x")
+
+
+def _render(content) -> object:
+    return orjson.loads(ORJSONResponse(content).body)
+
+
+def test_card_list_matches_pydantic():
+    cards = [
+        Card(
+            id=1, title="Com tudo", description="Descrição", priority=CardPriority.HIGH,
+            status=CardStatus.ACTIVE, position=0, column_id=1, project_id=1,
+            due_date=datetime(2026, 3, 10), completed_at=BRT_NOW,
+            created_at=UTC_NOW, updated_at=UTC_NOW,
+            created_by=_user(1), assignees=[_user(1), _user(2)]
+        ),
+        Card(
+            id=2, title="Vazio", description="", priority=CardPriority.LOW,
+            status=CardStatus.ARCHIVED, position=1, column_id=1, project_id=1,
+            due_date=None, completed_at=None,
+            created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 2),
+            created_by=None, assignees=[]
+        ),
+    ]
+
+    expected = CardListResponse(cards=cards, total=len(cards)).model_dump(mode="json")
+    assert _render(card_list_response_dict(cards)) == expected
+
+
+def test_notification_matches_pydantic():
+    notifications = [
+        Notification(
+            id=1, type=NotificationType.TASK, title="T", message="M", is_read=False,
+            created_at=datetime(2026, 2, 1, 8, 0, 0, 5), recipient_user_id=1,
+            related_entity_type=RelatedEntityType.PROJECT, related_entity_id=3,
+            action_url="/projects/3", recipient=_user(1)
+        ),
+        Notification(
+            id=2, type=NotificationType.SYSTEM, title="S", message="M", is_read=True,
+            created_at=datetime(2026, 2, 1), recipient_user_id=2, recipient=None
+        ),
+    ]
+
+    for notification in notifications:
+        expected = NotificationResponse.model_validate(notification).model_dump(mode="json")
+        assert _render(notification_response_dict(notification)) == expected
+
+
+def test_chat_message_matches_pydantic():
+    sender = _user(1)
+    message = ChatMessage(
+        id=10, chat_id=1, sender_id=1, content="Olá", is_edited=True, edited_at=UTC_NOW,
+        created_at=UTC_NOW, updated_at=BRT_NOW, sender=sender,
+        attachments=[
+            ChatMessageAttachment(
+                id=5, filename="a.pdf", file_path="uploads/a.pdf", file_size=10,
+                mime_type="application/pdf", message_id=10, uploaded_by_id=1,
+                created_at=UTC_NOW, uploaded_by=sender
+            )
+        ]
+    )
+
+    payload = ChatMessageService._message_response_dict(message, user_id=2)
+    expected = ChatMessageResponse(**payload).model_dump(mode="json")
+    assert _render(payload) == expected
+    assert payload["can_edit"] is False
@@ -0,0 +1,44 @@
+"""
+Testes do acesso a GET /metrics (METRICS_TOKEN ou JWT de administrador)
+"""
+import pytest
+
+from app.core.config import settings
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "segredo-do-scraper")
+
+
+def seed(db) -> None:
+    db.add_all([
+        User(id=1, name="U1", email="u1@test.com", password_hash="x", role=UserRole.ADMIN),
+        User(id=2, name="U2", email="u2@test.com", password_hash="x", role=UserRole.USER),
+    ])
+
+
+def _get(client, token: str = None):
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    return client.get("/metrics", headers=headers)
+
+
+def test_metrics_requires_token_or_admin(client):
+    assert _get(client).status_code == 403
+    assert _get(client, "outro-token").status_code == 401
+    assert client.get("/metrics", headers=auth_headers(2)).status_code == 403
+
+    response = _get(client, "segredo-do-scraper")
+    assert response.status_code == 200
+    assert "cache" in response.text
+
+    assert client.get("/metrics", headers=auth_headers(1, "ADMIN")).status_code == 200
+
+
+def test_metrics_without_token_setting_accepts_only_admins(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    assert _get(client, "").status_code == 403
+    assert _get(client, "segredo-do-scraper").status_code == 401
+    assert client.get("/metrics", headers=auth_headers(1, "ADMIN")).status_code == 200
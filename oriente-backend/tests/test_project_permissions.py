@@ -0,0 +1,68 @@
+"""
+Testes das verificações de permissão de projeto (ProjectService)
+
+- Resultado por papel: owner, membro, MANAGER e usuário sem vínculo
+- Memorização por sessão: verificações repetidas não voltam ao banco
+"""
+import pytest
+from sqlalchemy import event
+
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.services.project_service import ProjectService
+
+
+def seed(db) -> None:
+    owner = User(id=1, name="Owner", email="owner@test.com", password_hash="x", role=UserRole.USER)
+    member = User(id=2, name="Membro", email="membro@test.com", password_hash="x", role=UserRole.USER)
+    manager = User(id=3, name="Gerente", email="gerente@test.com", password_hash="x", role=UserRole.MANAGER)
+    outsider = User(id=4, name="Externo", email="externo@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([owner, member, manager, outsider])
+    db.add(Team(id=1, name="Time"))
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.extend([owner, member])
+    db.add(project)
+
+
+@pytest.mark.parametrize("user_id, can_access, can_edit", [
+    (1, True, True),     # owner
+    (2, True, True),     # membro
+    (3, False, True),    # MANAGER sem vínculo edita, mas não acessa
+    (4, False, False),   # sem vínculo
+    (99, False, False),  # usuário inexistente
+])
+def test_permission_by_role(db, user_id, can_access, can_edit):
+    assert ProjectService.user_can_access_project(db, 1, user_id) is can_access
+    assert ProjectService.user_can_edit_project(db, 1, user_id) is can_edit
+
+
+def test_missing_project(db):
+    assert ProjectService.user_can_access_project(db, 999, 1) is False
+    assert ProjectService.user_can_edit_project(db, 999, 3) is False
+
+
+def test_checks_are_memoized_per_session(db):
+    engine = db.get_bind()
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        ProjectService.user_can_access_project(db, 1, 2)
+        first = len(statements)
+        assert first == 1  # projeto, membro e role em uma única consulta
+
+        for _ in range(5):
+            assert ProjectService.user_can_access_project(db, 1, 2)
+            assert ProjectService.user_can_edit_project(db, 1, 2)
+        assert len(statements) == first
+
+        ProjectService.clear_permission_cache(db)
+        ProjectService.user_can_access_project(db, 1, 2)
+        assert len(statements) > first
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
@@ -0,0 +1,108 @@
+"""
+Testes da instrumentação de SQL por requisição (app/core/query_stats.py)
+
+- DEBUG: X-DB-Queries / X-DB-Time-ms com os statements da requisição
+- Produção: uma linha de log "request_db" por requisição
+- Statements acima de SLOW_QUERY_THRESHOLD_MS: log "slow_query" com SQL normalizado e rota
+"""
+import json
+import logging
+from types import SimpleNamespace
+
+from sqlalchemy import event
+
+from app.core import query_stats
+from app.core.config import settings
+from app.core.query_stats import normalize_sql
+from app.models.Card import Card
+from app.models.Column import KanbanColumn
+from app.models.project import Project
+from app.models.team import Team
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+URL = "/api/projects/1/cards"
+ROUTE = "/api/projects/{project_id}/cards"
+
+
+def seed(db) -> None:
+    db.add(User(id=1, name="Dono", email="dono@test.com", password_hash="x", role=UserRole.USER))
+    db.add(Team(id=1, name="Time"))
+    db.flush()
+    project = Project(id=1, name="Projeto", owner_id=1, team_id=1)
+    project.members.append(db.get(User, 1))
+    db.add(project)
+    db.add(KanbanColumn(id=1, title="A Fazer", position=0, project_id=1))
+    db.add(Card(id=1, title="Card", column_id=1, project_id=1))
+
+
+def _get_counting(client, session_factory):
+    """GET da listagem de cards, contando os statements por fora da instrumentação"""
+    engine = session_factory.kw["bind"]
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(URL, headers=auth_headers())
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return response, len(statements)
+
+
+def _records(caplog, name: str) -> list:
+    return [
+        payload for payload in (json.loads(record.getMessage()) for record in caplog.records if record.name == "app.db")
+        if payload["event"] == name
+    ]
+
+
+def test_debug_headers_count_request_statements(client, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "DEBUG", True)
+
+    response, statements = _get_counting(client, session_factory)
+    assert response.status_code == 200
+    assert statements > 0
+    assert int(response.headers["X-DB-Queries"]) == statements
+    assert float(response.headers["X-DB-Time-ms"]) >= 0
+
+
+def test_request_log_without_debug(client, session_factory, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "DEBUG", False)
+    caplog.set_level(logging.INFO, logger="app.db")
+
+    response, statements = _get_counting(client, session_factory)
+    assert response.status_code == 200
+    assert "X-DB-Queries" not in response.headers
+
+    [record] = _records(caplog, "request_db")
+    assert record["method"] == "GET" and record["route"] == ROUTE
+    assert record["status"] == 200 and record["queries"] == statements
+
+
+def test_slow_queries_are_logged_with_route(client, monkeypatch, caplog):
+    # Relógio falso: cada statement "leva" 300 ms
+    clock = iter(i * 0.3 for i in range(10_000))
+    monkeypatch.setattr(query_stats, "time", SimpleNamespace(perf_counter=lambda: next(clock)))
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 200)
+    caplog.set_level(logging.WARNING, logger="app.db")
+
+    assert client.get(URL, headers=auth_headers()).status_code == 200
+
+    slow = _records(caplog, "slow_query")
+    assert slow
+    assert all(record["route"] == f"GET {ROUTE}" and record["duration_ms"] == 300.0 for record in slow)
+    assert any("FROM cards" in record["sql"] for record in slow)
+
+    # Limite desligado: nada é logado
+    caplog.clear()
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    assert client.get(URL, headers=auth_headers()).status_code == 200
+    assert _records(caplog, "slow_query") == []
+
+
+def test_normalize_sql_groups_literals():
+    sql = "SELECT *\n  FROM cards WHERE id IN (?, ?, ?) AND title = 'a''b' AND rank > 10 AND x = :param"
+    assert normalize_sql(sql) == "SELECT * FROM cards WHERE id IN (...) AND title = ? AND rank > ? AND x = ?"
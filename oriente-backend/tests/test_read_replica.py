@@ -0,0 +1,85 @@
+"""
+Testes do roteamento de leituras para a réplica (get_read_db)
+
+Usa dois bancos SQLite: o do teste como primário e outro como réplica.
+As notificações são gravadas em quantidades diferentes em cada banco para
+identificar de onde a rota leu.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.database import Base
+from app.models.notification import Notification
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+def _add_reader(db, unread: int) -> None:
+    db.add(User(id=1, name="Leitor", email="leitor@test.com", password_hash="x", role=UserRole.USER))
+    for i in range(unread):
+        db.add(Notification(title=f"N{i}", message="teste", recipient_user_id=1))
+
+
+def seed(db) -> None:
+    _add_reader(db, unread=1)
+
+
+def _session_factory(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def replica(tmp_path):
+    """Réplica com o mesmo usuário e 3 notificações não lidas"""
+    engine, ReplicaSession = _session_factory(tmp_path / "replica.db")
+    Base.metadata.create_all(bind=engine)
+    db = ReplicaSession()
+    _add_reader(db, unread=3)
+    db.commit()
+    db.close()
+
+    yield ReplicaSession
+
+    engine.dispose()
+
+
+def _unread_count(client):
+    response = client.get("/api/notifications/count", headers=auth_headers())
+    assert response.status_code == 200
+    return response.json()["unread_count"]
+
+
+def test_get_routes_read_from_replica(client, replica, monkeypatch):
+    monkeypatch.setattr(database, "ReadSessionLocal", replica)
+    assert _unread_count(client) == 3
+
+
+def test_falls_back_to_primary_without_replica(client):
+    # conftest: client sem réplica (ReadSessionLocal = None)
+    assert _unread_count(client) == 1
+
+
+def test_falls_back_to_primary_when_replica_unreachable(client, tmp_path, monkeypatch):
+    engine, BrokenReplicaSession = _session_factory(tmp_path / "diretorio-inexistente" / "replica.db")
+    monkeypatch.setattr(database, "ReadSessionLocal", BrokenReplicaSession)
+    try:
+        assert _unread_count(client) == 1
+    finally:
+        engine.dispose()
+
+
+def test_write_routes_use_primary(client, replica, monkeypatch):
+    monkeypatch.setattr(database, "ReadSessionLocal", replica)
+
+    response = client.patch("/api/notifications/read-all", headers=auth_headers())
+    assert response.status_code == 200
+
+    # A réplica não recebeu a escrita (no SQLite não há replicação)
+    db = replica()
+    try:
+        assert db.query(Notification).filter(Notification.is_read == False).count() == 3  # noqa: E712
+    finally:
+        db.close()
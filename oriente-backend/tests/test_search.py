@@ -0,0 +1,107 @@
+"""
+Testes da busca textual (GET /api/search, app/core/search_index.py)
+
+- Cards, comentários e mensagens indexados no flush, com ranking por relevância
+- Permissões: só projetos/chats do usuário e cards ativos
+- Índice atualizado em edições e remoções; paginação por offset
+"""
+from sqlalchemy import func, select
+
+from app.models.Card import Card, CardStatus
+from app.models.chat import Chat, ChatType
+from app.models.chat_message import ChatMessage
+from app.models.Column import KanbanColumn
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.search_document import SearchDocument
+from app.models.team import Team
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    ana = User(id=1, name="Ana", email="ana@test.com", password_hash="x", role=UserRole.USER)
+    bruno = User(id=2, name="Bruno", email="bruno@test.com", password_hash="x", role=UserRole.USER)
+    db.add_all([ana, bruno, Team(id=1, name="Time")])
+    db.flush()
+    project = Project(id=1, name="Projeto da Ana", owner_id=1, team_id=1)
+    project.members.append(ana)
+    other = Project(id=2, name="Projeto do Bruno", owner_id=2, team_id=1)
+    other.members.append(bruno)
+    db.add_all([project, other])
+    db.add_all([
+        KanbanColumn(id=1, title="A Fazer", position=0, project_id=1),
+        KanbanColumn(id=2, title="A Fazer", position=0, project_id=2),
+    ])
+    db.add_all([
+        Card(id=1, title="Relatório de vendas", description="Consolidar números do trimestre",
+             column_id=1, project_id=1),
+        Card(id=2, title="Reunião", description="Revisar o relatório com a diretoria", column_id=1, project_id=1),
+        Card(id=3, title="Relatório arquivado", column_id=1, project_id=1, status=CardStatus.ARCHIVED),
+        Card(id=4, title="Relatório do Bruno", column_id=2, project_id=2),
+    ])
+    db.add(Comment(id=1, content="Faltam os números de março no relatório", card_id=2, user_id=1))
+    db.add_all([
+        Chat(id=1, type=ChatType.INDIVIDUAL, participants=[ana, bruno]),
+        Chat(id=2, type=ChatType.GROUP, name="Só Bruno", participants=[bruno]),
+    ])
+    db.add_all([
+        ChatMessage(id=1, chat_id=1, sender_id=2, content="Você viu o relatório?"),
+        ChatMessage(id=2, chat_id=2, sender_id=2, content="Relatório secreto"),
+    ])
+
+
+def _search(client, user_id: int = 1, **params) -> dict:
+    response = client.get("/api/search", params=params, headers=auth_headers(user_id))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _hits(body: dict) -> list:
+    return [(result["type"], result["id"]) for result in body["results"]]
+
+
+def test_ranked_results_respect_permissions(client):
+    body = _search(client, q="relatorio")
+
+    # Título do card pesa mais; arquivado, projeto alheio e chat alheio ficam de fora
+    assert _hits(body)[0] == ("card", 1)
+    assert set(_hits(body)) == {("card", 1), ("card", 2), ("comment", 1), ("message", 1)}
+    comment = next(result for result in body["results"] if result["type"] == "comment")
+    assert (comment["card_id"], comment["card_title"], comment["project_id"]) == (2, "Reunião", 1)
+
+    assert set(_hits(_search(client, user_id=2, q="relatório"))) == {("card", 4), ("message", 1), ("message", 2)}
+
+    # Todos os termos, com prefixo
+    assert _hits(_search(client, q="relat março")) == [("comment", 1)]
+    assert _hits(_search(client, q="relatorio", types="message")) == [("message", 1)]
+    assert _hits(_search(client, user_id=2, q="relatorio", project_id=1)) == []
+
+
+def test_index_follows_writes(client, session_factory):
+    db = session_factory()
+    card = db.get(Card, 1)
+    card.title = "Planilha de vendas"
+    db.add(Comment(id=2, content="Planilha revisada", card_id=1, user_id=1))
+    db.delete(db.get(Card, 2))
+    db.commit()
+    db.close()
+
+    assert _hits(_search(client, q="planilha")) == [("card", 1), ("comment", 2)]
+    # Card removido leva junto os comentários
+    assert set(_hits(_search(client, q="relatorio"))) == {("message", 1)}
+
+    db = session_factory()
+    assert db.scalar(select(func.count()).select_from(SearchDocument).where(SearchDocument.card_id == 2)) == 0
+    db.close()
+
+
+def test_pagination_and_validation(client):
+    first = _search(client, q="relatorio", limit=3)
+    assert len(first["results"]) == 3 and first["next_offset"] == 3
+    second = _search(client, q="relatorio", limit=3, offset=3)
+    assert second["next_offset"] is None
+    assert len(set(_hits(first)) | set(_hits(second))) == 4
+
+    assert client.get("/api/search", params={"q": "?!"}, headers=auth_headers()).status_code == 400
+    assert client.get("/api/search", params={"q": "a", "types": "tags"}, headers=auth_headers()).status_code == 400
@@ -0,0 +1,60 @@
+"""
+Testes do cache de usuários autenticados (app/core/user_cache.py)
+
+- get_current_user serve o snapshot do cache sem consultar o banco
+- update_user / update_user_role / deactivate_user / activate_user descartam
+  o snapshot: a requisição seguinte já vê o usuário alterado
+"""
+from app.core.user_cache import user_cache
+from app.models.user import User, UserRole, UserStatus
+from app.schemas.user import UserUpdateRequest
+from app.services.user_service import UserService
+from conftest import auth_headers
+
+
+def seed(db) -> None:
+    db.add_all([
+        User(id=1, name="Admin", email="admin@test.com", password_hash="x", role=UserRole.ADMIN),
+        User(id=2, name="Ana", email="ana@test.com", password_hash="x", role=UserRole.USER),
+    ])
+
+
+def _request(client):
+    """Requisição autenticada da Ana (get_current_user, modo com cache)"""
+    return client.get("/api/projects", headers=auth_headers(2))
+
+
+def test_cached_user_skips_database(client, db):
+    assert _request(client).status_code == 200
+    assert user_cache.get(2).name == "Ana"
+
+    # Alteração direta no banco (sem o serviço): o snapshot em cache continua valendo
+    db.query(User).filter(User.id == 2).update({User.name: "Fora do serviço"})
+    db.commit()
+    assert _request(client).status_code == 200
+    assert user_cache.get(2).name == "Ana"
+
+
+def test_user_service_changes_invalidate_cache(client, db):
+    service = UserService(db)
+    assert _request(client).status_code == 200
+
+    service.update_user(2, UserUpdateRequest(name="Ana Maria"), 2, UserRole.USER.value)
+    assert user_cache.get(2) is None
+    assert _request(client).status_code == 200
+    assert user_cache.get(2).name == "Ana Maria"
+
+    service.update_user_role(2, UserRole.ADMIN.value, 1, UserRole.ADMIN.value)
+    assert user_cache.get(2) is None
+    assert _request(client).status_code == 200
+    assert user_cache.get(2).role == UserRole.ADMIN
+
+    service.deactivate_user(2, 1, UserRole.ADMIN.value)
+    assert user_cache.get(2) is None
+    assert _request(client).status_code == 401
+    assert user_cache.get(2).status == UserStatus.INACTIVE
+
+    service.activate_user(2, UserRole.ADMIN.value)
+    assert user_cache.get(2) is None
+    assert _request(client).status_code == 200
+    assert user_cache.get(2).status == UserStatus.ACTIVE
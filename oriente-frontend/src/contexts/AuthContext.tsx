@@ -43,6 +43,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     const logout = () => {
         console.log("[AuthContext] ✓ Logout realizado - removendo token");
         localStorage.removeItem("auth_token");
+        localStorage.removeItem("refresh_token");
         setToken(null);
     };
 
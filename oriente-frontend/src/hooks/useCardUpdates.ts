@@ -1,4 +1,6 @@
 import { useEffect, useRef, useCallback } from 'react';
+import type { BoardChanges } from '../types';
+import projectService from '../services/projectService';
 
 interface CardUpdateEvent {
   type: 'card_moved' | 'card_updated' | 'card_created' | 'card_deleted' | 'connected' | 'error';
@@ -13,6 +15,12 @@ interface UseCardUpdatesOptions {
   onCardDeleted?: (data: any) => void;
   onError?: (error: string) => void;
   enabled?: boolean;
+  /** Versão do board carregado (campo version de getProjectBoard/getBoardChanges) */
+  boardVersion?: number | null;
+  /** Alterações desde boardVersion, buscadas na reconexão e a cada evento de card */
+  onBoardChanges?: (changes: BoardChanges) => void;
+  /** Chamado quando as alterações não cobrem o intervalo (full_reload) ou falham */
+  onFullReload?: () => void;
 }
 
 /**
@@ -27,6 +35,10 @@ interface UseCardUpdatesOptions {
  *   enabled: true
  * });
  * ```
+ *
+ * Com onBoardChanges, o board é sincronizado de forma incremental
+ * (GET /board/changes?since=boardVersion) ao reconectar e a cada evento de
+ * card, em vez de recarregar o board inteiro; onFullReload é o fallback.
  */
 export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
   const {
@@ -36,7 +48,10 @@ export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
     onCardCreated,
     onCardDeleted,
     onError,
-    enabled = true
+    enabled = true,
+    boardVersion,
+    onBoardChanges,
+    onFullReload
   } = options;
 
   const wsRef = useRef<WebSocket | null>(null);
@@ -44,11 +59,46 @@ export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const heartbeatTimeoutRef = useRef<ReturnType<typeof setInterval> | null>(null);
   const isConnectingRef = useRef(false);
+  const hasConnectedRef = useRef(false);
+  const boardVersionRef = useRef<number | null>(boardVersion ?? null);
+
+  useEffect(() => {
+    boardVersionRef.current = boardVersion ?? null;
+  }, [boardVersion]);
 
   const MAX_RECONNECT_ATTEMPTS = 5;
   const RECONNECT_DELAY = 3000; // 3 segundos
   const HEARTBEAT_INTERVAL = 30000; // 30 segundos
 
+  const syncBoard = useCallback(async () => {
+    if (!projectId || !onBoardChanges) {
+      return;
+    }
+
+    // Board ainda carregando: a carga em andamento já traz o estado atual
+    const since = boardVersionRef.current;
+    if (since === null) {
+      return;
+    }
+
+    try {
+      const changes = await projectService.getBoardChanges(projectId, since);
+      if (changes.full_reload) {
+        onFullReload?.();
+        return;
+      }
+      // Ignora respostas atrasadas (outra sincronização já aplicou uma versão mais nova)
+      if (boardVersionRef.current !== null && changes.version < boardVersionRef.current) {
+        return;
+      }
+      boardVersionRef.current = changes.version;
+      onBoardChanges(changes);
+    } catch (error) {
+      console.error('Erro ao sincronizar alterações do board:', error);
+      onFullReload?.();
+    }
+  }, [projectId, onBoardChanges, onFullReload]);
+
   const connect = useCallback(() => {
     if (!enabled || !projectId || isConnectingRef.current || wsRef.current?.readyState === WebSocket.OPEN) {
       return;
@@ -83,6 +133,12 @@ export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
         reconnectAttemptRef.current = 0;
         isConnectingRef.current = false;
 
+        // Reconexão: buscar só o que mudou enquanto estava desconectado
+        if (hasConnectedRef.current) {
+          syncBoard();
+        }
+        hasConnectedRef.current = true;
+
         // Iniciar heartbeat
         setupHeartbeat();
       };
@@ -98,18 +154,22 @@ export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
 
             case 'card_moved':
               onCardMoved?.(message.data);
+              syncBoard();
               break;
 
             case 'card_updated':
               onCardUpdated?.(message.data);
+              syncBoard();
               break;
 
             case 'card_created':
               onCardCreated?.(message.data);
+              syncBoard();
               break;
 
             case 'card_deleted':
               onCardDeleted?.(message.data);
+              syncBoard();
               break;
 
             case 'error':
@@ -152,7 +212,7 @@ export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
       isConnectingRef.current = false;
       onError?.('Falha ao conectar ao WebSocket');
     }
-  }, [projectId, enabled, onCardMoved, onCardUpdated, onCardCreated, onCardDeleted, onError]);
+  }, [projectId, enabled, onCardMoved, onCardUpdated, onCardCreated, onCardDeleted, onError, syncBoard]);
 
   const disconnect = useCallback(() => {
     if (wsRef.current) {
@@ -191,6 +251,7 @@ export const useCardUpdates = (options: UseCardUpdatesOptions = {}) => {
 
     return () => {
       disconnect();
+      hasConnectedRef.current = false;
     };
   }, [enabled, projectId, connect, disconnect]);
 
@@ -23,10 +23,33 @@ type TaskWithProject = TaskData & {
     project_name: string;
 };
 
+type DashboardColumn = {
+    id: number;
+    title: string;
+    position: number;
+    stage: "pending" | "in_progress" | "completed";
+    card_count: number;
+};
+
+type DashboardData = {
+    version: string;
+    unchanged: boolean;
+    due_soon_days?: number;
+    projects?: Array<{
+        id: number;
+        name: string;
+        columns: DashboardColumn[];
+        overdue_count: number;
+        due_soon_count: number;
+    }>;
+    assigned_cards?: TaskWithProject[];
+};
+
 export default function Dashboard() {
     const navigate = useNavigate();
     const abortControllerRef = useRef<AbortController | null>(null);
     const pollingIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+    const dashboardVersionRef = useRef<string | null>(null);
 
     const [userData, setUserData] = useState<UserData | null>(null);
     const [statusCounts, setStatusCounts] = useState({ pendente: 0, andamento: 0, concluido: 0 });
@@ -195,15 +218,19 @@ export default function Dashboard() {
         abortControllerRef.current = new AbortController();
 
         try {
-            // Buscar projetos do usuário
-            const projectsResponse = await api.get("/api/projects", {
+            // Uma única requisição agregada; com a versão anterior o backend
+            // responde só { unchanged: true } quando nada mudou
+            const response = await api.get<DashboardData>("/api/dashboard", {
+                params: dashboardVersionRef.current ? { version: dashboardVersionRef.current } : undefined,
                 signal: abortControllerRef.current.signal
             });
-            const projects = Array.isArray(projectsResponse.data)
-                ? projectsResponse.data
-                : projectsResponse.data?.data || [];
+            const dashboard = response.data;
 
-            // Mapa para armazenar os column_ids especiais de cada projeto
+            if (dashboard.unchanged) {
+                return; // Mantém os dados já exibidos
+            }
+
+            // Colunas especiais de cada projeto: primeira = pendente, última = concluído, as do meio = em andamento
             const columnIdsMap: {
                 [projectId: number]: {
                     pending: number | null;
@@ -212,95 +239,16 @@ export default function Dashboard() {
                 }
             } = {};
 
-            // Buscar colunas de cada projeto para identificar "Pendente", "Em Andamento" e "Concluído"
-            for (const project of projects) {
-                try {
-                    const columnsResponse = await api.get(`/api/projects/${project.id}/columns`, {
-                        signal: abortControllerRef.current.signal
-                    });
-                    const columns = columnsResponse.data?.columns || columnsResponse.data || [];
-
-                    let pendingColumnId: number | null = null;
-                    let inProgressColumnIds: number[] = [];
-                    let completedColumnId: number | null = null;
-
-                    if (Array.isArray(columns) && columns.length > 0) {
-                        // Log de todas as colunas para debug
-                        console.log(`Colunas do projeto ${project.name}:`, columns);
-
-                        // Lógica: primeira coluna = pendente, última = concluído, as do meio = em andamento
-                        pendingColumnId = columns[0].id;
-                        completedColumnId = columns[columns.length - 1].id;
-
-                        // Colunas do meio são "em andamento"
-                        if (columns.length > 2) {
-                            inProgressColumnIds = columns.slice(1, columns.length - 1).map((col: any) => col.id);
-                        }
-
-                        console.log(`Projeto ${project.name}: Pendente=${pendingColumnId}, Em Andamento=${inProgressColumnIds}, Concluído=${completedColumnId}`);
-                    }
-
-                    columnIdsMap[project.id] = {
-                        pending: pendingColumnId,
-                        inProgress: inProgressColumnIds,
-                        completed: completedColumnId
-                    };
-                } catch (error) {
-                    // Se falhar, não ter colunas especiais
-                    columnIdsMap[project.id] = {
-                        pending: null,
-                        inProgress: [],
-                        completed: null
-                    };
-                }
-            }
-
-            // Buscar todas as tarefas do usuário em todos os projetos
-            const allTasks: TaskWithProject[] = [];
-            const userTasks: TaskWithProject[] = []; // Apenas tarefas atribuídas ao usuário
-
-            for (const project of projects) {
-                try {
-                    // Buscar tarefas do projeto
-                    const tasksResponse = await api.get(`/api/projects/${project.id}/cards`, {
-                        signal: abortControllerRef.current.signal
-                    });
-                    let tasks = tasksResponse.data?.cards || tasksResponse.data || [];
-
-                    if (Array.isArray(tasks)) {
-                        // DEBUG: Log dos campos da primeira tarefa
-                        if (tasks.length > 0) {
-                            console.log(`DEBUG: Primeira tarefa do projeto ${project.name}:`, tasks[0]);
-                        }
-
-                        // TODAS as tarefas com projeto info (para listar)
-                        const tasksWithProject = tasks.map((t: any) => ({
-                            ...t,
-                            project_name: project.name,
-                            project_id: project.id
-                        }));
-                        allTasks.push(...tasksWithProject);
-
-                        // APENAS tarefas atribuídas ao usuário (para contadores)
-                        const userAssignedTasks = tasksWithProject.filter((task: any) => {
-                            if (!task.assignees || task.assignees.length === 0) return false;
-                            return task.assignees.some((assignee: any) =>
-                                assignee.email === userData?.email || assignee.id === userData?.id
-                            );
-                        });
-                        userTasks.push(...userAssignedTasks);
-                    }
-                } catch (error) {
-                    // Ignorar erro de AbortController e erros de cancelamento
-                    if ((error as any).name !== 'AbortError' && (error as any).code !== 'ERR_CANCELED') {
-                        console.error(`Erro ao buscar tarefas do projeto ${project.id}:`, error);
-                    }
-                }
+            for (const project of dashboard.projects || []) {
+                columnIdsMap[project.id] = {
+                    pending: project.columns.find((col) => col.stage === "pending")?.id ?? null,
+                    inProgress: project.columns.filter((col) => col.stage === "in_progress").map((col) => col.id),
+                    completed: project.columns.find((col) => col.stage === "completed")?.id ?? null
+                };
             }
 
-            console.log("Todas as tarefas (para listar):", allTasks);
-            console.log("Tarefas do usuário (para contadores):", userTasks);
-            console.log("Mapa de colunas:", columnIdsMap);
+            // Apenas tarefas atribuídas ao usuário (já vêm com o nome do projeto)
+            const userTasks: TaskWithProject[] = dashboard.assigned_cards || [];
 
             // Processar dados para gráficos (usando apenas tarefas do usuário)
             processTasks(userTasks, columnIdsMap);
@@ -310,6 +258,7 @@ export default function Dashboard() {
                 .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
                 .slice(0, 5);
             setRecentTasks(recentListUser);
+            dashboardVersionRef.current = dashboard.version;
         } catch (error) {
             // Ignorar erro de AbortController e erros de cancelamento
             if ((error as any).name !== 'AbortError' && (error as any).code !== 'ERR_CANCELED') {
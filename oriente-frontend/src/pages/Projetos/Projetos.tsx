@@ -58,6 +58,7 @@ import QuickAssigneeDialog from "../../components/Tarefas/QuickAssigneeDialog";
 import QuickDateDialog from "../../components/Tarefas/QuickDateDialog";
 import Opcoes from "../../components/Tarefas/Opcoes";
 import type {
+    BoardChanges,
     Card as CardType,
     KanbanColumn,
     ProjectSummary,
@@ -67,6 +68,8 @@ import { CardPriority } from "@/types";
 import projectService from "../../services/projectService";
 import cardService from "../../services/cardService";
 import { useCardColumnActions } from "../../hooks/useCardColumnActions";
+import { useCardUpdates } from "../../hooks/useCardUpdates";
+import { applyBoardChanges } from "../../utils/boardChanges";
 
 const getPriorityColor = (priority: CardPriority) => {
     switch (priority) {
@@ -305,6 +308,9 @@ export default function Projects() {
     const [loadingProjects, setLoadingProjects] = useState(true);
     const [loadingBoard, setLoadingBoard] = useState(false);
 
+    // Versão do board carregado (ponto de partida para board/changes?since=)
+    const [boardVersion, setBoardVersion] = useState<number | null>(null);
+
     console.log("[Projetos] ===== COMPONENT RENDERED =====");
     console.log("[Projetos] URL pathname:", location.pathname);
     console.log("[Projetos] URL projectId:", projectId);
@@ -490,8 +496,10 @@ export default function Projects() {
     const loadProjectBoard = async (projectId: number) => {
         try {
             setLoadingBoard(true);
+            setBoardVersion(null);
             const board = await projectService.getProjectBoard(projectId);
             setColumns(board.board);
+            setBoardVersion(board.version);
         } catch (error) {
             setSnackbar({
                 open: true,
@@ -503,6 +511,27 @@ export default function Projects() {
         }
     };
 
+    // Atualizações em tempo real: aplica só as alterações desde a versão carregada
+    const handleBoardChanges = useCallback((changes: BoardChanges) => {
+        if (!selectedProject) return;
+        setColumns((prevColumns) => applyBoardChanges(prevColumns, changes, selectedProject.id));
+        setBoardVersion(changes.version);
+    }, [selectedProject]);
+
+    const handleFullReload = useCallback(() => {
+        if (selectedProject) {
+            loadProjectBoard(selectedProject.id);
+        }
+    }, [selectedProject]); // eslint-disable-line react-hooks/exhaustive-deps
+
+    useCardUpdates({
+        projectId: selectedProject?.id,
+        enabled: !!selectedProject,
+        boardVersion,
+        onBoardChanges: handleBoardChanges,
+        onFullReload: handleFullReload,
+    });
+
     const handleOpenMenu = (event: React.MouseEvent<HTMLElement>) => {
         setAnchorEl(event.currentTarget);
     };
@@ -1,4 +1,5 @@
 import axios from "axios";
+import type { AxiosRequestConfig } from "axios";
 
 // Cria instância do Axios com configurações base
 const api = axios.create({
@@ -30,14 +31,53 @@ api.interceptors.request.use(
     }
 );
 
+// Renovação do access token (backend com AUTH_STATELESS devolve refresh_token no login)
+// Requisições que recebem 401 em paralelo compartilham a mesma renovação
+let refreshPromise: Promise<string | null> | null = null;
+
+async function refreshAccessToken(): Promise<string | null> {
+    const refreshToken = localStorage.getItem("refresh_token");
+    if (!refreshToken) return null;
+
+    try {
+        const response = await axios.post(`${api.defaults.baseURL}/api/auth/refresh`, {
+            refresh_token: refreshToken,
+        });
+        const { token, refresh_token } = response.data.data;
+        localStorage.setItem("auth_token", token);
+        if (refresh_token) {
+            localStorage.setItem("refresh_token", refresh_token);
+        }
+        return token;
+    } catch {
+        return null;
+    }
+}
+
 // Interceptor para tratar respostas de erro
 api.interceptors.response.use(
     (response) => response,
-    (error) => {
+    async (error) => {
+        const originalRequest = error.config as (AxiosRequestConfig & { _retry?: boolean }) | undefined;
+
+        // Access token expirado/revogado: tenta renovar uma vez antes de deslogar
+        if (error.response?.status === 401 && originalRequest && !originalRequest._retry && localStorage.getItem("refresh_token")) {
+            originalRequest._retry = true;
+            refreshPromise = refreshPromise ?? refreshAccessToken().finally(() => {
+                refreshPromise = null;
+            });
+            const newToken = await refreshPromise;
+            if (newToken) {
+                originalRequest.headers = { ...originalRequest.headers, Authorization: `Bearer ${newToken}` };
+                return api(originalRequest);
+            }
+        }
+
         // Se receber 401 (Unauthorized), limpa o token e redireciona para login
         if (error.response?.status === 401) {
             console.log("[API Interceptor] 401 Unauthorized - Limpando token e redirecionando");
             localStorage.removeItem("auth_token");
+            localStorage.removeItem("refresh_token");
 
             // Redireciona para raiz (/) em vez de /login para evitar loops
             // O RedirectIfAuth vai detectar que não está autenticado e mostrar o login
@@ -8,6 +8,7 @@ export interface LoginCredentials {
 export interface LoginResponse {
     token: string;
     type: string;
+    refresh_token?: string | null;
     user: {
         id: number;
         name: string;
@@ -48,6 +49,12 @@ class AuthService {
             "/api/auth/login",
             credentials
         );
+        // Backend em modo stateless: guardar refresh token para renovar o access token curto
+        if (response.data.data.refresh_token) {
+            localStorage.setItem("refresh_token", response.data.data.refresh_token);
+        } else {
+            localStorage.removeItem("refresh_token");
+        }
         return response.data.data.token;
     }
 
@@ -75,6 +82,7 @@ class AuthService {
      */
     logout(): void {
         localStorage.removeItem("auth_token");
+        localStorage.removeItem("refresh_token");
     }
 }
 
@@ -8,6 +8,8 @@ import type {
     CardUpdateRequest,
     CardStatusUpdateRequest,
     CardMoveRequest,
+    CardBatchOperation,
+    CardBatchResponse,
 } from "../types";
 
 /**
@@ -193,6 +195,24 @@ const cardService = {
         );
         return response.data;
     },
+
+    /**
+     * Aplica várias operações (criar, atualizar, mover, arquivar) numa única requisição
+     * Usado pelas ações em seleção múltipla; operações inválidas voltam com success=false
+     * @param projectId - ID do projeto
+     * @param operations - Operações, aplicadas em ordem
+     * @returns Resultado de cada operação
+     */
+    async batchCards(
+        projectId: number,
+        operations: CardBatchOperation[]
+    ): Promise<CardBatchResponse> {
+        const response = await api.post<CardBatchResponse>(
+            `/api/projects/${projectId}/cards/batch`,
+            { operations }
+        );
+        return response.data;
+    },
 };
 
 export default cardService;
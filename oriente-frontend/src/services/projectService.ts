@@ -5,6 +5,7 @@ import type {
     ProjectCreateRequest,
     ProjectUpdateRequest,
     ProjectBoard,
+    BoardChanges,
     KanbanColumn,
     ColumnCreateRequest,
     ColumnUpdateRequest,
@@ -94,6 +95,20 @@ const projectService = {
         return response.data;
     },
 
+    /**
+     * Busca as alterações do board desde uma versão conhecida
+     * @param projectId - ID do projeto
+     * @param since - Versão do board já carregada (campo version)
+     * @returns Colunas alteradas, cards das colunas afetadas e ids removidos; se full_reload, recarregar o board
+     */
+    async getBoardChanges(projectId: number, since: number): Promise<BoardChanges> {
+        const response = await api.get<BoardChanges>(
+            `/api/projects/${projectId}/board/changes`,
+            { params: { since } }
+        );
+        return response.data;
+    },
+
     // ========================================
     // COLUNAS
     // ========================================
@@ -347,6 +347,27 @@ export interface CardUpdateRequest {
     assignee_ids?: number[];
 }
 
+export type CardBatchOperation =
+    | { op: "create"; card: CardCreateRequest & { position?: number } }
+    | { op: "update"; card_id: number; changes: CardUpdateRequest }
+    | { op: "move"; card_id: number; move: CardMoveRequest }
+    | { op: "archive"; card_id: number };
+
+export interface CardBatchItemResult {
+    index: number;
+    op: CardBatchOperation["op"];
+    success: boolean;
+    card_id?: number;
+    error?: string;
+    card?: Card;
+}
+
+export interface CardBatchResponse {
+    results: CardBatchItemResult[];
+    succeeded: number;
+    failed: number;
+}
+
 export interface CardStatusUpdateRequest {
     status: "PENDING" | "IN_PROGRESS" | "COMPLETED";
 }
@@ -354,6 +375,18 @@ export interface CardStatusUpdateRequest {
 export interface ProjectBoard {
     board: KanbanColumn[];
     total_columns: number;
+    version: number;
+}
+
+export interface BoardChanges {
+    version: number;
+    since: number;
+    full_reload: boolean;
+    columns: Omit<KanbanColumn, "cards" | "project_id">[];
+    deleted_column_ids: number[];
+    card_column_ids: number[];
+    cards: (Card & { column_id: number })[];
+    deleted_card_ids: number[];
 }
 
 // ========================================
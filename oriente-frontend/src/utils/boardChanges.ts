@@ -0,0 +1,60 @@
+/**
+ * Aplica a resposta de GET /api/projects/:projectId/board/changes?since= ao board carregado
+ * Evita recarregar o board inteiro a cada reconexão/evento do WebSocket
+ */
+
+import type { BoardChanges, Card, KanbanColumn } from "../types";
+
+/**
+ * Retorna as colunas com as alterações aplicadas (sem modificar as originais)
+ *
+ * - Colunas em `card_column_ids` têm a lista de cards substituída pela do servidor
+ *   (já com as posições dos vizinhos atualizadas)
+ * - Nas demais, os cards que aparecem na resposta (movidos para outra coluna)
+ *   ou removidos saem da lista e as posições são renumeradas
+ *
+ * @param columns - Colunas atuais do board
+ * @param changes - Resposta de board/changes (sem full_reload)
+ * @param projectId - Projeto do board (para colunas novas)
+ */
+export function applyBoardChanges(
+  columns: KanbanColumn[],
+  changes: BoardChanges,
+  projectId: number
+): KanbanColumn[] {
+  const deletedColumns = new Set(changes.deleted_column_ids);
+  const changedColumns = new Map(changes.columns.map((column) => [column.id, column]));
+  const replacedColumns = new Set(changes.card_column_ids);
+  const touchedCards = new Set([
+    ...changes.deleted_card_ids,
+    ...changes.cards.map((card) => card.id),
+  ]);
+
+  const cardsByColumn = new Map<number, Card[]>();
+  for (const card of changes.cards) {
+    const cards = cardsByColumn.get(card.column_id) ?? [];
+    cards.push(card);
+    cardsByColumn.set(card.column_id, cards);
+  }
+
+  const result = columns
+    .filter((column) => !deletedColumns.has(column.id))
+    .map((column) => {
+      const cards = replacedColumns.has(column.id)
+        ? cardsByColumn.get(column.id) ?? []
+        : column.cards
+            .filter((card) => !touchedCards.has(card.id))
+            .map((card, position) => ({ ...card, position }));
+      return { ...column, ...changedColumns.get(column.id), cards };
+    });
+
+  // Colunas criadas depois da versão carregada
+  const existing = new Set(result.map((column) => column.id));
+  for (const column of changes.columns) {
+    if (!existing.has(column.id)) {
+      result.push({ ...column, project_id: projectId, cards: cardsByColumn.get(column.id) ?? [] });
+    }
+  }
+
+  return result.sort((a, b) => a.position - b.position || a.id - b.id);
+}